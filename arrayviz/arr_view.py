@@ -42,7 +42,7 @@ class ArrayView(BaseStructureView):
     # ---------- Public API ----------
 
     def reset(self):
-        self.scene.clear()
+        self.clear_scene()
         self.cells.clear()
         self.order.clear()
         self.index_labels.clear()
@@ -0,0 +1,77 @@
+from typing import List, Optional, Tuple
+
+from bst.balanced_model import BalancedBSTModel
+
+
+class AVLModel(BalancedBSTModel):
+    """
+    AVL 树：每个节点记录子树高度（叶子为 1），任一节点左右子树高度差不超过 1。
+    insert / delete 与 BSTModel 返回相同的 (node_id, path)，旋转记录在 ``rotations``。
+    """
+
+    _EXTRA_FIELDS = ("height",)
+
+    def _make_node(self, value):
+        node = super()._make_node(value)
+        node["height"] = 1
+        return node
+
+    # ---------- 插入 / 删除 ----------
+
+    def _insert(self, value) -> Tuple[int, List[int]]:
+        node_id, path, direction = self._attach_leaf(value)
+        if direction is not None:
+            self._retrace(path)
+        return node_id, path
+
+    def _delete(self, value) -> Tuple[Optional[int], List[int]]:
+        removed_id, path, _removed, chain, _x_id, _succ_id = self._splice_out(value)
+        if removed_id is not None:
+            self._retrace(chain)
+        return removed_id, path
+
+    def _retrace(self, chain: List[int]):
+        """自下而上更新高度，并在失衡处旋转。chain 为自根向下的祖先链。"""
+        for idx in range(len(chain) - 1, -1, -1):
+            node_id = chain[idx]
+            parent_id = chain[idx - 1] if idx > 0 else None
+            self._update_height(node_id)
+            self._rebalance(node_id, parent_id)
+
+    def _rebalance(self, node_id: int, parent_id: Optional[int]) -> int:
+        nodes = self._nodes
+        node = nodes[node_id]
+        balance = self._balance(node)
+        if balance > 1:
+            if self._balance(nodes[node["left"]]) < 0:
+                self._rotate_left(node["left"], node_id)
+            return self._rotate_right(node_id, parent_id)
+        if balance < -1:
+            if self._balance(nodes[node["right"]]) > 0:
+                self._rotate_right(node["right"], node_id)
+            return self._rotate_left(node_id, parent_id)
+        return node_id
+
+    # ---------- 高度维护 ----------
+
+    def _height_of(self, node_id: Optional[int]) -> int:
+        return self._nodes[node_id]["height"] if node_id is not None else 0
+
+    def _balance(self, node) -> int:
+        return self._height_of(node["left"]) - self._height_of(node["right"])
+
+    def _update_height(self, node_id: int):
+        node = self._nodes[node_id]
+        node["height"] = 1 + max(self._height_of(node["left"]), self._height_of(node["right"]))
+
+    def _on_rotate(self, lower_id: int, upper_id: int):
+        self._update_height(lower_id)
+        self._update_height(upper_id)
+
+    def _assign_balance_info(self):
+        for node_id in reversed(self._preorder_ids()):
+            self._update_height(node_id)
+
+    def _restore_balance_info(self, snapshot) -> bool:
+        self._assign_balance_info()
+        return all(abs(self._balance(node)) <= 1 for node in self._nodes.values())
@@ -0,0 +1,141 @@
+from PyQt5.QtWidgets import QComboBox, QGroupBox, QLabel, QLineEdit, QMessageBox, QPushButton, QVBoxLayout
+
+from bst.avl_model import AVLModel
+from bst.balanced_view import BalancedTreeView
+from bst.bst_ctrl import BSTController
+from bst.rb_model import RedBlackModel
+from bst.splay_model import SplayModel
+from bst.treap_model import TreapModel
+from bst.workload import WORKLOAD_KINDS, generate_workload, run_trace
+
+
+class BalancedTreeController(BSTController):
+    """
+    平衡树控制器：沿用 BST 面板，额外显示与普通 BST 的比较次数对照，
+    并可在同一条访问轨迹（均匀 / Zipf / 顺序）上批量查找，比较平均路径长度。
+    """
+
+    model_class = AVLModel
+    structure_key = "avl"
+    display_name = "AVL"
+
+    BASELINE_NAME = "普通 BST"
+
+    _workload_summary = ""
+
+    def _create_model(self):
+        model = self.model_class()
+        model.enable_baseline()
+        return model
+
+    def _create_view(self, global_ctrl):
+        return BalancedTreeView(global_ctrl)
+
+    def _create_panel(self):
+        container = super()._create_panel()
+        layout = container.layout()
+
+        stats_group = QGroupBox("Comparisons")
+        stats_group.setStyleSheet("QGroupBox { color: white; }")
+        stats_layout = QVBoxLayout(stats_group)
+        stats_layout.setContentsMargins(12, 8, 12, 12)
+        self.stats_label = QLabel()
+        self.stats_label.setStyleSheet("color: white;")
+        stats_layout.addWidget(self.stats_label)
+
+        self.workload_combo = QComboBox()
+        for kind in WORKLOAD_KINDS:
+            self.workload_combo.addItem(kind.capitalize(), kind)
+        self.workload_count_edit = QLineEdit("1000")
+        self.workload_count_edit.setPlaceholderText("Lookups")
+        self.workload_btn = QPushButton("Run Workload")
+        self.workload_btn.clicked.connect(self._on_run_workload)
+        stats_layout.addWidget(
+            self._inline_row(self.workload_combo, self.workload_count_edit, self.workload_btn)
+        )
+
+        layout.addWidget(stats_group, 4, 0, 1, 2)
+        layout.setRowStretch(4, 0)
+        layout.setRowStretch(5, 1)
+        return container
+
+    def _on_find(self):
+        super()._on_find()
+        self._refresh_stats()
+
+    def _on_run_workload(self):
+        if self.model.length == 0:
+            return
+        raw = self.workload_count_edit.text().strip()
+        try:
+            count = int(raw)
+        except ValueError:
+            count = 0
+        if count <= 0:
+            QMessageBox.warning(self, "Invalid Value", "查找次数必须是正整数。")
+            return
+        kind = self.workload_combo.currentData()
+        keys = [self.model.value_of(node_id) for node_id in self.model.iter_inorder()]
+        baseline = self.model.baseline
+        models = {self.display_name: self.model}
+        if baseline is not None:
+            models[self.BASELINE_NAME] = baseline
+        # 对照 BST 直接交给 run_trace，期间摘下镜像，避免模型内部再对它查找一次
+        self.model.baseline = None
+        try:
+            averages = run_trace(models, generate_workload(kind, keys, count))
+        finally:
+            self.model.baseline = baseline
+        self.model.rotations = []
+        rounds = "，".join(f"{name} {average:.2f}" for name, average in averages.items())
+        self._workload_summary = f"{self.workload_combo.currentText()} × {count}：本轮平均路径 {rounds}"
+        self.view.animate_build(self.model.snapshot(), speed_scale=5)
+        self._refresh_inputs()
+
+    def _refresh_inputs(self):
+        super()._refresh_inputs()
+        self._refresh_stats()
+        disabled = self._panel_locked or self.model.length == 0
+        for widget in (self.workload_btn, self.workload_combo, self.workload_count_edit):
+            widget.setDisabled(disabled)
+
+    def _refresh_stats(self):
+        model = self.model
+        baseline = model.baseline
+        rows = [self._stats_row(self.display_name, model)]
+        if baseline is not None:
+            rows.append(self._stats_row(self.BASELINE_NAME, baseline))
+        if self._workload_summary:
+            rows.append(self._workload_summary)
+        self.stats_label.setText("\n".join(rows))
+
+    @staticmethod
+    def _stats_row(name, model):
+        return (
+            f"{name}: 累计 {model.comparisons}，本次 {model.last_path_length}，"
+            f"平均 {model.average_path_length:.2f}，树高 {model.height()}"
+        )
+
+
+class AVLController(BalancedTreeController):
+    model_class = AVLModel
+    structure_key = "avl"
+    display_name = "AVL"
+
+
+class RedBlackController(BalancedTreeController):
+    model_class = RedBlackModel
+    structure_key = "rbtree"
+    display_name = "Red-Black"
+
+
+class SplayController(BalancedTreeController):
+    model_class = SplayModel
+    structure_key = "splay"
+    display_name = "Splay"
+
+
+class TreapController(BalancedTreeController):
+    model_class = TreapModel
+    structure_key = "treap"
+    display_name = "Treap"
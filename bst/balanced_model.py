@@ -0,0 +1,272 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from bst.bst_model import BSTModel
+
+
+class BalancedBSTModel(BSTModel):
+    """
+    自平衡树模型的公共基类：提供带日志的旋转原语，以及可选的普通 BST 对照模型。
+
+    每次 insert / delete 后 ``rotations`` 依次记录：
+    - ``{"kind": "splice", ...}``：普通 BST 插入/摘除之后、再平衡之前的结构
+    - ``{"kind": "left" | "right", "pivot": x, "child": y, ...}``：一次旋转
+    每条记录带 ``links``（受影响节点旋转后的 left/right/value 及额外字段）与
+    ``root``，视图据此逐步回放。
+    """
+
+    def __init__(self):
+        super().__init__()
+        # 对照用的普通 BST：接收相同操作序列，用于比较搜索路径长度
+        self.baseline: Optional[BSTModel] = None
+
+    def enable_baseline(self, enabled: bool = True):
+        self.baseline = BSTModel() if enabled else None
+        if self.baseline is not None and self._nodes:
+            self.baseline.load_snapshot(self.snapshot())
+
+    # ---------- Public API ----------
+
+    def clear(self):
+        super().clear()
+        if getattr(self, "baseline", None) is not None:
+            self.baseline.clear()
+
+    def load_snapshot(self, snapshot):
+        super().load_snapshot(snapshot)
+        if self._root is not None and not self._restore_balance_info(snapshot):
+            self._rebalance_all()
+        if self.baseline is not None:
+            self.baseline.load_snapshot(snapshot)
+
+    def bulk_load_sorted(self, values):
+        super().bulk_load_sorted(values)
+        self._assign_balance_info()
+        if self.baseline is not None:
+            self.baseline.load_snapshot(self.snapshot())
+
+    def insert(self, value) -> Tuple[int, List[int]]:
+        self.rotations = []
+        if self.baseline is not None:
+            self.baseline.insert(value)
+        node_id, path = self._insert(value)
+        self._count_path(path)
+        return node_id, path
+
+    def delete(self, value) -> Tuple[Optional[int], List[int]]:
+        self.rotations = []
+        if self.baseline is not None:
+            self.baseline.delete(value)
+        node_id, path = self._delete(value)
+        self._count_path(path)
+        return node_id, path
+
+    def find(self, value) -> Tuple[Optional[int], List[int]]:
+        self.rotations = []
+        if self.baseline is not None:
+            self.baseline.find(value)
+        node_id, path = super().find(value)
+        self._after_find(node_id, path)
+        return node_id, path
+
+    # ---------- Subclass hooks ----------
+
+    def _insert(self, value) -> Tuple[int, List[int]]:
+        raise NotImplementedError
+
+    def _delete(self, value) -> Tuple[Optional[int], List[int]]:
+        raise NotImplementedError
+
+    def _after_find(self, node_id: Optional[int], path: List[int]):
+        """查找结束后的回调；需要随访问调整结构的树（如伸展树）在此旋转。"""
+
+    def _restore_balance_info(self, snapshot) -> bool:
+        """从快照恢复平衡信息；结构不满足平衡条件时返回 False。"""
+        return False
+
+    def _assign_balance_info(self):
+        """完全平衡重建之后，为各节点写入高度 / 颜色等平衡信息。"""
+
+    def _on_rotate(self, lower_id: int, upper_id: int):
+        """旋转后回调：lower 为被旋下去的节点，upper 为新的子树根。"""
+
+    # ---------- Rotations ----------
+
+    def _rotate_left(self, x_id: int, parent_id: Optional[int]) -> int:
+        nodes = self._nodes
+        x = nodes[x_id]
+        y_id = x["right"]
+        y = nodes[y_id]
+        x["right"] = y["left"]
+        y["left"] = x_id
+        self._replace_child(parent_id, x_id, y_id)
+        self._update_size(x_id)
+        self._update_size(y_id)
+        self._on_rotate(x_id, y_id)
+        self._log_step("left", (x_id, y_id, parent_id), pivot=x_id, child=y_id)
+        return y_id
+
+    def _rotate_right(self, x_id: int, parent_id: Optional[int]) -> int:
+        nodes = self._nodes
+        x = nodes[x_id]
+        y_id = x["left"]
+        y = nodes[y_id]
+        x["left"] = y["right"]
+        y["right"] = x_id
+        self._replace_child(parent_id, x_id, y_id)
+        self._update_size(x_id)
+        self._update_size(y_id)
+        self._on_rotate(x_id, y_id)
+        self._log_step("right", (x_id, y_id, parent_id), pivot=x_id, child=y_id)
+        return y_id
+
+    # ---------- Logging ----------
+
+    def _log_step(self, kind: str, node_ids: Iterable[Optional[int]], **extra):
+        links: Dict[int, Dict[str, Any]] = {}
+        for node_id in node_ids:
+            if node_id is None or node_id not in self._nodes:
+                continue
+            links[node_id] = self._export_node(self._nodes[node_id])
+        entry = {"kind": kind, "links": links, "root": self._root}
+        entry.update(extra)
+        self.rotations.append(entry)
+
+    # ---------- Helpers ----------
+
+    def _attach_leaf(self, value) -> Tuple[Optional[int], List[int], Optional[str]]:
+        """
+        普通 BST 下行：返回 (节点 id, 搜索路径, 挂接方向)。
+        值已存在时方向为 None，id 为已有节点。
+        """
+        path: List[int] = []
+        parent_id = None
+        direction = None
+        current_id = self._root
+        while current_id is not None:
+            path.append(current_id)
+            node = self._nodes[current_id]
+            if value == node["value"]:
+                return current_id, path, None
+            parent_id = current_id
+            direction = "left" if value < node["value"] else "right"
+            current_id = node[direction]
+
+        new_node = self._make_node(value)
+        if parent_id is None:
+            self._root = new_node["id"]
+            direction = "root"
+        else:
+            self._nodes[parent_id][direction] = new_node["id"]
+        self._grow_path(path)
+        self._log_step("splice", (new_node["id"], parent_id))
+        return new_node["id"], path, direction
+
+    def _splice_out(self, value):
+        """
+        普通 BST 摘除，不做再平衡。返回
+        (被删 id, 动画路径, 被删节点, 祖先链, 顶替位置的子节点 id, 后继 id)。
+        祖先链自根向下，末尾即为结构发生变化的最低节点（顶替子节点的父节点）。
+        """
+        nodes = self._nodes
+        path: List[int] = []
+        ancestors: List[int] = []
+        current_id = self._root
+        while current_id is not None:
+            path.append(current_id)
+            node = nodes[current_id]
+            if value == node["value"]:
+                break
+            ancestors.append(current_id)
+            current_id = node["left"] if value < node["value"] else node["right"]
+        else:
+            return None, path, None, [], None, None
+
+        node = nodes[current_id]
+        parent_id = ancestors[-1] if ancestors else None
+        succ_id = None
+
+        if node["left"] is None or node["right"] is None:
+            replacement = node["left"] if node["left"] is not None else node["right"]
+            self._replace_child(parent_id, current_id, replacement)
+            chain = ancestors
+            x_id = replacement
+            touched = [parent_id, replacement]
+        else:
+            # 右子树最左节点作为后继
+            succ_chain: List[int] = []
+            succ_id = node["right"]
+            path.append(succ_id)
+            while nodes[succ_id]["left"] is not None:
+                succ_chain.append(succ_id)
+                succ_id = nodes[succ_id]["left"]
+                path.append(succ_id)
+
+            successor = nodes[succ_id]
+            x_id = successor["right"]
+            if succ_chain:
+                nodes[succ_chain[-1]]["left"] = successor["right"]
+                successor["right"] = node["right"]
+            successor["left"] = node["left"]
+            self._replace_child(parent_id, current_id, succ_id)
+            chain = ancestors + [succ_id] + succ_chain
+            touched = [parent_id, succ_id] + succ_chain[-1:]
+
+        removed = nodes.pop(current_id)
+        self._update_sizes(chain)
+        self._log_step("splice", touched, removed=current_id)
+        return current_id, path, removed, chain, x_id, succ_id
+
+    def _rebalance_all(self):
+        """以中序序列原地重连为完全平衡树（保留节点 id）。"""
+        self._root = self._link_balanced(self._inorder_ids())
+        self._recompute_sizes()
+        self._assign_balance_info()
+
+    def _inorder_ids(self) -> List[int]:
+        ordered: List[int] = []
+        stack: List[int] = []
+        current = self._root
+        while stack or current is not None:
+            while current is not None:
+                stack.append(current)
+                current = self._nodes[current]["left"]
+            current = stack.pop()
+            ordered.append(current)
+            current = self._nodes[current]["right"]
+        return ordered
+
+    def _preorder_ids(self) -> List[int]:
+        ordered: List[int] = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node_id = stack.pop()
+            ordered.append(node_id)
+            node = self._nodes[node_id]
+            if node["right"] is not None:
+                stack.append(node["right"])
+            if node["left"] is not None:
+                stack.append(node["left"])
+        return ordered
+
+    def _link_balanced(self, ordered: List[int]) -> Optional[int]:
+        nodes = self._nodes
+        if not ordered:
+            return None
+        # (lo, hi, parent_id, direction) 区间栈，取中点为子树根
+        root_id = None
+        stack = [(0, len(ordered) - 1, None, None)]
+        while stack:
+            lo, hi, parent_id, direction = stack.pop()
+            if lo > hi:
+                if parent_id is not None:
+                    nodes[parent_id][direction] = None
+                continue
+            mid = (lo + hi + 1) // 2
+            node_id = ordered[mid]
+            if parent_id is None:
+                root_id = node_id
+            else:
+                nodes[parent_id][direction] = node_id
+            stack.append((lo, mid - 1, node_id, "left"))
+            stack.append((mid + 1, hi, node_id, "right"))
+        return root_id
@@ -0,0 +1,74 @@
+from PyQt5.QtCore import QRectF, Qt
+from PyQt5.QtGui import QBrush, QColor, QFont, QPen
+
+from bst.bst_view import BSTNodeItem, BSTViewWithPersistence
+
+
+class BalancedNodeItem(BSTNodeItem):
+    """
+    平衡树节点：右上角显示 AVL 高度 / Treap 优先级角标，红黑树节点按颜色填充。
+    """
+
+    RB_FILL = {
+        "red": QColor("#e53935"),
+        "black": QColor("#263238"),
+    }
+
+    def __init__(self, node_id, value):
+        super().__init__(node_id, value)
+        self._badge = ""
+
+    def set_badge(self, text: str):
+        if text != self._badge:
+            self._badge = text
+            self.update()
+
+    def set_rb_color(self, color: str):
+        fill = self.RB_FILL.get(color)
+        if fill is None:
+            return
+        self.setFillColor(fill)
+        self.textColor = QColor("#ffffff")
+        self.update()
+
+    def boundingRect(self):
+        # 角标略超出圆形范围
+        return QRectF(0, -12, self.width + 12, self.height + 12)
+
+    def paint(self, painter, option, widget=None):
+        painter.save()
+        painter.setRenderHint(painter.Antialiasing)
+        painter.setPen(QPen(self.strokeColor, 2))
+        painter.setBrush(QBrush(self.fillColor))
+        circle = QRectF(0, 0, self.width, self.height)
+        painter.drawEllipse(circle)
+        painter.setPen(self.textColor)
+        painter.drawText(circle, Qt.AlignCenter, self._value)
+
+        if self._badge:
+            badge_rect = QRectF(self.width - 18, -12, 30, 20)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor("#ffca28"))
+            painter.drawRoundedRect(badge_rect, 6, 6)
+            font = QFont(painter.font())
+            font.setPointSizeF(max(6.0, font.pointSizeF() * 0.8))
+            painter.setFont(font)
+            painter.setPen(QColor("#1f1f24"))
+            painter.drawText(badge_rect, Qt.AlignCenter, self._badge)
+        painter.restore()
+
+
+class BalancedTreeView(BSTViewWithPersistence):
+    """
+    AVL / 红黑树 / 伸展树 / Treap 视图：复用 BSTView 的插入、删除与旋转回放，只替换节点外观。
+    """
+
+    node_item_class = BalancedNodeItem
+
+    def _decorate_node(self, node_item, info):
+        if "height" in info:
+            node_item.set_badge(str(info["height"]))
+        if "priority" in info:
+            node_item.set_badge(str(info["priority"]))
+        if "color" in info:
+            node_item.set_rb_color(info["color"])
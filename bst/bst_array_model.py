@@ -0,0 +1,505 @@
+from array import array
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from bst.bst_model import BSTModel
+
+NIL = -1
+# 已释放槽位在 right 数组中的标记；空闲链表借用 left 数组串联
+FREE = -2
+
+
+class ArrayBSTModel:
+    """
+    结构数组（struct-of-arrays）存储的二叉搜索树，对外接口与 BSTModel 一致。
+
+    节点 id 即槽位下标，值、左右孩子、子树大小分别存放在并列的定长数组里，
+    每个节点约 20 字节；删除的槽位进入空闲链表，之后的插入优先复用。
+    值全为整数时使用 int64 存储，出现其他类型后退化为对象列表，不做有损转换。
+    """
+
+    TRAVERSAL_ORDERS = BSTModel.TRAVERSAL_ORDERS
+
+    def __init__(self):
+        self._values = array("q")
+        self._left = array("i")
+        self._right = array("i")
+        self._size = array("i")
+        self._root = NIL
+        self._free = NIL
+        self._count = 0
+        # 与 BSTModel 相同的统计字段
+        self.rotations: List[Dict[str, Any]] = []
+        self.comparisons = 0
+        self.operations = 0
+        self.last_path_length = 0
+
+    @property
+    def length(self) -> int:
+        return self._count
+
+    def clear(self):
+        self._values = array("q")
+        self._left = array("i")
+        self._right = array("i")
+        self._size = array("i")
+        self._root = NIL
+        self._free = NIL
+        self._count = 0
+        self.rotations = []
+        self.comparisons = 0
+        self.operations = 0
+        self.last_path_length = 0
+
+    def load_snapshot(self, snapshot):
+        self.clear()
+        nodes = snapshot.get("nodes", [])
+        if not nodes:
+            return
+        capacity = max(info["id"] for info in nodes) + 1
+        if all(self._is_int(info["value"]) for info in nodes):
+            self._values = array("q", bytes(8 * capacity))
+        else:
+            self._values = [None] * capacity
+        self._left = array("i", [NIL]) * capacity
+        self._right = array("i", [FREE]) * capacity
+        self._size = array("i", [1]) * capacity
+        for info in nodes:
+            slot = info["id"]
+            self._values[slot] = info["value"]
+            self._left[slot] = NIL if info["left"] is None else info["left"]
+            self._right[slot] = NIL if info["right"] is None else info["right"]
+        # 未使用的 id 串成空闲链表
+        for slot in range(capacity - 1, -1, -1):
+            if self._right[slot] == FREE:
+                self._left[slot] = self._free
+                self._free = slot
+        self._count = len(nodes)
+        root = snapshot.get("root")
+        self._root = root if root is not None and self._alive(root) else NIL
+        self._recompute_sizes()
+
+    def create_from_iterable(self, values):
+        self.bulk_load(values)
+
+    def bulk_load(self, values):
+        self.bulk_load_sorted(sorted(set(values)))
+
+    def bulk_load_sorted(self, values):
+        """与 BSTModel.bulk_load_sorted 相同：右斜链 + DSW 压缩，O(n)。"""
+        self.clear()
+        right = self._right
+        tail = NIL
+        previous = None
+        for value in values:
+            if tail != NIL:
+                if value == previous:
+                    continue
+                if value < previous:
+                    self.clear()
+                    raise ValueError("bulk_load_sorted requires non-decreasing input")
+            slot = self._alloc(value)
+            if tail == NIL:
+                self._root = slot
+            else:
+                right[tail] = slot
+            tail = slot
+            previous = value
+        self._vine_to_tree(self._count)
+        self._recompute_sizes()
+
+    def insert(self, value) -> Tuple[int, List[int]]:
+        values, left, right = self._values, self._left, self._right
+        path: List[int] = []
+        parent = NIL
+        go_left = False
+        current = self._root
+        while current != NIL:
+            path.append(current)
+            current_value = values[current]
+            if value == current_value:
+                self._count_path(path)
+                return current, path
+            parent = current
+            go_left = value < current_value
+            current = left[current] if go_left else right[current]
+
+        slot = self._alloc(value)
+        if parent == NIL:
+            self._root = slot
+        elif go_left:
+            left[parent] = slot
+        else:
+            right[parent] = slot
+        size = self._size
+        for node_id in path:
+            size[node_id] += 1
+        self._count_path(path)
+        return slot, path
+
+    def delete(self, value) -> Tuple[Optional[int], List[int]]:
+        values, left, right = self._values, self._left, self._right
+        path: List[int] = []
+        parent = NIL
+        current = self._root
+        while current != NIL:
+            path.append(current)
+            current_value = values[current]
+            if value == current_value:
+                break
+            parent = current
+            current = left[current] if value < current_value else right[current]
+        else:
+            self._count_path(path)
+            return None, path
+
+        self._count_path(path)
+        resize_chain = path[:-1]
+        if left[current] == NIL or right[current] == NIL:
+            replacement = left[current] if left[current] != NIL else right[current]
+            self._replace_child(parent, current, replacement)
+        else:
+            succ_parent = current
+            succ = right[current]
+            path.append(succ)
+            while left[succ] != NIL:
+                succ_parent = succ
+                succ = left[succ]
+                path.append(succ)
+            resize_chain = resize_chain + [succ] + path[len(resize_chain) + 1:-1]
+            if succ_parent != current:
+                left[succ_parent] = right[succ]
+                right[succ] = right[current]
+            left[succ] = left[current]
+            self._replace_child(parent, current, succ)
+
+        self._release(current)
+        size = self._size
+        for node_id in reversed(resize_chain):
+            size[node_id] = 1 + self._subtree_size(left[node_id]) + self._subtree_size(right[node_id])
+        return current, path
+
+    def find(self, value) -> Tuple[Optional[int], List[int]]:
+        values, left, right = self._values, self._left, self._right
+        path: List[int] = []
+        current = self._root
+        while current != NIL:
+            path.append(current)
+            current_value = values[current]
+            if value == current_value:
+                self._count_path(path)
+                return current, path
+            current = left[current] if value < current_value else right[current]
+        self._count_path(path)
+        return None, path
+
+    # ---------- 遍历 ----------
+
+    def traverse(self, order: str) -> Iterator[int]:
+        if order not in self.TRAVERSAL_ORDERS:
+            raise ValueError(f"unknown traversal order: {order}")
+        return getattr(self, f"iter_{order}")()
+
+    def iter_inorder(self) -> Iterator[int]:
+        left, right = self._left, self._right
+        stack: List[int] = []
+        current = self._root
+        while stack or current != NIL:
+            while current != NIL:
+                stack.append(current)
+                current = left[current]
+            current = stack.pop()
+            yield current
+            current = right[current]
+
+    def iter_preorder(self) -> Iterator[int]:
+        left, right = self._left, self._right
+        stack: List[int] = []
+        current = self._root
+        while stack or current != NIL:
+            while current != NIL:
+                yield current
+                if right[current] != NIL:
+                    stack.append(right[current])
+                current = left[current]
+            if stack:
+                current = stack.pop()
+
+    def iter_postorder(self) -> Iterator[int]:
+        left, right = self._left, self._right
+        stack: List[int] = []
+        last = NIL
+        current = self._root
+        while stack or current != NIL:
+            if current != NIL:
+                stack.append(current)
+                current = left[current]
+                continue
+            child = right[stack[-1]]
+            if child != NIL and child != last:
+                current = child
+            else:
+                last = stack.pop()
+                yield last
+
+    def iter_levelorder(self) -> Iterator[int]:
+        if self._root == NIL:
+            return
+        left, right = self._left, self._right
+        queue = deque([self._root])
+        while queue:
+            node_id = queue.popleft()
+            yield node_id
+            if left[node_id] != NIL:
+                queue.append(left[node_id])
+            if right[node_id] != NIL:
+                queue.append(right[node_id])
+
+    def iter_morris(self) -> Iterator[int]:
+        walk = self._morris_walk()
+        try:
+            for node_id in walk:
+                yield node_id
+        finally:
+            for _ in walk:
+                pass
+
+    # ---------- 顺序统计 / 区间查询 ----------
+
+    def select(self, k: int) -> Tuple[Optional[int], List[int]]:
+        left, right = self._left, self._right
+        path: List[int] = []
+        current = self._root
+        while current != NIL:
+            path.append(current)
+            left_size = self._subtree_size(left[current])
+            if k == left_size + 1:
+                self._count_path(path)
+                return current, path
+            if k <= left_size:
+                current = left[current]
+            else:
+                k -= left_size + 1
+                current = right[current]
+        self._count_path(path)
+        return None, path
+
+    def rank(self, value) -> Tuple[int, List[int]]:
+        count, path = self._count_less(value, inclusive=False)
+        self._count_path(path)
+        return count, path
+
+    def range_count(self, low, high) -> Tuple[int, List[int]]:
+        if high < low:
+            return 0, []
+        upper, upper_path = self._count_less(high, inclusive=True)
+        lower, lower_path = self._count_less(low, inclusive=False)
+        path = BSTModel._merge_paths(upper_path, lower_path)
+        self._count_path(path)
+        return upper - lower, path
+
+    def range_report(self, low, high) -> Tuple[List[int], List[int]]:
+        values, left, right = self._values, self._left, self._right
+        result: List[int] = []
+        path: List[int] = []
+        if high < low:
+            return result, path
+        stack: List[int] = []
+        current = self._root
+        while stack or current != NIL:
+            while current != NIL:
+                path.append(current)
+                if values[current] < low:
+                    current = right[current]
+                    continue
+                stack.append(current)
+                current = left[current]
+            if not stack:
+                break
+            node_id = stack.pop()
+            if values[node_id] > high:
+                break
+            result.append(node_id)
+            current = right[node_id]
+        self._count_path(path)
+        return result, path
+
+    # ---------- 快照 ----------
+
+    def snapshot(self) -> Dict[str, Any]:
+        left, right = self._left, self._right
+        nodes = []
+        for slot in range(len(right)):
+            if right[slot] == FREE:
+                continue
+            nodes.append(
+                {
+                    "id": slot,
+                    "value": self.value_of(slot),
+                    "left": None if left[slot] == NIL else left[slot],
+                    "right": None if right[slot] == NIL else right[slot],
+                }
+            )
+        return {"root": None if self._root == NIL else self._root, "nodes": nodes}
+
+    def height(self) -> int:
+        if self._root == NIL:
+            return 0
+        left, right = self._left, self._right
+        best = 0
+        stack = [(self._root, 1)]
+        while stack:
+            node_id, depth = stack.pop()
+            if depth > best:
+                best = depth
+            if left[node_id] != NIL:
+                stack.append((left[node_id], depth + 1))
+            if right[node_id] != NIL:
+                stack.append((right[node_id], depth + 1))
+        return best
+
+    @property
+    def average_path_length(self) -> float:
+        """自上次 clear 以来每次操作的平均访问节点数。"""
+        return self.comparisons / self.operations if self.operations else 0.0
+
+    def value_of(self, node_id: int):
+        if node_id is None or not self._alive(node_id):
+            return None
+        return self._values[node_id]
+
+    def node_links(self, node_id: int) -> Optional[Tuple[Optional[int], Optional[int]]]:
+        """(左孩子, 右孩子)，节点不存在时为 None；供视图增量布局按需读取。"""
+        if node_id is None or not self._alive(node_id):
+            return None
+        left = self._left[node_id]
+        right = self._right[node_id]
+        return (None if left == NIL else left, None if right == NIL else right)
+
+    def memory_usage(self) -> int:
+        """四个并列数组占用的字节数（不含 Python 对象头；值退化为列表时按指针大小计）。"""
+        value_size = self._values.itemsize if isinstance(self._values, array) else 8
+        total = value_size * len(self._values)
+        return total + sum(arr.itemsize * len(arr) for arr in (self._left, self._right, self._size))
+
+    # ---------- Internal helpers ----------
+
+    @staticmethod
+    def _is_int(value) -> bool:
+        return isinstance(value, int) and -(1 << 63) <= value < (1 << 63)
+
+    def _alive(self, node_id: int) -> bool:
+        return 0 <= node_id < len(self._right) and self._right[node_id] != FREE
+
+    def _alloc(self, value) -> int:
+        if isinstance(self._values, array) and not self._is_int(value):
+            self._values = list(self._values)
+        slot = self._free
+        if slot != NIL:
+            self._free = self._left[slot]
+            self._values[slot] = value
+            self._left[slot] = NIL
+            self._right[slot] = NIL
+            self._size[slot] = 1
+        else:
+            slot = len(self._values)
+            self._values.append(value)
+            self._left.append(NIL)
+            self._right.append(NIL)
+            self._size.append(1)
+        self._count += 1
+        return slot
+
+    def _release(self, slot: int):
+        self._left[slot] = self._free
+        self._right[slot] = FREE
+        self._free = slot
+        self._count -= 1
+
+    def _replace_child(self, parent: int, old_child: int, new_child: int):
+        if parent == NIL:
+            self._root = new_child
+        elif self._left[parent] == old_child:
+            self._left[parent] = new_child
+        else:
+            self._right[parent] = new_child
+
+    def _subtree_size(self, node_id: int) -> int:
+        return self._size[node_id] if node_id != NIL else 0
+
+    def _recompute_sizes(self):
+        if self._root == NIL:
+            return
+        left, right, size = self._left, self._right, self._size
+        order: List[int] = []
+        stack = [self._root]
+        while stack:
+            node_id = stack.pop()
+            order.append(node_id)
+            if left[node_id] != NIL:
+                stack.append(left[node_id])
+            if right[node_id] != NIL:
+                stack.append(right[node_id])
+        for node_id in reversed(order):
+            size[node_id] = 1 + self._subtree_size(left[node_id]) + self._subtree_size(right[node_id])
+
+    def _count_less(self, value, inclusive: bool) -> Tuple[int, List[int]]:
+        values, left, right = self._values, self._left, self._right
+        count = 0
+        path: List[int] = []
+        current = self._root
+        while current != NIL:
+            path.append(current)
+            current_value = values[current]
+            if current_value < value or (inclusive and current_value == value):
+                count += self._subtree_size(left[current]) + 1
+                current = right[current]
+            else:
+                current = left[current]
+        return count, path
+
+    def _vine_to_tree(self, count: int):
+        leaves = count + 1 - (1 << ((count + 1).bit_length() - 1))
+        self._compress_vine(leaves)
+        remaining = count - leaves
+        while remaining > 1:
+            remaining //= 2
+            self._compress_vine(remaining)
+
+    def _compress_vine(self, times: int):
+        left, right = self._left, self._right
+        scanner = NIL
+        for _ in range(times):
+            child = self._root if scanner == NIL else right[scanner]
+            grand = right[child]
+            if scanner == NIL:
+                self._root = grand
+            else:
+                right[scanner] = grand
+            right[child] = left[grand]
+            left[grand] = child
+            scanner = grand
+
+    def _morris_walk(self) -> Iterator[int]:
+        left, right = self._left, self._right
+        current = self._root
+        while current != NIL:
+            if left[current] == NIL:
+                yield current
+                current = right[current]
+                continue
+            pred = left[current]
+            while right[pred] != NIL and right[pred] != current:
+                pred = right[pred]
+            if right[pred] == NIL:
+                right[pred] = current
+                current = left[current]
+            else:
+                right[pred] = NIL
+                yield current
+                current = right[current]
+
+    def _count_path(self, path: List[int]):
+        self.last_path_length = len(path)
+        self.comparisons += len(path)
+        self.operations += 1
@@ -2,10 +2,13 @@ import re
 from typing import Optional
 
 from PyQt5.QtWidgets import (
+    QComboBox,
     QFormLayout,
     QGridLayout,
     QGroupBox,
+    QHBoxLayout,
     QInputDialog,
+    QLabel,
     QLineEdit,
     QPushButton,
     QVBoxLayout,
@@ -14,7 +17,7 @@ from PyQt5.QtWidgets import (
 )
 
 from core.global_ctrl import GlobalController
-from bst.bst_model import BSTModel
+from bst.bst_array_model import ArrayBSTModel
 from bst.bst_view import BSTView
 from bst.bst_view import BSTViewWithPersistence
 import json
@@ -27,10 +30,23 @@ class BSTController(QWidget):
     构建 BST 操作面板，并负责模型与视图之间的桥接。
     """
 
+    TRAVERSAL_CHOICES = (
+        ("In-order", "inorder"),
+        ("Pre-order", "preorder"),
+        ("Post-order", "postorder"),
+        ("Level-order", "levelorder"),
+        ("Morris (in-order)", "morris"),
+    )
+
+    # 保存文件中的 structure 字段、保存目录以及对话框标题
+    structure_key = "bst"
+    display_name = "BST"
+
     def __init__(self, global_ctrl: GlobalController):
         super().__init__()
-        self.model = BSTModel()
-        self.view = BSTViewWithPersistence(global_ctrl)
+        self.model = self._create_model()
+        self.view = self._create_view(global_ctrl)
+        self.view.bind_structure(self.model.node_links, lambda: self.model.length)
         self._panel_locked = False
 
         self._build_inputs()
@@ -45,21 +61,30 @@ class BSTController(QWidget):
 
         self._refresh_inputs()
 
+    def _create_model(self):
+        # 普通 BST 使用结构数组存储，大树更省内存、查找更快
+        return ArrayBSTModel()
+
+    def _create_view(self, global_ctrl):
+        return BSTViewWithPersistence(global_ctrl)
+
     def _save_to_file(self):
+        # Morris 遍历进行中时树上带有临时线索，先结束遍历
+        self.view.cancel_traversal()
         snapshot = self.model.snapshot()
         if not snapshot["nodes"]:
-            QMessageBox.information(self, "BST", "当前树为空，无需保存。")
+            QMessageBox.information(self, self.display_name, "当前树为空，无需保存。")
             return
 
-        base_dir = Path(__file__).resolve().parents[1] / "save_file" / "bst"
+        base_dir = Path(__file__).resolve().parents[1] / "save_file" / self.structure_key
         base_dir.mkdir(parents=True, exist_ok=True)
-        suggested = str(base_dir / "bst.json")
+        suggested = str(base_dir / f"{self.structure_key}.json")
 
         path, _ = QFileDialog.getSaveFileName(
             self,
-            "Save BST",
+            f"Save {self.display_name}",
             suggested,
-            "BST (*.json);;All Files (*)",
+            f"{self.display_name} (*.json);;All Files (*)",
         )
         if not path:
             return
@@ -69,7 +94,7 @@ class BSTController(QWidget):
         payload = {
             "schema": "pyqt_ds_visualizer",
             "version": 1,
-            "structure": "bst",
+            "structure": self.structure_key,
             "snapshot": snapshot,
         }
 
@@ -80,17 +105,18 @@ class BSTController(QWidget):
             QMessageBox.critical(self, "Save Failed", f"无法写入文件：\n{exc}")
             return
 
-        QMessageBox.information(self, "BST", f"已保存到：\n{path}")
+        QMessageBox.information(self, self.display_name, f"已保存到：\n{path}")
 
     def _load_from_file(self):
-        base_dir = Path(__file__).resolve().parents[1] / "save_file" / "bst"
+        self.view.cancel_traversal()
+        base_dir = Path(__file__).resolve().parents[1] / "save_file" / self.structure_key
         base_dir.mkdir(parents=True, exist_ok=True)
 
         path, _ = QFileDialog.getOpenFileName(
             self,
-            "Open BST",
+            f"Open {self.display_name}",
             str(base_dir),
-            "BST (*.json);;All Files (*)",
+            f"{self.display_name} (*.json);;All Files (*)",
         )
         if not path:
             return
@@ -104,14 +130,15 @@ class BSTController(QWidget):
 
         if (
             payload.get("schema") != "pyqt_ds_visualizer"
-            or payload.get("structure") != "bst"
+            or payload.get("structure") != self.structure_key
             or "snapshot" not in payload
         ):
             QMessageBox.critical(self, "Open Failed", "文件格式不受支持。")
             return
 
-        snapshot = payload["snapshot"]
-        self.model.load_snapshot(snapshot)
+        self.model.load_snapshot(payload["snapshot"])
+        # 平衡树加载不平衡的快照时会重新平衡，以模型结果为准
+        snapshot = self.model.snapshot()
 
         if snapshot["nodes"]:
             self.view.animate_build(snapshot, speed_scale=5)
@@ -119,7 +146,7 @@ class BSTController(QWidget):
             self.view.reset()
 
         self._refresh_inputs()
-        QMessageBox.information(self, "BST", "文件加载完成。")
+        QMessageBox.information(self, self.display_name, "文件加载完成。")
 
     # ---------- UI 构建 ----------
     def _build_inputs(self):
@@ -135,6 +162,28 @@ class BSTController(QWidget):
         self.find_value_edit.setPlaceholderText("Value")
         self.find_value_edit.returnPressed.connect(self._on_find)
 
+        self.select_k_edit = QLineEdit()
+        self.select_k_edit.setPlaceholderText("k (1-based)")
+        self.select_k_edit.returnPressed.connect(self._on_select)
+
+        self.rank_value_edit = QLineEdit()
+        self.rank_value_edit.setPlaceholderText("Value")
+        self.rank_value_edit.returnPressed.connect(self._on_rank)
+
+        self.range_low_edit = QLineEdit()
+        self.range_low_edit.setPlaceholderText("Low")
+        self.range_high_edit = QLineEdit()
+        self.range_high_edit.setPlaceholderText("High")
+        self.range_high_edit.returnPressed.connect(self._on_range_report)
+
+        self.traversal_combo = QComboBox()
+        for label, order in self.TRAVERSAL_CHOICES:
+            self.traversal_combo.addItem(label, order)
+
+        self.skip_steps_edit = QLineEdit()
+        self.skip_steps_edit.setPlaceholderText("Steps")
+        self.skip_steps_edit.returnPressed.connect(self._on_traversal_skip)
+
     def _create_panel(self):
         container = QWidget()
         layout = QGridLayout(container)
@@ -188,15 +237,80 @@ class BSTController(QWidget):
         find_group.setLayout(find_layout)
         layout.addWidget(find_group, 0, 1, 2, 1)
 
-        layout.setRowStretch(3, 1)
+        # Order statistics
+        query_group = QGroupBox("Order Statistics")
+        query_group.setStyleSheet("QGroupBox { color: white; }")
+        query_layout = QFormLayout()
+        query_layout.setContentsMargins(12, 8, 12, 12)
+        query_layout.setSpacing(6)
+        select_btn = QPushButton("Select")
+        select_btn.clicked.connect(self._on_select)
+        query_layout.addRow("k:", self._inline_row(self.select_k_edit, select_btn))
+        rank_btn = QPushButton("Rank")
+        rank_btn.clicked.connect(self._on_rank)
+        query_layout.addRow("Value:", self._inline_row(self.rank_value_edit, rank_btn))
+        query_layout.addRow("Range:", self._inline_row(self.range_low_edit, self.range_high_edit))
+        range_count_btn = QPushButton("Count")
+        range_count_btn.clicked.connect(self._on_range_count)
+        range_report_btn = QPushButton("Report")
+        range_report_btn.clicked.connect(self._on_range_report)
+        query_layout.addRow(self._inline_row(range_count_btn, range_report_btn))
+        self.query_result_label = QLabel()
+        self.query_result_label.setStyleSheet("color: white;")
+        self.query_result_label.setWordWrap(True)
+        query_layout.addRow(self.query_result_label)
+        query_group.setLayout(query_layout)
+        layout.addWidget(query_group, 2, 1)
+
+        # Traversal
+        traversal_group = QGroupBox("Traversal")
+        traversal_group.setStyleSheet("QGroupBox { color: white; }")
+        traversal_layout = QFormLayout()
+        traversal_layout.setContentsMargins(12, 8, 12, 12)
+        traversal_layout.setSpacing(6)
+        traversal_start_btn = QPushButton("Start")
+        traversal_start_btn.clicked.connect(self._on_traversal_start)
+        traversal_stop_btn = QPushButton("Stop")
+        traversal_stop_btn.clicked.connect(self._on_traversal_stop)
+        traversal_layout.addRow(
+            "Order:",
+            self._inline_row(self.traversal_combo, traversal_start_btn, traversal_stop_btn),
+        )
+        traversal_skip_btn = QPushButton("Skip")
+        traversal_skip_btn.clicked.connect(self._on_traversal_skip)
+        traversal_layout.addRow("Fast-forward:", self._inline_row(self.skip_steps_edit, traversal_skip_btn))
+        self.traversal_label = QLabel()
+        self.traversal_label.setStyleSheet("color: white;")
+        traversal_layout.addRow(self.traversal_label)
+        traversal_group.setLayout(traversal_layout)
+        layout.addWidget(traversal_group, 3, 0, 1, 2)
+
+        layout.setRowStretch(4, 1)
 
         self.create_btn = create_btn
         self.insert_btn = insert_btn
         self.delete_btn = delete_btn
         self.find_btn = find_btn
+        self.select_btn = select_btn
+        self.rank_btn = rank_btn
+        self.range_count_btn = range_count_btn
+        self.range_report_btn = range_report_btn
+        self.traversal_start_btn = traversal_start_btn
+        self.traversal_stop_btn = traversal_stop_btn
+        self.traversal_skip_btn = traversal_skip_btn
 
         return container
 
+    @staticmethod
+    def _inline_row(*widgets):
+        row = QWidget()
+        hlayout = QHBoxLayout(row)
+        hlayout.setContentsMargins(0, 0, 0, 0)
+        hlayout.setSpacing(6)
+        for widget in widgets:
+            hlayout.addWidget(widget)
+        return row
+
     @staticmethod
     def _single_button_group(title, button):
         group = QGroupBox(title)
@@ -230,7 +344,7 @@ class BSTController(QWidget):
     def _on_create(self):
         text, ok = QInputDialog.getText(
             self,
-            "Create BST",
+            f"Create {self.display_name}",
             "Enter values (comma-separated):",
         )
         if not ok:
@@ -258,7 +372,7 @@ class BSTController(QWidget):
             return
         inserted_id, path = self.model.insert(value)
         snapshot = self.model.snapshot()
-        self.view.animate_insert(snapshot, inserted_id, path)
+        self.view.animate_insert(snapshot, inserted_id, path, rotations=self.model.rotations)
         self._refresh_inputs()
 
     def _on_delete(self):
@@ -273,9 +387,9 @@ class BSTController(QWidget):
         removed_id, path = self.model.delete(value)
         snapshot = self.model.snapshot()
         if removed_id is None:
-            self.view.animate_find(snapshot, None, path)
+            self.view.animate_find(snapshot, None, path, rotations=self.model.rotations)
         else:
-            self.view.animate_delete(snapshot, removed_id, path)
+            self.view.animate_delete(snapshot, removed_id, path, rotations=self.model.rotations)
         self._refresh_inputs()
 
     def _on_find(self):
@@ -289,7 +403,112 @@ class BSTController(QWidget):
             return
         found_id, path = self.model.find(value)
         snapshot = self.model.snapshot()
-        self.view.animate_find(snapshot, found_id, path)
+        self.view.animate_find(snapshot, found_id, path, rotations=self.model.rotations)
+
+    def _on_select(self):
+        if self.model.length == 0:
+            return
+        raw = self._require_value(self.select_k_edit, "查询")
+        if raw is None:
+            return
+        try:
+            k = int(raw)
+        except ValueError:
+            QMessageBox.warning(self, "Invalid Value", "k 必须是正整数。")
+            return
+        node_id, path = self.model.select(k)
+        if node_id is None:
+            self.query_result_label.setText(f"k = {k} 超出范围（共 {self.model.length} 个节点）")
+            results = []
+        else:
+            self.query_result_label.setText(f"第 {k} 小：{self.model.value_of(node_id)}")
+            results = [node_id]
+        self.view.animate_query(self.model.snapshot(), path, results)
+
+    def _on_rank(self):
+        if self.model.length == 0:
+            return
+        raw = self._require_value(self.rank_value_edit, "查询")
+        if raw is None:
+            return
+        value = self._coerce_numeric_or_warn(raw, "查询")
+        if value is None:
+            return
+        count, path = self.model.rank(value)
+        self.query_result_label.setText(f"小于 {value} 的键：{count} 个")
+        self.view.animate_query(self.model.snapshot(), path)
+
+    def _on_range_count(self):
+        bounds = self._read_range()
+        if bounds is None:
+            return
+        count, path = self.model.range_count(*bounds)
+        self.query_result_label.setText(f"[{bounds[0]}, {bounds[1]}] 内共 {count} 个键")
+        self.view.animate_query(self.model.snapshot(), path)
+
+    def _on_range_report(self):
+        bounds = self._read_range()
+        if bounds is None:
+            return
+        node_ids, path = self.model.range_report(*bounds)
+        values = [self.model.value_of(node_id) for node_id in node_ids]
+        preview = ", ".join(str(value) for value in values[:20])
+        if len(values) > 20:
+            preview += f", …（共 {len(values)} 个）"
+        self.query_result_label.setText(f"[{bounds[0]}, {bounds[1]}]：{preview or '无'}")
+        self.view.animate_query(self.model.snapshot(), path, node_ids)
+
+    def _on_traversal_start(self):
+        if self.model.length == 0:
+            return
+        order = self.traversal_combo.currentData()
+        self.traversal_label.setText(f"{self.traversal_combo.currentText()}：开始")
+        self.view.animate_traversal(
+            self.model.traverse(order),
+            on_visit=self._on_traversal_visit,
+            on_finish=self._on_traversal_finish,
+        )
+        self._refresh_inputs()
+
+    def _on_traversal_stop(self):
+        self.view.cancel_traversal()
+        self.traversal_label.setText("遍历已停止")
+        self._refresh_inputs()
+
+    def _on_traversal_skip(self):
+        if not self.view.traversal_active:
+            return
+        raw = self._require_value(self.skip_steps_edit, "跳过")
+        if raw is None:
+            return
+        try:
+            count = int(raw)
+        except ValueError:
+            QMessageBox.warning(self, "Invalid Value", "步数必须是正整数。")
+            return
+        self.view.fast_forward_traversal(count)
+        self._refresh_inputs()
+
+    def _on_traversal_visit(self, index, node_id):
+        self.traversal_label.setText(f"第 {index} 步：{self.model.value_of(node_id)}")
+
+    def _on_traversal_finish(self, total):
+        self.traversal_label.setText(f"遍历完成，共 {total} 步")
+        self._refresh_inputs()
+
+    def _read_range(self):
+        if self.model.length == 0:
+            return None
+        bounds = []
+        for edit in (self.range_low_edit, self.range_high_edit):
+            raw = self._require_value(edit, "查询")
+            if raw is None:
+                return None
+            value = self._coerce_numeric_or_warn(raw, "查询")
+            if value is None:
+                return None
+            bounds.append(value)
+        return tuple(bounds)
 
     def _coerce_numeric_or_warn(self, raw: str, action: str):
         try:
@@ -299,6 +518,8 @@ class BSTController(QWidget):
             return None
 
     def _handle_delete_from_view(self, node_id):
+        if self.view.traversal_active:
+            return
         value = self.model.value_of(node_id)
         if value is None:
             return
@@ -306,6 +527,9 @@ class BSTController(QWidget):
         self._on_delete()
 
     def _handle_find_from_view(self, node_id):
+        # 与删除一致：惰性遍历（如 Morris）进行中树上仍有临时线索，不在此时查找
+        if self.view.traversal_active:
+            return
         value = self.model.value_of(node_id)
         if value is None:
             return
@@ -313,6 +537,7 @@ class BSTController(QWidget):
         self._on_find()
 
     def _on_clear_all_requested(self):
+        self.view.cancel_traversal()
         self.model.clear()
         self.view.reset()
         self._refresh_inputs()
@@ -331,9 +556,24 @@ class BSTController(QWidget):
             self.delete_value_edit,
             self.find_btn,
             self.find_value_edit,
+            self.select_btn,
+            self.select_k_edit,
+            self.rank_btn,
+            self.rank_value_edit,
+            self.range_low_edit,
+            self.range_high_edit,
+            self.range_count_btn,
+            self.range_report_btn,
+            self.traversal_combo,
+            self.traversal_start_btn,
         ):
             widget.setDisabled(state or not has_nodes)
 
+        # 遍历动画会锁定面板，但停止 / 快进按钮需要保持可用
+        traversing = self.view.traversal_active
+        for widget in (self.traversal_stop_btn, self.traversal_skip_btn, self.skip_steps_edit):
+            widget.setDisabled(not traversing)
+
     def _on_lock_state(self, locked):
         self._panel_locked = locked
         self._refresh_inputs()
@@ -1,16 +1,28 @@
 import itertools
-from typing import Any, Dict, List, Optional, Tuple
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 
 class BSTModel:
     """
     简单的二叉搜索树数据模型，节点使用唯一 id，方便视图做增量动画。
+    每个节点维护子树大小 ``size``（仅模型内部使用，不写入快照），
+    支持 select / rank / range_count / range_report 等顺序统计查询。
     """
 
+    # 子类节点上需要随快照导出的额外字段（如高度、颜色）
+    _EXTRA_FIELDS: Tuple[str, ...] = ()
+
     def __init__(self):
         self._id_iter = itertools.count()
         self._nodes: Dict[int, Dict[str, Any]] = {}
         self._root: Optional[int] = None
+        # 最近一次操作的结构变化日志（普通 BST 恒为空），供视图回放旋转
+        self.rotations: List[Dict[str, Any]] = []
+        # 自上次 clear 以来的累计比较次数、操作次数，以及最近一次操作的路径长度
+        self.comparisons = 0
+        self.operations = 0
+        self.last_path_length = 0
 
     @property
     def length(self) -> int:
@@ -20,6 +32,10 @@ class BSTModel:
         self._nodes.clear()
         self._root = None
         self._id_iter = itertools.count()
+        self.rotations = []
+        self.comparisons = 0
+        self.operations = 0
+        self.last_path_length = 0
 
     def load_snapshot(self, snapshot):
         self.clear()
@@ -35,17 +51,52 @@ class BSTModel:
                 "value": info["value"],
                 "left": info["left"],
                 "right": info["right"],
+                "size": 1,
             }
+            for field in self._EXTRA_FIELDS:
+                if field in info:
+                    rebuilt[node_id][field] = info[field]
             max_id = max(max_id, node_id)
 
         self._nodes = rebuilt
         self._root = root if root in rebuilt or root is None else None
         self._id_iter = itertools.count(max_id + 1 if max_id >= 0 else 0)
+        self._recompute_sizes()
 
     def create_from_iterable(self, values):
+        """批量建树：排序去重一次后直接构建平衡树，不再逐个插入。"""
+        self.bulk_load(values)
+
+    def bulk_load(self, values):
+        self.bulk_load_sorted(sorted(set(values)))
+
+    def bulk_load_sorted(self, values):
+        """
+        从已排序（非降序）的序列或迭代器建树，不复制输入：
+        先按顺序挂成一条右斜链，再用 DSW 压缩成完全平衡树，整体 O(n)。
+        相邻的重复值会被跳过；出现逆序时清空并抛出 ValueError。
+        """
         self.clear()
+        tail = None
+        previous = None
+        count = 0
         for value in values:
-            self.insert(value)
+            if tail is not None:
+                if value == previous:
+                    continue
+                if value < previous:
+                    self.clear()
+                    raise ValueError("bulk_load_sorted requires non-decreasing input")
+            node_id = self._make_node(value)["id"]
+            if tail is None:
+                self._root = node_id
+            else:
+                self._nodes[tail]["right"] = node_id
+            tail = node_id
+            previous = value
+            count += 1
+        self._vine_to_tree(count)
+        self._recompute_sizes()
 
     def insert(self, value) -> Tuple[int, List[int]]:
         """
@@ -58,6 +109,7 @@ class BSTModel:
         if self._root is None:
             new_node = self._make_node(value)
             self._root = new_node["id"]
+            self._count_path(path)
             return new_node["id"], path
 
         current_id = self._root
@@ -69,6 +121,7 @@ class BSTModel:
             path.append(current_id)
             current = self._nodes[current_id]
             if value == current["value"]:
+                self._count_path(path)
                 return current_id, path
             if value < current["value"]:
                 direction = "left"
@@ -83,6 +136,8 @@ class BSTModel:
         else:
             self._nodes[parent_id][direction] = new_node["id"]
 
+        self._grow_path(path)
+        self._count_path(path)
         return new_node["id"], path
 
     def delete(self, value) -> Tuple[Optional[int], List[int]]:
@@ -107,9 +162,13 @@ class BSTModel:
                 direction = "right"
                 current_id = node["right"]
         else:
+            self._count_path(path)
             return None, path
 
+        self._count_path(path)
         node = self._nodes[current_id]
+        # 受影响的祖先链（自根向下），删除后自底向上重算子树大小
+        resize_chain = path[:-1]
 
         # 0 or 1 child
         if node["left"] is None or node["right"] is None:
@@ -126,6 +185,8 @@ class BSTModel:
                 path.append(succ_id)
 
             successor = self._nodes[succ_id]
+            # 后继顶替目标位置，其下方到后继原父节点的一段链都少了一个节点
+            resize_chain = resize_chain + [succ_id] + path[len(resize_chain) + 1:-1]
 
             # 将后继节点从原位置摘下
             if succ_parent != current_id:
@@ -144,6 +205,7 @@ class BSTModel:
         if current_id == self._root:
             # 根节点更新逻辑在 _replace_child 中完成
             pass
+        self._update_sizes(resize_chain)
 
         return current_id, path
 
@@ -154,36 +216,327 @@ class BSTModel:
             path.append(current_id)
             node = self._nodes[current_id]
             if value == node["value"]:
+                self._count_path(path)
                 return current_id, path
             if value < node["value"]:
                 current_id = node["left"]
             else:
                 current_id = node["right"]
+        self._count_path(path)
+        return None, path
+
+    # ---------- 遍历（生成器，逐步产出节点 id） ----------
+
+    TRAVERSAL_ORDERS = ("inorder", "preorder", "postorder", "levelorder", "morris")
+
+    def traverse(self, order: str) -> Iterator[int]:
+        """按名称返回遍历生成器；遍历期间不要修改树。"""
+        if order not in self.TRAVERSAL_ORDERS:
+            raise ValueError(f"unknown traversal order: {order}")
+        return getattr(self, f"iter_{order}")()
+
+    def iter_inorder(self) -> Iterator[int]:
+        """中序遍历，辅助栈 O(h)。"""
+        nodes = self._nodes
+        stack: List[int] = []
+        current = self._root
+        while stack or current is not None:
+            while current is not None:
+                stack.append(current)
+                current = nodes[current]["left"]
+            current = stack.pop()
+            yield current
+            current = nodes[current]["right"]
+
+    def iter_preorder(self) -> Iterator[int]:
+        """先序遍历，辅助栈 O(h)：栈里只保留尚未访问的右孩子。"""
+        nodes = self._nodes
+        stack: List[int] = []
+        current = self._root
+        while stack or current is not None:
+            while current is not None:
+                yield current
+                node = nodes[current]
+                if node["right"] is not None:
+                    stack.append(node["right"])
+                current = node["left"]
+            if stack:
+                current = stack.pop()
+
+    def iter_postorder(self) -> Iterator[int]:
+        """后序遍历，单栈 + 上一个访问节点，辅助栈 O(h)。"""
+        nodes = self._nodes
+        stack: List[int] = []
+        last = None
+        current = self._root
+        while stack or current is not None:
+            if current is not None:
+                stack.append(current)
+                current = nodes[current]["left"]
+                continue
+            right = nodes[stack[-1]]["right"]
+            if right is not None and right != last:
+                current = right
+            else:
+                last = stack.pop()
+                yield last
+
+    def iter_levelorder(self) -> Iterator[int]:
+        """层序遍历，队列长度不超过树的最大宽度。"""
+        if self._root is None:
+            return
+        nodes = self._nodes
+        queue = deque([self._root])
+        while queue:
+            node_id = queue.popleft()
+            yield node_id
+            node = nodes[node_id]
+            if node["left"] is not None:
+                queue.append(node["left"])
+            if node["right"] is not None:
+                queue.append(node["right"])
+
+    def iter_morris(self) -> Iterator[int]:
+        """
+        Morris 中序遍历，O(1) 辅助空间：借用前驱的空右指针作临时线索。
+        生成器被提前关闭时会静默走完剩余部分，保证线索全部拆除。
+        """
+        walk = self._morris_walk()
+        try:
+            for node_id in walk:
+                yield node_id
+        finally:
+            for _ in walk:
+                pass
+
+    # ---------- 顺序统计 / 区间查询 ----------
+
+    def select(self, k: int) -> Tuple[Optional[int], List[int]]:
+        """第 k 小（k 从 1 开始）的节点 id 与访问路径；越界时 id 为 None。"""
+        path: List[int] = []
+        current_id = self._root
+        while current_id is not None:
+            path.append(current_id)
+            node = self._nodes[current_id]
+            left_size = self._size(node["left"])
+            if k == left_size + 1:
+                self._count_path(path)
+                return current_id, path
+            if k <= left_size:
+                current_id = node["left"]
+            else:
+                k -= left_size + 1
+                current_id = node["right"]
+        self._count_path(path)
         return None, path
 
+    def rank(self, value) -> Tuple[int, List[int]]:
+        """严格小于 value 的键个数与访问路径；value 存在时 select(rank + 1) 即为它。"""
+        count, path = self._count_less(value, inclusive=False)
+        self._count_path(path)
+        return count, path
+
+    def range_count(self, low, high) -> Tuple[int, List[int]]:
+        """闭区间 [low, high] 内的键个数，只走两条边界路径，O(log n)。"""
+        if high < low:
+            return 0, []
+        upper, upper_path = self._count_less(high, inclusive=True)
+        lower, lower_path = self._count_less(low, inclusive=False)
+        path = self._merge_paths(upper_path, lower_path)
+        self._count_path(path)
+        return upper - lower, path
+
+    def range_report(self, low, high) -> Tuple[List[int], List[int]]:
+        """
+        按升序返回 [low, high] 内的节点 id 以及访问路径，O(log n + k)。
+        中序遍历时剪掉整棵落在区间外的子树。
+        """
+        result: List[int] = []
+        path: List[int] = []
+        if high < low:
+            return result, path
+        stack: List[int] = []
+        current_id = self._root
+        while stack or current_id is not None:
+            while current_id is not None:
+                path.append(current_id)
+                node = self._nodes[current_id]
+                if node["value"] < low:
+                    # 左子树与当前节点都小于 low
+                    current_id = node["right"]
+                    continue
+                stack.append(current_id)
+                current_id = node["left"]
+            if not stack:
+                break
+            node_id = stack.pop()
+            node = self._nodes[node_id]
+            if node["value"] > high:
+                break
+            result.append(node_id)
+            current_id = node["right"]
+        self._count_path(path)
+        return result, path
+
     def snapshot(self) -> Dict[str, Any]:
         return {
             "root": self._root,
-            "nodes": [
-                {
-                    "id": node_id,
-                    "value": node["value"],
-                    "left": node["left"],
-                    "right": node["right"],
-                }
-                for node_id, node in self._nodes.items()
-            ],
+            "nodes": [self._export_node(node) for node in self._nodes.values()],
         }
 
+    def height(self) -> int:
+        """树高（空树为 0），迭代计算。"""
+        if self._root is None:
+            return 0
+        best = 0
+        stack = [(self._root, 1)]
+        while stack:
+            node_id, depth = stack.pop()
+            best = max(best, depth)
+            node = self._nodes[node_id]
+            for child in (node["left"], node["right"]):
+                if child is not None:
+                    stack.append((child, depth + 1))
+        return best
+
+    @property
+    def average_path_length(self) -> float:
+        """自上次 clear 以来每次操作的平均访问节点数。"""
+        return self.comparisons / self.operations if self.operations else 0.0
+
     def value_of(self, node_id: int):
         node = self._nodes.get(node_id)
         return node["value"] if node else None
 
+    def node_links(self, node_id: int) -> Optional[Tuple[Optional[int], Optional[int]]]:
+        """(左孩子, 右孩子)，节点不存在时为 None；供视图增量布局按需读取。"""
+        node = self._nodes.get(node_id)
+        return (node["left"], node["right"]) if node else None
+
     # ---------- Internal helpers ----------
 
+    def _export_node(self, node) -> Dict[str, Any]:
+        info = {
+            "id": node["id"],
+            "value": node["value"],
+            "left": node["left"],
+            "right": node["right"],
+        }
+        for field in self._EXTRA_FIELDS:
+            info[field] = node[field]
+        return info
+
+    def _vine_to_tree(self, count: int):
+        # 最底层先压出多余的叶子，之后每轮把右链长度减半
+        leaves = count + 1 - (1 << ((count + 1).bit_length() - 1))
+        self._compress_vine(leaves)
+        remaining = count - leaves
+        while remaining > 1:
+            remaining //= 2
+            self._compress_vine(remaining)
+
+    def _compress_vine(self, times: int):
+        """沿右链做 times 次左旋；scanner 为 None 时表示根之上的伪节点。"""
+        nodes = self._nodes
+        scanner = None
+        for _ in range(times):
+            child = self._root if scanner is None else nodes[scanner]["right"]
+            grand = nodes[child]["right"]
+            if scanner is None:
+                self._root = grand
+            else:
+                nodes[scanner]["right"] = grand
+            nodes[child]["right"] = nodes[grand]["left"]
+            nodes[grand]["left"] = child
+            scanner = grand
+
+    def _size(self, node_id: Optional[int]) -> int:
+        return self._nodes[node_id]["size"] if node_id is not None else 0
+
+    def _update_size(self, node_id: int):
+        node = self._nodes[node_id]
+        node["size"] = 1 + self._size(node["left"]) + self._size(node["right"])
+
+    def _update_sizes(self, chain: List[int]):
+        """chain 自根向下，自底向上重算子树大小。"""
+        for node_id in reversed(chain):
+            self._update_size(node_id)
+
+    def _grow_path(self, path: List[int]):
+        # 新叶子挂在路径末端，路径上每个祖先的子树都多了一个节点
+        for node_id in path:
+            self._nodes[node_id]["size"] += 1
+
+    def _recompute_sizes(self):
+        if self._root is None:
+            return
+        # 迭代后序：先压入的节点最后处理
+        order: List[int] = []
+        stack = [self._root]
+        while stack:
+            node_id = stack.pop()
+            order.append(node_id)
+            node = self._nodes[node_id]
+            if node["left"] is not None:
+                stack.append(node["left"])
+            if node["right"] is not None:
+                stack.append(node["right"])
+        self._update_sizes(order)
+
+    def _count_less(self, value, inclusive: bool) -> Tuple[int, List[int]]:
+        """小于（inclusive 时为小于等于）value 的键个数与下行路径。"""
+        count = 0
+        path: List[int] = []
+        current_id = self._root
+        while current_id is not None:
+            path.append(current_id)
+            node = self._nodes[current_id]
+            if node["value"] < value or (inclusive and node["value"] == value):
+                count += self._size(node["left"]) + 1
+                current_id = node["right"]
+            else:
+                current_id = node["left"]
+        return count, path
+
+    @staticmethod
+    def _merge_paths(*paths: List[int]) -> List[int]:
+        merged: List[int] = []
+        seen = set()
+        for path in paths:
+            for node_id in path:
+                if node_id not in seen:
+                    seen.add(node_id)
+                    merged.append(node_id)
+        return merged
+
+    def _morris_walk(self) -> Iterator[int]:
+        nodes = self._nodes
+        current = self._root
+        while current is not None:
+            node = nodes[current]
+            if node["left"] is None:
+                yield current
+                current = node["right"]
+                continue
+            pred = node["left"]
+            while nodes[pred]["right"] is not None and nodes[pred]["right"] != current:
+                pred = nodes[pred]["right"]
+            if nodes[pred]["right"] is None:
+                nodes[pred]["right"] = current
+                current = node["left"]
+            else:
+                nodes[pred]["right"] = None
+                yield current
+                current = node["right"]
+
+    def _count_path(self, path: List[int]):
+        self.last_path_length = len(path)
+        self.comparisons += len(path)
+        self.operations += 1
+
     def _make_node(self, value):
         node_id = next(self._id_iter)
-        node = {"id": node_id, "value": value, "left": None, "right": None}
+        node = {"id": node_id, "value": value, "left": None, "right": None, "size": 1}
         self._nodes[node_id] = node
         return node
 
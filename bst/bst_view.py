@@ -1,4 +1,6 @@
 import math
+from collections import deque
+from itertools import islice
 from typing import Dict, List, Optional, Set
 
 from PyQt5.QtCore import QEvent, QPointF, QRectF, Qt, pyqtSignal
@@ -12,12 +14,16 @@ from PyQt5.QtWidgets import (
 )
 
 from core.base_view import BaseStructureView
+from core.tree_layout import IncrementalTidyLayout, mapping_links
 
 
 class BSTView(BaseStructureView):
     deleteRequested = pyqtSignal(int)
     findRequested = pyqtSignal(int)
 
+    # 子类可替换节点图元（例如带高度 / 颜色标注的平衡树节点）
+    node_item_class = None
+
     def __init__(self, global_ctrl):
         super().__init__(global_ctrl)
         self.scene.installEventFilter(self)
@@ -27,14 +33,45 @@ class BSTView(BaseStructureView):
         self._last_snapshot = {"root": None, "nodes": []}
         self._temp_insert_counter = 0
 
+        # 布局参数：相邻子树节点的最小中心距、单子节点偏移、层距、顶部偏移
+        self._layout_sibling_sep = BSTNodeItem.width + 90
+        self._layout_single_offset = 60
+        self._layout_level_gap = 130
+        self._layout_top = -40
+        self._layout_engine = IncrementalTidyLayout(
+            sibling_sep=self._layout_sibling_sep,
+            single_offset=self._layout_single_offset,
+        )
+        # 增量布局的数据来源：按 id 读取 (left, right) 的回调与当前节点数，见 bind_structure
+        self._node_links = None
+        self._node_count = None
+
+        # 惰性遍历状态：步骤迭代器、已消费步数、访问回调、待恢复的节点颜色
+        self._traversal_steps = None
+        self._traversal_index = 0
+        self._traversal_batch = 24
+        self._traversal_on_visit = None
+        self._traversal_on_finish = None
+        self._traversal_restore: List[tuple] = []
+
     # ---------- Public API ----------
 
+    def bind_structure(self, node_links, node_count):
+        """
+        让增量布局直接从模型读取被改动节点的孩子指针：
+        node_links(id) 返回 (left, right) 或 None（节点不存在），node_count() 返回节点数。
+        """
+        self._node_links = node_links
+        self._node_count = node_count
+
     def reset(self):
+        self.cancel_traversal()
         self.stop_all_animations()
-        self.scene.clear()
+        self.clear_scene()
         self.node_items.clear()
         self.edge_items.clear()
         self._last_snapshot = {"root": None, "nodes": []}
+        self._layout_engine.reset()
 
     def animate_build(self, snapshot, speed_scale: float = 1.0):
         self.reset()
@@ -47,12 +84,14 @@ class BSTView(BaseStructureView):
             return max(1, int(base_ms / speed_scale))
 
         positions = self._compute_layout(snapshot)
-        level_order = self._level_order(snapshot)
+        tree = {node["id"]: node for node in snapshot["nodes"]}
+        level_order = self._level_order(snapshot, tree)
         sequential = self.anim.sequential()
 
         for node_id in level_order:
-            info = self._node_info(snapshot, node_id)
+            info = tree[node_id]
             node_item = self._create_node_item(info["id"], info["value"])
+            self._decorate_node(node_item, info)
             target = positions[node_id]
             spawn = QPointF(target.x(), target.y() - 160)
             node_item.setPos(spawn)
@@ -68,9 +107,12 @@ class BSTView(BaseStructureView):
             finalizer=lambda: self._finalize_snapshot(snapshot, positions),
         )
 
-    def animate_insert(self, snapshot, inserted_id, path_ids):
-        positions = self._compute_layout(snapshot)
-        if not positions:
+    def animate_insert(self, snapshot, inserted_id, path_ids, rotations=None):
+        # 有旋转时先按“挂接后、旋转前”的结构布局，旋转阶段再逐步移动
+        stage_snapshot, work, stages = self._plan_rotation_stages(rotations)
+        # 仅包含新节点与位置发生变化的节点
+        positions = self._update_layout(stage_snapshot or snapshot, list(path_ids or []) + [inserted_id], work)
+        if not len(self._layout_engine):
             return
 
         prev_snapshot = self._last_snapshot or {"root": None, "nodes": []}
@@ -78,7 +120,7 @@ class BSTView(BaseStructureView):
         current_root_id = prev_snapshot.get("root")
 
         new_info = self._node_info(snapshot, inserted_id)
-        target = positions.get(inserted_id, QPointF(0.0, 0.0))
+        target = self._layout_point(inserted_id) or QPointF(0.0, 0.0)
 
         duplicate_target_item = self.node_items.get(inserted_id)
         duplicate_attempt = duplicate_target_item is not None
@@ -97,6 +139,7 @@ class BSTView(BaseStructureView):
             node_item = duplicate_target_item
             if not node_item:
                 node_item = self._create_node_item(new_info["id"], new_info["value"])
+                self._decorate_node(node_item, new_info)
 
         if not duplicate_attempt and current_root_id is None:
             spawn = QPointF(target.x(), target.y() - 160)
@@ -173,7 +216,7 @@ class BSTView(BaseStructureView):
                 if step["is_final"]:
                     highlight_center = self._center_from_position(target)
                 else:
-                    child_pos = positions.get(child_id)
+                    child_pos = self._layout_point(child_id)
                     highlight_center = self._center_from_position(child_pos)
 
             flash_anim = self._edge_flash_animation(parent_item, child_item, highlight_center, temp_highlights)
@@ -183,7 +226,7 @@ class BSTView(BaseStructureView):
             if step["is_final"]:
                 if duplicate_attempt:
                     stage_base_item = self.node_items.get(child_id) or duplicate_target_item
-                    fallback_pos = positions.get(child_id) if child_id is not None else None
+                    fallback_pos = self._layout_point(child_id) if child_id is not None else None
                     if fallback_pos is None:
                         fallback_pos = target
                     move_target = self._stage_position(stage_base_item, fallback_pos)
@@ -196,7 +239,7 @@ class BSTView(BaseStructureView):
                 move_target = target
                 duration = 780
             else:
-                fallback_pos = positions.get(child_id)
+                fallback_pos = self._layout_point(child_id)
                 move_target = self._stage_position(child_item, fallback_pos)
                 if move_target is None:
                     move_target = fallback_pos or (child_item.pos() if child_item else target)
@@ -207,6 +250,8 @@ class BSTView(BaseStructureView):
         relayout = None if duplicate_attempt else self._animate_relayout(snapshot, positions, skip_ids={inserted_id})
         if relayout:
             sequence.addAnimation(relayout)
+        if stages:
+            sequence.addAnimation(self._animate_rotation_stages(work, stages, positions))
 
         def _finalize():
             if temp_insert_placeholder and temp_insert_placeholder.scene():
@@ -215,14 +260,15 @@ class BSTView(BaseStructureView):
 
         self._track_animation(sequence, finalizer=_finalize)
 
-    def animate_delete(self, snapshot, removed_id, path_ids):
+    def animate_delete(self, snapshot, removed_id, path_ids, rotations=None):
         target = self.node_items.get(removed_id)
         if removed_id is None or target is None:
             # 视图缺少目标节点，直接重建
             self._finalize_snapshot(snapshot, self._compute_layout(snapshot))
             return
 
-        new_positions = self._compute_layout(snapshot)
+        stage_snapshot, work, stages = self._plan_rotation_stages(rotations)
+        new_positions = self._update_layout(stage_snapshot or snapshot, list(path_ids or []) + [removed_id], work)
         restore_colors: List[tuple] = []
         traversal = self._build_path_flash(path_ids, restore_colors)
         flash = self.anim.flash_brush(
@@ -247,14 +293,18 @@ class BSTView(BaseStructureView):
         sequence.addAnimation(self.anim.parallel(lift, fade))
         if relayout:
             sequence.addAnimation(relayout)
+        if stages:
+            sequence.addAnimation(self._animate_rotation_stages(work, stages, new_positions))
 
         self._track_animation(
             sequence,
             finalizer=lambda: self._finalize_delete(snapshot, new_positions, removed_id, restore_colors),
         )
 
-    def animate_find(self, snapshot, found_id, path_ids):
-        positions = self._compute_layout(snapshot)
+    def animate_find(self, snapshot, found_id, path_ids, rotations=None):
+        # 普通查找不改变结构，布局缓存同步时这里为空；伸展树查找后还会回放旋转
+        stage_snapshot, work, stages = self._plan_rotation_stages(rotations)
+        positions = self._update_layout(stage_snapshot or snapshot, (), work)
         sequence = self.anim.sequential()
 
         duration_scale = 1.0 / 0.8  # 放慢动画速度至原来的 0.8 倍
@@ -280,14 +330,159 @@ class BSTView(BaseStructureView):
                 loops=2,
             )
             sequence.addAnimation(flash)
+        if stages:
+            sequence.addAnimation(self._animate_rotation_stages(work, stages, positions))
 
         self._track_animation(
             sequence,
             finalizer=lambda: self._finalize_find(snapshot, positions, found_id, restore_colors),
         )
 
+    def animate_query(self, snapshot, path_ids, result_ids=()):
+        """
+        顺序统计 / 区间查询：按访问顺序闪烁路径，再依次把结果节点标绿，结束后恢复颜色。
+        """
+        positions = self._update_layout(snapshot, ())
+        sequence = self.anim.sequential()
+
+        restore_colors: List[tuple] = []
+        traversal = self._build_path_flash(path_ids, restore_colors)
+        if traversal:
+            sequence.addAnimation(traversal)
+
+        for node_id in result_ids or ():
+            item = self.node_items.get(node_id)
+            if item is None:
+                continue
+            original_color = QColor(item.fillColor)
+            restore_colors.append((item, original_color))
+            sequence.addAnimation(
+                self.anim.flash_brush(
+                    setter=item.setFillColor,
+                    start_color=original_color,
+                    end_color=QColor("#66bb6a"),
+                    duration=260,
+                    loops=1,
+                )
+            )
+        sequence.addAnimation(self.anim.pause(480))
+
+        self._track_animation(
+            sequence,
+            finalizer=lambda: self._finalize_query(snapshot, positions, restore_colors),
+        )
+
+    def animate_traversal(self, steps, on_visit=None, on_finish=None, batch: int = 24):
+        """
+        惰性播放遍历：每次只从 steps 迭代器取 batch 步生成动画，
+        播完再取下一批，因此大树也能立即开始，且不会生成完整的访问列表。
+        on_visit(index, node_id) 在每个节点高亮结束时调用，index 从 1 开始。
+        """
+        self.cancel_traversal()
+        self._traversal_steps = iter(steps)
+        self._traversal_index = 0
+        self._traversal_batch = max(1, int(batch))
+        self._traversal_on_visit = on_visit
+        self._traversal_on_finish = on_finish
+        self._play_traversal_chunk()
+
+    def fast_forward_traversal(self, count: int) -> int:
+        """跳过 count 步（不生成动画），返回实际跳过的步数；随后从新位置继续播放。"""
+        if self._traversal_steps is None or count <= 0:
+            return 0
+        self.stop_all_animations()
+        self._restore_traversal_colors()
+        skipped = 0
+        last_id = None
+        for skipped, last_id in enumerate(islice(self._traversal_steps, count), 1):
+            pass
+        self._traversal_index += skipped
+        if skipped and self._traversal_on_visit:
+            self._traversal_on_visit(self._traversal_index, last_id)
+        if skipped < count:
+            self._finish_traversal()
+        else:
+            self._play_traversal_chunk()
+        return skipped
+
+    def cancel_traversal(self):
+        """停止遍历并关闭步骤迭代器（Morris 遍历借此拆除线索）。"""
+        steps = self._traversal_steps
+        if steps is None:
+            return
+        self._traversal_steps = None
+        self.stop_all_animations()
+        self._restore_traversal_colors()
+        close = getattr(steps, "close", None)
+        if close:
+            close()
+
+    @property
+    def traversal_active(self) -> bool:
+        return self._traversal_steps is not None
+
     # ---------- Internal helpers ----------
 
+    def _play_traversal_chunk(self):
+        if self._traversal_steps is None:
+            return
+        chunk = list(islice(self._traversal_steps, self._traversal_batch))
+        if not chunk:
+            self._finish_traversal()
+            return
+        self._restore_traversal_colors()
+        sequence = self.anim.sequential()
+        for node_id in chunk:
+            self._traversal_index += 1
+            item = self.node_items.get(node_id)
+            if item is None:
+                continue
+            original_color = QColor(item.fillColor)
+            self._traversal_restore.append((item, original_color))
+            highlight = QColor("#ffd54f")
+            flash_in = self.anim.flash_brush(
+                setter=item.setFillColor,
+                start_color=original_color,
+                end_color=highlight,
+                duration=160,
+            )
+            flash_out = self.anim.flash_brush(
+                setter=item.setFillColor,
+                start_color=highlight,
+                end_color=original_color,
+                duration=160,
+            )
+            if self._traversal_on_visit:
+                flash_in.finished.connect(
+                    lambda index=self._traversal_index, visited=node_id, callback=self._traversal_on_visit: callback(
+                        index, visited
+                    )
+                )
+            sequence.addAnimation(flash_in)
+            sequence.addAnimation(flash_out)
+        sequence.addAnimation(self.anim.pause(1))
+        self._track_animation(sequence, finalizer=self._play_traversal_chunk)
+
+    def _finish_traversal(self):
+        steps = self._traversal_steps
+        on_finish = self._traversal_on_finish
+        self._traversal_steps = None
+        self._traversal_on_visit = None
+        self._traversal_on_finish = None
+        self._restore_traversal_colors()
+        close = getattr(steps, "close", None)
+        if close:
+            close()
+        if on_finish:
+            on_finish(self._traversal_index)
+
+    def _restore_traversal_colors(self):
+        # 动画被中途打断时把节点颜色复原
+        for item, color in reversed(self._traversal_restore):
+            if item and item.scene():
+                item.setFillColor(color)
+        self._traversal_restore.clear()
+
     def _show_not_found_message(self):
         parent = self._canvas.window() if self._canvas else None
         box = QMessageBox(parent)
@@ -310,116 +505,159 @@ class BSTView(BaseStructureView):
             self._show_not_found_message()
         self._finalize_snapshot(snapshot, positions)
 
+    def _finalize_query(self, snapshot, positions, restore_colors):
+        for item, color in restore_colors:
+            if item and item.scene():
+                item.setFillColor(color)
+        self._finalize_snapshot(snapshot, positions)
+
     def _create_node_item(self, node_id, value):
-        node_item = BSTNodeItem(node_id, value)
+        node_item = (self.node_item_class or BSTNodeItem)(node_id, value)
         node_item.contextDelete.connect(self.deleteRequested.emit)
         node_item.contextFind.connect(self.findRequested.emit)
         self.scene.addItem(node_item)
         self.node_items[node_id] = node_item
         return node_item
 
+    def _decorate_node(self, node_item, info):
+        """按快照中的额外字段（高度、颜色等）更新节点外观；普通 BST 无需处理。"""
+
+    # ---------- Rotation replay ----------
+
+    def _plan_rotation_stages(self, rotations):
+        """
+        拆分模型的结构日志：返回 (首个旋转之前的快照, 工作结构, 旋转记录)。
+        没有旋转时返回 (None, None, [])，调用方按原来的单阶段流程处理。
+        """
+        if not rotations or all(entry["kind"] == "splice" for entry in rotations):
+            return None, None, []
+        work = {info["id"]: info for info in self._last_snapshot.get("nodes", [])}
+        root = self._last_snapshot.get("root")
+        index = 0
+        while index < len(rotations) and rotations[index]["kind"] == "splice":
+            root = self._apply_structure_entry(work, rotations[index])
+            index += 1
+        stage_snapshot = {"root": root, "nodes": list(work.values())}
+        return stage_snapshot, work, rotations[index:]
+
+    @staticmethod
+    def _apply_structure_entry(work, entry):
+        # 替换而不是原地修改，已生成的阶段快照保持不变
+        for node_id, info in entry["links"].items():
+            work[node_id] = dict(info)
+        removed = entry.get("removed")
+        if removed is not None:
+            work.pop(removed, None)
+        return entry["root"]
+
+    def _animate_rotation_stages(self, work, stages, positions):
+        """
+        逐个回放旋转：高亮旋转的两个节点 → 局部改连线 → 受影响节点移动到新位置。
+        positions 会被更新为最终坐标，供 finalize 使用。
+        """
+        sequence = self.anim.sequential()
+        for entry in stages:
+            root = self._apply_structure_entry(work, entry)
+            changes = self._layout_engine.update(mapping_links(work), root, entry["links"].keys(), len(work))
+            targets = self._positions_from_layout(changes)
+            positions.update(targets)
+
+            flashes = []
+            for node_id in (entry.get("pivot"), entry.get("child")):
+                item = self.node_items.get(node_id)
+                if item is None:
+                    continue
+                flashes.append(
+                    self.anim.flash_brush(
+                        setter=item.setFillColor,
+                        start_color=QColor(item.fillColor),
+                        end_color=QColor("#ffb74d"),
+                        duration=200,
+                        loops=2,
+                    )
+                )
+            if flashes:
+                sequence.addAnimation(self.anim.parallel(*flashes))
+
+            relink = self.anim.pause(1)
+            relink.finished.connect(lambda links=entry["links"]: self._relink_edges(links))
+            sequence.addAnimation(relink)
+
+            moves = self._animate_relayout(None, targets)
+            if moves:
+                sequence.addAnimation(moves)
+        return sequence
+
+    def _relink_edges(self, links):
+        """只替换 links 中节点发出的连线，其余连线保持不动。"""
+        for parent_id, info in links.items():
+            node_item = self.node_items.get(parent_id)
+            if node_item is not None:
+                self._decorate_node(node_item, info)
+            wanted = {info["left"], info["right"]} - {None}
+            for key in [key for key in self.edge_items if key[0] == parent_id]:
+                if key[1] not in wanted:
+                    self._remove_edge(key)
+            for child_id in wanted:
+                if (parent_id, child_id) not in self.edge_items:
+                    self._add_edge(parent_id, child_id)
+
     def _compute_layout(self, snapshot):
         """
-        使用基于子树宽度的布局算法，确保：
-        1. 父节点始终位于其所有子节点的水平中心
+        使用 core.tree_layout 的迭代式 Reingold–Tilford 布局全量重排，确保：
+        1. 父节点始终位于其子节点的水平中心
         2. 左子树完全在父节点左侧，右子树完全在父节点右侧
-        3. 不会出现连线向内凹的情况
+        3. 退化树（有序输入）也不会触发递归深度限制
         """
-        root_id = snapshot.get("root")
-        if root_id is None:
+        if snapshot.get("root") is None:
+            self._layout_engine.reset()
             return {}
+        layout = self._layout_engine.rebuild(snapshot)
+        return self._positions_from_layout(layout)
 
-        tree = {node["id"]: node for node in snapshot["nodes"]}
-        positions: Dict[int, QPointF] = {}
-
-        h_gap = 90  # 相邻节点之间的最小水平间距（增大以使连线角度更大）
-        v_gap = 130  # 垂直层级间距（减小以使连线角度更大）
-        node_width = BSTNodeItem.width
-        min_horizontal_offset = 60  # 单子节点时的最小水平偏移量
-
-        # 第一步：计算每个子树的宽度（以节点数量为基础）
-        subtree_width: Dict[int, float] = {}
-
-        def compute_width(node_id: Optional[int]) -> float:
-            if node_id is None:
-                return 0
-            node = tree.get(node_id)
-            if node is None:
-                return 0
-
-            left_width = compute_width(node["left"])
-            right_width = compute_width(node["right"])
-
-            # 子树宽度 = 左子树宽度 + 右子树宽度 + 节点本身占用的空间
-            if left_width == 0 and right_width == 0:
-                width = node_width
-            else:
-                width = left_width + right_width
-                if left_width > 0 and right_width > 0:
-                    width += h_gap
-                elif left_width == 0 and right_width > 0:
-                    width = max(node_width / 2 + min_horizontal_offset, right_width + node_width / 2 + h_gap / 2)
-                elif right_width == 0 and left_width > 0:
-                    width = max(node_width / 2 + min_horizontal_offset, left_width + node_width / 2 + h_gap / 2)
-
-            subtree_width[node_id] = width
-            return width
-
-        compute_width(root_id)
-
-        # 第二步：根据子树宽度分配位置
-        def assign_positions(node_id: Optional[int], x_center: float, depth: int):
-            if node_id is None:
-                return
-            node = tree.get(node_id)
-            if node is None:
-                return
-
-            y = depth * v_gap
-            positions[node_id] = QPointF(x_center - node_width / 2, y)
-
-            left_id = node["left"]
-            right_id = node["right"]
-            left_w = subtree_width.get(left_id, 0) if left_id else 0
-            right_w = subtree_width.get(right_id, 0) if right_id else 0
-
-            if left_id is not None and right_id is not None:
-                # 两个子节点都存在
-                left_center = x_center - h_gap / 2 - left_w / 2
-                right_center = x_center + h_gap / 2 + right_w / 2
-                assign_positions(left_id, left_center, depth + 1)
-                assign_positions(right_id, right_center, depth + 1)
-            elif left_id is not None:
-                # 只有左子节点：使用较大的水平偏移
-                left_center = x_center - min_horizontal_offset
-                assign_positions(left_id, left_center, depth + 1)
-            elif right_id is not None:
-                # 只有右子节点：使用较大的水平偏移
-                right_center = x_center + min_horizontal_offset
-                assign_positions(right_id, right_center, depth + 1)
-
-        assign_positions(root_id, 0, 0)
-
-        # 第三步：调整垂直偏移
-        if positions:
-            min_y = min(p.y() for p in positions.values())
-            for node_id in positions:
-                positions[node_id] = QPointF(
-                    positions[node_id].x(),
-                    positions[node_id].y() - min_y - 40
-                )
+    def _update_layout(self, snapshot, touched_ids, work=None):
+        """
+        增量布局：只重排 touched_ids 的祖先链，返回新节点及坐标实际变化的节点。
+        孩子指针从模型按需读取（旋转回放时读取 work 中旋转前的结构），不为整份快照重建索引。
+        """
+        if work is not None:
+            links, size = mapping_links(work), len(work)
+        elif self._node_links is not None:
+            links, size = self._node_links, self._node_count()
+        else:
+            nodes_by_id = {info["id"]: info for info in snapshot["nodes"]}
+            links, size = mapping_links(nodes_by_id), len(nodes_by_id)
+        changes = self._layout_engine.update(links, snapshot.get("root"), touched_ids, size)
+        return self._positions_from_layout(changes)
+
+    def _positions_from_layout(self, layout):
+        return {
+            node_id: self._layout_to_point(x, depth)
+            for node_id, (x, depth) in layout.items()
+        }
+
+    def _layout_point(self, node_id) -> Optional[QPointF]:
+        position = self._layout_engine.position(node_id)
+        if position is None:
+            return None
+        return self._layout_to_point(*position)
 
-        return positions
+    def _layout_to_point(self, x, depth) -> QPointF:
+        return QPointF(
+            x - BSTNodeItem.width / 2,
+            depth * self._layout_level_gap + self._layout_top,
+        )
 
-    def _level_order(self, snapshot):
+    def _level_order(self, snapshot, tree=None):
         root_id = snapshot.get("root")
         if root_id is None:
             return []
-        tree = {node["id"]: node for node in snapshot["nodes"]}
-        queue = [root_id]
+        if tree is None:
+            tree = {node["id"]: node for node in snapshot["nodes"]}
+        queue = deque([root_id])
         order = []
         while queue:
-            node_id = queue.pop(0)
+            node_id = queue.popleft()
             order.append(node_id)
             node = tree[node_id]
             if node["left"] is not None:
@@ -466,10 +704,10 @@ class BSTView(BaseStructureView):
             return None
         skip_ids = skip_ids or set()
         motions = []
-        for node_id, item in self.node_items.items():
-            if node_id in skip_ids or node_id not in positions:
+        for node_id, target in positions.items():
+            item = self.node_items.get(node_id)
+            if item is None or node_id in skip_ids:
                 continue
-            target = positions[node_id]
             motions.append(self.anim.move_item(item, target, duration=480))
         if not motions:
             return None
@@ -490,12 +728,16 @@ class BSTView(BaseStructureView):
 
         for info in snapshot["nodes"]:
             node_item = self.node_items.get(info["id"])
+            target = positions.get(info["id"]) if positions else None
             if not node_item:
                 node_item = self._create_node_item(info["id"], info["value"])
                 node_item.setOpacity(1.0)
+                if target is None:
+                    target = self._layout_point(info["id"])
             node_item.set_value(info["value"])
-            if positions and info["id"] in positions:
-                node_item.setPos(positions[info["id"]])
+            self._decorate_node(node_item, info)
+            if target is not None:
+                node_item.setPos(target)
 
         self._last_snapshot = snapshot
         self._rebuild_edges(snapshot)
@@ -535,24 +777,49 @@ class BSTView(BaseStructureView):
         self._finalize_snapshot(snapshot, positions, removed_id)
 
     def _rebuild_edges(self, snapshot):
-        for edge in list(self.edge_items.values()):
-            self.scene.removeItem(edge)
-        self.edge_items.clear()
-
+        """
+        按 (parent_id, child_id) 与快照做差分：只删除失效的连线、补上新增的连线，
+        节点图元被重建过的连线改为重新绑定，其余连线原样保留。
+        """
+        wanted = set()
         for info in snapshot["nodes"]:
             parent_id = info["id"]
             for child_key in ("left", "right"):
                 child_id = info[child_key]
-                if child_id is None:
-                    continue
-                parent_item = self.node_items.get(parent_id)
-                child_item = self.node_items.get(child_id)
-                if not parent_item or not child_item:
-                    continue
-                edge = BSTEdgeItem(parent_item, child_item)
-                edge.setZValue(0)
-                self.scene.addItem(edge)
-                self.edge_items[(parent_id, child_id)] = edge
+                if child_id is not None:
+                    wanted.add((parent_id, child_id))
+
+        for key in [key for key in self.edge_items if key not in wanted]:
+            self._remove_edge(key)
+
+        for key in wanted:
+            parent_item = self.node_items.get(key[0])
+            child_item = self.node_items.get(key[1])
+            edge = self.edge_items.get(key)
+            if edge is None:
+                self._add_edge(*key)
+            elif not parent_item or not child_item:
+                self._remove_edge(key)
+            elif edge.parent_item is not parent_item or edge.child_item is not child_item:
+                edge.rebind(parent_item, child_item)
+
+    def _add_edge(self, parent_id, child_id):
+        parent_item = self.node_items.get(parent_id)
+        child_item = self.node_items.get(child_id)
+        if not parent_item or not child_item:
+            return None
+        edge = BSTEdgeItem(parent_item, child_item)
+        self.track_item(edge, edge.detach)
+        edge.setZValue(0)
+        self.scene.addItem(edge)
+        self.edge_items[(parent_id, child_id)] = edge
+        return edge
+
+    def _remove_edge(self, key):
+        edge = self.edge_items.pop(key, None)
+        if edge is None:
+            return
+        self.release_item(edge)
 
     def _derive_insert_path(self, tree, root_id, inserted_id, inserted_value, fallback_path):
         if not root_id or root_id not in tree:
@@ -748,7 +1015,7 @@ class BSTView(BaseStructureView):
             for node in list(self.node_items.values()):
                 self.scene.removeItem(node)
             for edge in list(self.edge_items.values()):
-                self.scene.removeItem(edge)
+                self.release_item(edge)
             self.node_items.clear()
             self.edge_items.clear()
 
@@ -841,6 +1108,23 @@ class BSTEdgeItem(QGraphicsPathItem):
         self.child_item.positionChanged.connect(self.update_geometry)
         self.update_geometry()
 
+    def rebind(self, parent_item: BSTNodeItem, child_item: BSTNodeItem):
+        """换绑到新的节点图元，复用已有的连线对象。"""
+        self.detach()
+        self.parent_item = parent_item
+        self.child_item = child_item
+        self.parent_item.positionChanged.connect(self.update_geometry)
+        self.child_item.positionChanged.connect(self.update_geometry)
+        self.update_geometry()
+
+    def detach(self):
+        for item in (self.parent_item, self.child_item):
+            try:
+                item.positionChanged.disconnect(self.update_geometry)
+            except (RuntimeError, TypeError):
+                # 节点图元已被销毁或信号未连接
+                pass
+
     def update_geometry(self):
         start = self._center(self.parent_item)
         end = self._center(self.child_item)
@@ -0,0 +1,194 @@
+from typing import List, Optional, Tuple
+
+from bst.balanced_model import BalancedBSTModel
+
+RED = "red"
+BLACK = "black"
+
+
+class RedBlackModel(BalancedBSTModel):
+    """
+    红黑树：节点带 ``color``，不存父指针，修复过程沿搜索路径得到的祖先栈进行。
+    insert / delete 与 BSTModel 返回相同的 (node_id, path)，旋转记录在 ``rotations``。
+    """
+
+    _EXTRA_FIELDS = ("color",)
+
+    def _make_node(self, value):
+        node = super()._make_node(value)
+        node["color"] = RED
+        return node
+
+    def _color(self, node_id: Optional[int]) -> str:
+        return self._nodes[node_id]["color"] if node_id is not None else BLACK
+
+    # ---------- 插入 ----------
+
+    def _insert(self, value) -> Tuple[int, List[int]]:
+        node_id, path, direction = self._attach_leaf(value)
+        if direction is not None:
+            self._insert_fixup(node_id, list(path))
+        return node_id, path
+
+    def _insert_fixup(self, z: int, stack: List[int]):
+        """stack 为 z 的祖先（自根向下）。"""
+        nodes = self._nodes
+        while stack and self._color(stack[-1]) == RED:
+            p = stack[-1]
+            g = stack[-2]  # 红色父节点必不是根
+            gg = stack[-3] if len(stack) >= 3 else None
+            if p == nodes[g]["left"]:
+                uncle = nodes[g]["right"]
+                if self._color(uncle) == RED:
+                    nodes[p]["color"] = BLACK
+                    nodes[uncle]["color"] = BLACK
+                    nodes[g]["color"] = RED
+                    z = g
+                    stack.pop()
+                    stack.pop()
+                    continue
+                if z == nodes[p]["right"]:
+                    self._rotate_left(p, g)
+                    z, p = p, z
+                nodes[p]["color"] = BLACK
+                nodes[g]["color"] = RED
+                self._rotate_right(g, gg)
+            else:
+                uncle = nodes[g]["left"]
+                if self._color(uncle) == RED:
+                    nodes[p]["color"] = BLACK
+                    nodes[uncle]["color"] = BLACK
+                    nodes[g]["color"] = RED
+                    z = g
+                    stack.pop()
+                    stack.pop()
+                    continue
+                if z == nodes[p]["left"]:
+                    self._rotate_right(p, g)
+                    z, p = p, z
+                nodes[p]["color"] = BLACK
+                nodes[g]["color"] = RED
+                self._rotate_left(g, gg)
+            break
+        nodes[self._root]["color"] = BLACK
+
+    # ---------- 删除 ----------
+
+    def _delete(self, value) -> Tuple[Optional[int], List[int]]:
+        nodes = self._nodes
+        removed_id, path, removed, chain, x_id, succ_id = self._splice_out(value)
+        if removed_id is None:
+            return None, path
+
+        if succ_id is not None:
+            # 后继顶替被删节点的位置并继承其颜色，真正“消失”的是后继原来的颜色
+            lost_color = nodes[succ_id]["color"]
+            nodes[succ_id]["color"] = removed["color"]
+        else:
+            lost_color = removed["color"]
+
+        if lost_color == BLACK:
+            self._delete_fixup(x_id, list(chain))
+        return removed_id, path
+
+    def _delete_fixup(self, x: Optional[int], stack: List[int]):
+        """stack 为 x 的祖先（自根向下）；x 可能为空叶子。"""
+        nodes = self._nodes
+        while stack and self._color(x) == BLACK:
+            p = stack[-1]
+            grand = stack[-2] if len(stack) >= 2 else None
+            if x == nodes[p]["left"]:
+                w = nodes[p]["right"]
+                if self._color(w) == RED:
+                    nodes[w]["color"] = BLACK
+                    nodes[p]["color"] = RED
+                    self._rotate_left(p, grand)
+                    stack.insert(len(stack) - 1, w)
+                    grand = w
+                    w = nodes[p]["right"]
+                if self._color(nodes[w]["left"]) == BLACK and self._color(nodes[w]["right"]) == BLACK:
+                    nodes[w]["color"] = RED
+                    x = p
+                    stack.pop()
+                    continue
+                if self._color(nodes[w]["right"]) == BLACK:
+                    nodes[nodes[w]["left"]]["color"] = BLACK
+                    nodes[w]["color"] = RED
+                    self._rotate_right(w, p)
+                    w = nodes[p]["right"]
+                nodes[w]["color"] = nodes[p]["color"]
+                nodes[p]["color"] = BLACK
+                nodes[nodes[w]["right"]]["color"] = BLACK
+                self._rotate_left(p, grand)
+            else:
+                w = nodes[p]["left"]
+                if self._color(w) == RED:
+                    nodes[w]["color"] = BLACK
+                    nodes[p]["color"] = RED
+                    self._rotate_right(p, grand)
+                    stack.insert(len(stack) - 1, w)
+                    grand = w
+                    w = nodes[p]["left"]
+                if self._color(nodes[w]["left"]) == BLACK and self._color(nodes[w]["right"]) == BLACK:
+                    nodes[w]["color"] = RED
+                    x = p
+                    stack.pop()
+                    continue
+                if self._color(nodes[w]["left"]) == BLACK:
+                    nodes[nodes[w]["right"]]["color"] = BLACK
+                    nodes[w]["color"] = RED
+                    self._rotate_left(w, p)
+                    w = nodes[p]["left"]
+                nodes[w]["color"] = nodes[p]["color"]
+                nodes[p]["color"] = BLACK
+                nodes[nodes[w]["left"]]["color"] = BLACK
+                self._rotate_right(p, grand)
+            x = self._root
+            break
+        if x is not None:
+            nodes[x]["color"] = BLACK
+
+    # ---------- 平衡信息 ----------
+
+    def _assign_balance_info(self):
+        # 完全平衡树：除最底层未满时该层涂红外，其余全部为黑
+        count = len(self._nodes)
+        full_levels = (count + 1).bit_length() - 1
+        for node_id, depth in self._depths().items():
+            self._nodes[node_id]["color"] = RED if depth >= full_levels else BLACK
+
+    def _restore_balance_info(self, snapshot) -> bool:
+        nodes = self._nodes
+        if any(node.get("color") not in (RED, BLACK) for node in nodes.values()):
+            return False
+        if self._color(self._root) != BLACK:
+            return False
+        black_height = {}
+        for node_id in reversed(self._preorder_ids()):
+            node = nodes[node_id]
+            heights = []
+            for child in (node["left"], node["right"]):
+                if child is None:
+                    heights.append(0)
+                    continue
+                if node["color"] == RED and nodes[child]["color"] == RED:
+                    return False
+                heights.append(black_height[child])
+            if heights[0] != heights[1]:
+                return False
+            black_height[node_id] = heights[0] + (1 if node["color"] == BLACK else 0)
+        return True
+
+    def _depths(self):
+        depths = {}
+        if self._root is None:
+            return depths
+        stack = [(self._root, 0)]
+        while stack:
+            node_id, depth = stack.pop()
+            depths[node_id] = depth
+            node = self._nodes[node_id]
+            for child in (node["left"], node["right"]):
+                if child is not None:
+                    stack.append((child, depth + 1))
+        return depths
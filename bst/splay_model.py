@@ -0,0 +1,74 @@
+from typing import List, Optional, Tuple
+
+from bst.balanced_model import BalancedBSTModel
+
+
+class SplayModel(BalancedBSTModel):
+    """
+    伸展树：每次访问后把访问到的节点自底向上伸展到根（zig / zig-zig / zig-zag），
+    热点键会停留在根附近。find 也会改变结构，旋转同样记录在 ``rotations``。
+    删除采用普通 BST 摘除后伸展被删位置的父节点。
+    """
+
+    # ---------- Subclass hooks ----------
+
+    def _insert(self, value) -> Tuple[int, List[int]]:
+        node_id, path, direction = self._attach_leaf(value)
+        if direction is None:
+            # 重复值：伸展已有节点
+            self._splay(node_id, path[:-1])
+        else:
+            self._splay(node_id, list(path))
+        return node_id, path
+
+    def _delete(self, value) -> Tuple[Optional[int], List[int]]:
+        removed_id, path, _removed, chain, _x_id, _succ_id = self._splice_out(value)
+        if removed_id is not None and chain:
+            self._splay(chain[-1], chain[:-1])
+        return removed_id, path
+
+    def _after_find(self, node_id: Optional[int], path: List[int]):
+        # 未命中时伸展最后访问的节点
+        target = node_id if node_id is not None else (path[-1] if path else None)
+        if target is not None:
+            self._splay(target, path[:-1])
+
+    def _restore_balance_info(self, snapshot) -> bool:
+        # 任意形状的 BST 都是合法的伸展树
+        return True
+
+    # ---------- Splaying ----------
+
+    def _splay(self, x: int, ancestors: List[int]):
+        """ancestors 为 x 的祖先（自根向下），伸展结束后 x 成为根。"""
+        nodes = self._nodes
+        ancestors = list(ancestors)
+        while ancestors:
+            p = ancestors.pop()
+            x_is_left = nodes[p]["left"] == x
+            if not ancestors:
+                # zig
+                if x_is_left:
+                    self._rotate_right(p, None)
+                else:
+                    self._rotate_left(p, None)
+                break
+            g = ancestors.pop()
+            gg = ancestors[-1] if ancestors else None
+            p_is_left = nodes[g]["left"] == p
+            if x_is_left == p_is_left:
+                # zig-zig：先转祖父，再转父节点
+                if x_is_left:
+                    self._rotate_right(g, gg)
+                    self._rotate_right(p, gg)
+                else:
+                    self._rotate_left(g, gg)
+                    self._rotate_left(p, gg)
+            else:
+                # zig-zag：先转父节点，再转祖父
+                if x_is_left:
+                    self._rotate_right(p, g)
+                    self._rotate_left(g, gg)
+                else:
+                    self._rotate_left(p, g)
+                    self._rotate_right(g, gg)
@@ -0,0 +1,94 @@
+import random
+from typing import List, Optional, Tuple
+
+from bst.balanced_model import BalancedBSTModel
+
+
+class TreapModel(BalancedBSTModel):
+    """
+    Treap：键满足 BST 次序，随机优先级 ``priority`` 满足大根堆次序。
+    插入后沿路径上旋；删除先做普通 BST 摘除，再把顶替上来的后继下沉。
+    """
+
+    _EXTRA_FIELDS = ("priority",)
+    # 优先级取自 2**31 大小的范围，节点数很多时也几乎不会出现并列
+    PRIORITY_RANGE = 1 << 31
+
+    def __init__(self, seed: Optional[int] = None):
+        self._rng = random.Random(seed)
+        super().__init__()
+
+    def _make_node(self, value):
+        node = super()._make_node(value)
+        node["priority"] = self._rng.randrange(1, self.PRIORITY_RANGE)
+        return node
+
+    def _priority(self, node_id: Optional[int]) -> int:
+        return self._nodes[node_id]["priority"] if node_id is not None else 0
+
+    # ---------- Subclass hooks ----------
+
+    def _insert(self, value) -> Tuple[int, List[int]]:
+        node_id, path, direction = self._attach_leaf(value)
+        if direction is None:
+            return node_id, path
+        nodes = self._nodes
+        ancestors = list(path)
+        while ancestors and nodes[node_id]["priority"] > self._priority(ancestors[-1]):
+            parent_id = ancestors.pop()
+            grand_id = ancestors[-1] if ancestors else None
+            if nodes[parent_id]["left"] == node_id:
+                self._rotate_right(parent_id, grand_id)
+            else:
+                self._rotate_left(parent_id, grand_id)
+        return node_id, path
+
+    def _delete(self, value) -> Tuple[Optional[int], List[int]]:
+        removed_id, path, _removed, chain, _x_id, succ_id = self._splice_out(value)
+        if succ_id is not None:
+            # 后继位于 chain 中 ancestors 之后一位
+            index = chain.index(succ_id)
+            self._sift_down(succ_id, chain[index - 1] if index > 0 else None)
+        return removed_id, path
+
+    def _sift_down(self, node_id: int, parent_id: Optional[int]):
+        nodes = self._nodes
+        while True:
+            node = nodes[node_id]
+            left_priority = self._priority(node["left"])
+            right_priority = self._priority(node["right"])
+            if max(left_priority, right_priority) <= node["priority"]:
+                return
+            if left_priority >= right_priority:
+                parent_id = self._rotate_right(node_id, parent_id)
+            else:
+                parent_id = self._rotate_left(node_id, parent_id)
+
+    def _assign_balance_info(self):
+        # 按层序分配降序的随机优先级，保证堆次序
+        order: List[int] = []
+        queue = [self._root] if self._root is not None else []
+        while queue:
+            order.extend(queue)
+            queue = [
+                child
+                for node_id in queue
+                for child in (self._nodes[node_id]["left"], self._nodes[node_id]["right"])
+                if child is not None
+            ]
+        priorities = sorted(
+            (self._rng.randrange(1, self.PRIORITY_RANGE) for _ in order),
+            reverse=True,
+        )
+        for node_id, priority in zip(order, priorities):
+            self._nodes[node_id]["priority"] = priority
+
+    def _restore_balance_info(self, snapshot) -> bool:
+        nodes = self._nodes
+        if any(not isinstance(node.get("priority"), int) for node in nodes.values()):
+            return False
+        return all(
+            self._priority(child) <= node["priority"]
+            for node in nodes.values()
+            for child in (node["left"], node["right"])
+        )
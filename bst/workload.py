@@ -0,0 +1,82 @@
+"""
+访问负载生成器：为 BST 系列模型生成查找键序列，用于在同一条访问轨迹上
+比较普通 BST、平衡树、伸展树与 Treap 的平均路径长度。
+
+所有生成器都是惰性的，不会物化整条轨迹。
+"""
+
+import bisect
+import itertools
+import random
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+WORKLOAD_KINDS = ("uniform", "zipf", "sequential")
+
+
+def uniform_keys(keys: Sequence, count: int, seed: Optional[int] = None) -> Iterator:
+    """均匀随机访问。"""
+    if not keys:
+        return
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield keys[rng.randrange(len(keys))]
+
+
+def zipf_keys(
+    keys: Sequence,
+    count: int,
+    exponent: float = 1.1,
+    seed: Optional[int] = None,
+    shuffle: bool = True,
+) -> Iterator:
+    """
+    Zipf 分布访问：第 r 热的键被访问的概率正比于 1 / r^exponent。
+    shuffle 为 True 时热度排名随机分配，避免热点恰好集中在最小的键上。
+    """
+    if not keys:
+        return
+    rng = random.Random(seed)
+    ranked = list(keys)
+    if shuffle:
+        rng.shuffle(ranked)
+    cumulative = list(itertools.accumulate(1.0 / (rank ** exponent) for rank in range(1, len(ranked) + 1)))
+    total = cumulative[-1]
+    for _ in range(count):
+        yield ranked[bisect.bisect_left(cumulative, rng.random() * total)]
+
+
+def sequential_keys(keys: Sequence, count: int) -> Iterator:
+    """按键的升序循环访问。"""
+    if not keys:
+        return
+    ordered = sorted(keys)
+    for index in range(count):
+        yield ordered[index % len(ordered)]
+
+
+def generate_workload(kind: str, keys: Sequence, count: int, seed: Optional[int] = None, **options) -> Iterator:
+    if kind == "uniform":
+        return uniform_keys(keys, count, seed=seed)
+    if kind == "zipf":
+        return zipf_keys(keys, count, seed=seed, **options)
+    if kind == "sequential":
+        return sequential_keys(keys, count)
+    raise ValueError(f"unknown workload kind: {kind}")
+
+
+def run_trace(models: Dict[str, object], trace: Iterable) -> Dict[str, float]:
+    """
+    在若干模型上依次执行同一条查找轨迹，返回各模型本轮的平均路径长度。
+    轨迹只遍历一次，每个键依次交给所有模型。
+    """
+    start = {name: (model.comparisons, model.operations) for name, model in models.items()}
+    items: List = list(models.items())
+    for key in trace:
+        for _name, model in items:
+            model.find(key)
+    result = {}
+    for name, model in items:
+        comparisons = model.comparisons - start[name][0]
+        operations = model.operations - start[name][1]
+        result[name] = comparisons / operations if operations else 0.0
+    return result
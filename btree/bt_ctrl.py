@@ -0,0 +1,304 @@
+import re
+from typing import Optional
+
+from PyQt5.QtWidgets import (
+    QCheckBox,
+    QFormLayout,
+    QGridLayout,
+    QGroupBox,
+    QHBoxLayout,
+    QInputDialog,
+    QLabel,
+    QLineEdit,
+    QMessageBox,
+    QPushButton,
+    QSpinBox,
+    QVBoxLayout,
+    QWidget,
+)
+
+from btree.bt_model import STAT_KEYS, BTreeModel
+from btree.bt_view import BTreeView
+from core.global_ctrl import GlobalController
+
+
+class BTreeController(QWidget):
+    """
+    B 树 / B+ 树操作面板：阶数与树类型、批量装载、插入 / 删除 / 查找，
+    以及每次操作的模拟页读写统计。
+    """
+
+    display_name = "B-Tree"
+
+    def __init__(self, global_ctrl: GlobalController):
+        super().__init__()
+        self.model = BTreeModel(order=4)
+        self.view = BTreeView(global_ctrl)
+        self._panel_locked = False
+
+        self._build_inputs()
+        self.panel = self._create_panel()
+
+        self.view.interactionLocked.connect(self._on_lock_state)
+        self.view.clearAllRequested.connect(self._on_clear_all_requested)
+
+        self._refresh_inputs()
+
+    # ---------- UI 构建 ----------
+
+    def _build_inputs(self):
+        self.order_spin = QSpinBox()
+        self.order_spin.setRange(3, 64)
+        self.order_spin.setValue(self.model.order)
+
+        self.plus_check = QCheckBox("B+ tree")
+        self.plus_check.setStyleSheet("color: white;")
+
+        self.fill_spin = QSpinBox()
+        self.fill_spin.setRange(50, 100)
+        self.fill_spin.setSuffix(" %")
+        self.fill_spin.setValue(100)
+
+        self.insert_value_edit = QLineEdit()
+        self.insert_value_edit.setPlaceholderText("Value")
+        self.insert_value_edit.returnPressed.connect(self._on_insert)
+
+        self.delete_value_edit = QLineEdit()
+        self.delete_value_edit.setPlaceholderText("Value")
+        self.delete_value_edit.returnPressed.connect(self._on_delete)
+
+        self.find_value_edit = QLineEdit()
+        self.find_value_edit.setPlaceholderText("Value")
+        self.find_value_edit.returnPressed.connect(self._on_find)
+
+    def _create_panel(self):
+        container = QWidget()
+        layout = QGridLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setHorizontalSpacing(12)
+        layout.setVerticalSpacing(12)
+        layout.setColumnStretch(0, 1)
+        layout.setColumnStretch(1, 1)
+
+        # Page settings
+        page_group = self._form_group("Pages")
+        page_layout = page_group.layout()
+        apply_btn = QPushButton("Apply")
+        apply_btn.clicked.connect(self._on_apply_settings)
+        page_layout.addRow("Order:", self._inline_row(self.order_spin, self.plus_check))
+        page_layout.addRow(apply_btn)
+        layout.addWidget(page_group, 0, 0)
+
+        # Bulk load
+        create_group = self._form_group("Create")
+        create_layout = create_group.layout()
+        create_btn = QPushButton("Create From List")
+        create_btn.clicked.connect(self._on_create)
+        create_layout.addRow("Fill:", self.fill_spin)
+        create_layout.addRow(create_btn)
+        layout.addWidget(create_group, 0, 1)
+
+        # Insert
+        insert_group = self._form_group("Insert")
+        insert_btn = QPushButton("Insert")
+        insert_btn.clicked.connect(self._on_insert)
+        insert_group.layout().addRow("Value:", self.insert_value_edit)
+        insert_group.layout().addRow(insert_btn)
+        layout.addWidget(insert_group, 1, 0)
+
+        # Delete
+        delete_group = self._form_group("Delete")
+        delete_btn = QPushButton("Delete")
+        delete_btn.clicked.connect(self._on_delete)
+        delete_group.layout().addRow("Value:", self.delete_value_edit)
+        delete_group.layout().addRow(delete_btn)
+        layout.addWidget(delete_group, 1, 1)
+
+        # Find
+        find_group = self._form_group("Find")
+        find_btn = QPushButton("Find")
+        find_btn.clicked.connect(self._on_find)
+        find_group.layout().addRow("Value:", self.find_value_edit)
+        find_group.layout().addRow(find_btn)
+        layout.addWidget(find_group, 2, 0)
+
+        # Page I/O
+        stats_group = QGroupBox("Page I/O")
+        stats_group.setStyleSheet("QGroupBox { color: white; }")
+        stats_layout = QVBoxLayout(stats_group)
+        stats_layout.setContentsMargins(12, 8, 12, 12)
+        self.stats_label = QLabel()
+        self.stats_label.setStyleSheet("color: white;")
+        self.stats_label.setWordWrap(True)
+        stats_layout.addWidget(self.stats_label)
+        layout.addWidget(stats_group, 2, 1)
+
+        layout.setRowStretch(3, 1)
+
+        self.apply_btn = apply_btn
+        self.create_btn = create_btn
+        self.insert_btn = insert_btn
+        self.delete_btn = delete_btn
+        self.find_btn = find_btn
+        return container
+
+    @staticmethod
+    def _form_group(title):
+        group = QGroupBox(title)
+        group.setStyleSheet("QGroupBox { color: white; }")
+        form = QFormLayout()
+        form.setContentsMargins(12, 8, 12, 12)
+        form.setSpacing(6)
+        group.setLayout(form)
+        return group
+
+    @staticmethod
+    def _inline_row(*widgets):
+        row = QWidget()
+        hlayout = QHBoxLayout(row)
+        hlayout.setContentsMargins(0, 0, 0, 0)
+        hlayout.setSpacing(6)
+        for widget in widgets:
+            hlayout.addWidget(widget)
+        return row
+
+    def build_panel(self):
+        return self.panel
+
+    # ---------- 生命周期 ----------
+
+    def on_activate(self, graphics_view):
+        self.view.bind_canvas(graphics_view)
+        graphics_view.setScene(self.view.scene)
+
+    def on_deactivate(self):
+        pass
+
+    # ---------- 操作回调 ----------
+
+    def _on_apply_settings(self):
+        order = self.order_spin.value()
+        plus = self.plus_check.isChecked()
+        if order == self.model.order and plus == self.model.plus:
+            return
+        self.model.configure(order, plus)
+        self.view.reset()
+        self._refresh_inputs()
+
+    def _on_create(self):
+        text, ok = QInputDialog.getText(
+            self,
+            f"Create {self.display_name}",
+            "Enter values (comma-separated):",
+        )
+        if not ok:
+            return
+        try:
+            values = self._parse_sequence(text)
+        except ValueError:
+            QMessageBox.warning(self, "Invalid Value", "创建列表中每个元素都必须是数值。")
+            return
+        # 阶数 / 类型以面板当前设置为准
+        self.model.configure(self.order_spin.value(), self.plus_check.isChecked())
+        self.model.bulk_load(sorted(set(values)), fill=self.fill_spin.value() / 100.0)
+        snapshot = self.model.snapshot()
+        if snapshot["nodes"]:
+            self.view.animate_build(snapshot)
+        else:
+            self.view.reset()
+        self._refresh_inputs()
+
+    def _on_insert(self):
+        value = self._read_value(self.insert_value_edit, "插入")
+        if value is None:
+            return
+        _inserted, path = self.model.insert(value)
+        self.view.animate_operation(self.model.snapshot(), path)
+        self._refresh_inputs()
+
+    def _on_delete(self):
+        if self.model.length == 0:
+            return
+        value = self._read_value(self.delete_value_edit, "删除")
+        if value is None:
+            return
+        removed, path = self.model.delete(value)
+        self.view.animate_operation(self.model.snapshot(), path, found=None if removed else False)
+        self._refresh_inputs()
+
+    def _on_find(self):
+        if self.model.length == 0:
+            return
+        value = self._read_value(self.find_value_edit, "查找")
+        if value is None:
+            return
+        found, path = self.model.find(value)
+        self.view.animate_operation(self.model.snapshot(), path, found=found)
+        self._refresh_inputs()
+
+    def _on_clear_all_requested(self):
+        self.model.clear()
+        self.view.reset()
+        self._refresh_inputs()
+
+    def _read_value(self, edit: QLineEdit, action: str) -> Optional[object]:
+        raw = edit.text().strip()
+        if not raw:
+            QMessageBox.warning(self, "Missing Value", f"请先输入要{action}的值。")
+            return None
+        try:
+            return self._coerce_value(raw)
+        except ValueError:
+            QMessageBox.warning(self, "Invalid Value", f"{action}的值必须是数值。")
+            return None
+
+    @staticmethod
+    def _parse_sequence(text: str):
+        tokens = [part for part in re.split(r"[,\s]+", text.replace("，", ",")) if part]
+        return [BTreeController._coerce_value(token) for token in tokens]
+
+    @staticmethod
+    def _coerce_value(value):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+        try:
+            return float(value)
+        except ValueError:
+            raise ValueError("value is not numeric")
+
+    # ---------- 状态管理 ----------
+
+    def _stats_text(self) -> str:
+        last = self.model.last_stats
+        total = self.model.stats
+        rows = [f"{key}: {last[key]}（累计 {total[key]}）" for key in STAT_KEYS]
+        rows.append(f"height: {self.model.height()}  pages: {self.model.page_count}  keys: {self.model.length}")
+        return "\n".join(rows)
+
+    def _refresh_inputs(self):
+        has_keys = self.model.length > 0
+        state = self._panel_locked
+        for widget in (
+            self.apply_btn,
+            self.order_spin,
+            self.plus_check,
+            self.fill_spin,
+            self.create_btn,
+            self.insert_btn,
+            self.insert_value_edit,
+        ):
+            widget.setDisabled(state)
+        for widget in (
+            self.delete_btn,
+            self.delete_value_edit,
+            self.find_btn,
+            self.find_value_edit,
+        ):
+            widget.setDisabled(state or not has_keys)
+        self.stats_label.setText(self._stats_text())
+
+    def _on_lock_state(self, locked):
+        self._panel_locked = locked
+        self._refresh_inputs()
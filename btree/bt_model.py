@@ -0,0 +1,466 @@
+import bisect
+import itertools
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+STAT_KEYS = ("reads", "writes", "splits", "merges", "borrows")
+
+
+class BTreeModel:
+    """
+    B 树 / B+ 树数据模型，每个节点视为一页磁盘页。
+
+    ``order`` 为每页最多的孩子数（扇出），因此每页最多 ``order - 1`` 个键。
+    ``plus=True`` 时为 B+ 树：键只存放在叶子，内部节点只保存分隔键，叶子之间用 ``next`` 串联。
+
+    每次操作都会统计模拟的页读写次数以及分裂 / 合并 / 借键次数：
+    - 读：访问（加载）一个页，根页也算在内，不考虑缓存
+    - 写：本次操作中被修改或新建的页，同一页只记一次
+    结果写入 ``last_stats``，并累加到 ``stats``。
+    """
+
+    def __init__(self, order: int = 4, plus: bool = False):
+        if order < 3:
+            raise ValueError("B-tree order must be at least 3")
+        self.order = order
+        self.plus = plus
+        self._id_iter = itertools.count()
+        self._nodes: Dict[int, Dict[str, Any]] = {}
+        self._root: Optional[int] = None
+        self._count = 0
+        self.stats = dict.fromkeys(STAT_KEYS, 0)
+        self.last_stats = dict.fromkeys(STAT_KEYS, 0)
+        self._op: Dict[str, int] = {}
+        self._dirty: Set[int] = set()
+
+    # ---------- 基本属性 ----------
+
+    @property
+    def length(self) -> int:
+        """键的个数。"""
+        return self._count
+
+    @property
+    def page_count(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def max_keys(self) -> int:
+        return self.order - 1
+
+    def min_keys(self, node) -> int:
+        """非根节点的最少键数。"""
+        if self.plus and not node["children"]:
+            return self.order // 2
+        return (self.order + 1) // 2 - 1
+
+    def height(self) -> int:
+        height = 0
+        node_id = self._root
+        while node_id is not None:
+            height += 1
+            children = self._nodes[node_id]["children"]
+            node_id = children[0] if children else None
+        return height
+
+    def clear(self):
+        self._id_iter = itertools.count()
+        self._nodes = {}
+        self._root = None
+        self._count = 0
+        self.stats = dict.fromkeys(STAT_KEYS, 0)
+        self.last_stats = dict.fromkeys(STAT_KEYS, 0)
+
+    def configure(self, order: int, plus: bool):
+        """修改阶数或树的类型会清空当前内容。"""
+        if order < 3:
+            raise ValueError("B-tree order must be at least 3")
+        self.order = order
+        self.plus = plus
+        self.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "root": self._root,
+            "order": self.order,
+            "plus": self.plus,
+            "nodes": [
+                {
+                    "id": node["id"],
+                    "keys": list(node["keys"]),
+                    "children": list(node["children"]),
+                    "next": node["next"],
+                }
+                for node in self._nodes.values()
+            ],
+        }
+
+    # ---------- 查找 ----------
+
+    def find(self, key) -> Tuple[bool, List[int]]:
+        """返回 (是否找到, 读取过的页 id 列表)。"""
+        self._begin()
+        path: List[int] = []
+        node_id = self._root
+        found = False
+        while node_id is not None:
+            node = self._read(node_id, path)
+            keys = node["keys"]
+            if not node["children"]:
+                index = bisect.bisect_left(keys, key)
+                found = index < len(keys) and keys[index] == key
+                break
+            if self.plus:
+                node_id = node["children"][bisect.bisect_right(keys, key)]
+                continue
+            index = bisect.bisect_left(keys, key)
+            if index < len(keys) and keys[index] == key:
+                found = True
+                break
+            node_id = node["children"][index]
+        self._end()
+        return found, path
+
+    # ---------- 插入 ----------
+
+    def insert(self, key) -> Tuple[bool, List[int]]:
+        """返回 (是否插入了新键, 读取过的页 id 列表)；键已存在时不插入。"""
+        self._begin()
+        path: List[int] = []
+        if self._root is None:
+            leaf = self._new_node([key])
+            self._root = leaf["id"]
+            self._count += 1
+            self._end()
+            return True, path
+
+        node_id = self._root
+        while True:
+            node = self._read(node_id, path)
+            keys = node["keys"]
+            index = bisect.bisect_left(keys, key)
+            exists = index < len(keys) and keys[index] == key
+            if not node["children"]:
+                if exists:
+                    self._end()
+                    return False, path
+                keys.insert(index, key)
+                self._touch(node_id)
+                break
+            if exists and not self.plus:
+                self._end()
+                return False, path
+            node_id = node["children"][bisect.bisect_right(keys, key) if self.plus else index]
+
+        self._count += 1
+        # 自底向上处理溢出
+        for depth in range(len(path) - 1, -1, -1):
+            if len(self._nodes[path[depth]]["keys"]) <= self.max_keys:
+                break
+            self._split(path[depth], path[depth - 1] if depth > 0 else None)
+        self._end()
+        return True, path
+
+    def _split(self, node_id: int, parent_id: Optional[int]):
+        node = self._nodes[node_id]
+        keys = node["keys"]
+        mid = len(keys) // 2
+        if self.plus and not node["children"]:
+            # B+ 叶子分裂：右半边的首键复制到父节点
+            right = self._new_node(keys[mid:])
+            separator = right["keys"][0]
+            node["keys"] = keys[:mid]
+            right["next"] = node["next"]
+            node["next"] = right["id"]
+        else:
+            right = self._new_node(keys[mid + 1:], node["children"][mid + 1:])
+            separator = keys[mid]
+            node["keys"] = keys[:mid]
+            node["children"] = node["children"][:mid + 1]
+        self._touch(node_id)
+        self._op["splits"] += 1
+
+        if parent_id is None:
+            root = self._new_node([separator], [node_id, right["id"]])
+            self._root = root["id"]
+            return
+        parent = self._nodes[parent_id]
+        index = parent["children"].index(node_id)
+        parent["keys"].insert(index, separator)
+        parent["children"].insert(index + 1, right["id"])
+        self._touch(parent_id)
+
+    # ---------- 删除 ----------
+
+    def delete(self, key) -> Tuple[bool, List[int]]:
+        """返回 (是否删除, 读取过的页 id 列表)。"""
+        self._begin()
+        path: List[int] = []
+        node_id = self._root
+        while node_id is not None:
+            node = self._read(node_id, path)
+            keys = node["keys"]
+            index = bisect.bisect_left(keys, key)
+            exists = index < len(keys) and keys[index] == key
+            if not node["children"]:
+                if not exists:
+                    node_id = None
+                    break
+                keys.pop(index)
+                self._touch(node_id)
+                break
+            if self.plus:
+                node_id = node["children"][bisect.bisect_right(keys, key)]
+                continue
+            if exists:
+                # B 树内部节点：用前驱（左子树最大键）替换后从叶子删除
+                leaf_id = node["children"][index]
+                while True:
+                    leaf = self._read(leaf_id, path)
+                    if not leaf["children"]:
+                        break
+                    leaf_id = leaf["children"][-1]
+                keys[index] = leaf["keys"].pop()
+                self._touch(node_id)
+                self._touch(leaf_id)
+                node_id = leaf_id
+                break
+            node_id = node["children"][index]
+
+        if node_id is None:
+            self._end()
+            return False, path
+
+        self._count -= 1
+        self._fix_underflow(path)
+        self._end()
+        return True, path
+
+    def _fix_underflow(self, path: List[int]):
+        for depth in range(len(path) - 1, 0, -1):
+            node = self._nodes[path[depth]]
+            if len(node["keys"]) >= self.min_keys(node):
+                break
+            self._rebalance(path[depth], path[depth - 1])
+
+        root = self._nodes[self._root]
+        if not root["keys"]:
+            if root["children"]:
+                self._root = root["children"][0]
+            else:
+                self._root = None
+            self._free(root["id"])
+
+    def _rebalance(self, node_id: int, parent_id: int):
+        nodes = self._nodes
+        parent = nodes[parent_id]
+        node = nodes[node_id]
+        index = parent["children"].index(node_id)
+        is_leaf = not node["children"]
+
+        left_id = parent["children"][index - 1] if index > 0 else None
+        right_id = parent["children"][index + 1] if index + 1 < len(parent["children"]) else None
+        left = self._read(left_id) if left_id is not None else None
+        if left is not None and len(left["keys"]) > self.min_keys(left):
+            if self.plus and is_leaf:
+                node["keys"].insert(0, left["keys"].pop())
+                parent["keys"][index - 1] = node["keys"][0]
+            else:
+                node["keys"].insert(0, parent["keys"][index - 1])
+                parent["keys"][index - 1] = left["keys"].pop()
+                if not is_leaf:
+                    node["children"].insert(0, left["children"].pop())
+            self._touch(left_id, node_id, parent_id)
+            self._op["borrows"] += 1
+            return
+
+        right = self._read(right_id) if right_id is not None else None
+        if right is not None and len(right["keys"]) > self.min_keys(right):
+            if self.plus and is_leaf:
+                node["keys"].append(right["keys"].pop(0))
+                parent["keys"][index] = right["keys"][0]
+            else:
+                node["keys"].append(parent["keys"][index])
+                parent["keys"][index] = right["keys"].pop(0)
+                if not is_leaf:
+                    node["children"].append(right["children"].pop(0))
+            self._touch(right_id, node_id, parent_id)
+            self._op["borrows"] += 1
+            return
+
+        # 兄弟都处于下限：与兄弟合并，分隔键从父节点下移（B+ 叶子直接丢弃）
+        if left is not None:
+            self._merge(left_id, node_id, parent_id, index - 1)
+        else:
+            self._merge(node_id, right_id, parent_id, index)
+
+    def _merge(self, left_id: int, right_id: int, parent_id: int, separator_index: int):
+        nodes = self._nodes
+        left, right, parent = nodes[left_id], nodes[right_id], nodes[parent_id]
+        separator = parent["keys"].pop(separator_index)
+        parent["children"].pop(separator_index + 1)
+        if self.plus and not left["children"]:
+            left["keys"].extend(right["keys"])
+            left["next"] = right["next"]
+        else:
+            left["keys"].append(separator)
+            left["keys"].extend(right["keys"])
+            left["children"].extend(right["children"])
+        self._free(right_id)
+        self._touch(left_id, parent_id)
+        self._op["merges"] += 1
+
+    # ---------- 批量加载 ----------
+
+    def create_from_iterable(self, values: Iterable):
+        self.bulk_load(sorted(set(values)))
+
+    def bulk_load(self, sorted_keys: Iterable, fill: float = 1.0):
+        """
+        自底向上由有序键批量建树：先按填充率把键切成叶子页，再逐层向上建内部页，
+        每页只写一次。fill 为目标填充率（0.5 ~ 1.0），各页键数不低于下限。
+        """
+        keys = list(sorted_keys)
+        if any(keys[i] >= keys[i + 1] for i in range(len(keys) - 1)):
+            raise ValueError("bulk_load requires strictly increasing keys")
+        self.clear()
+        self._count = len(keys)
+        self._begin()
+        if keys:
+            target = max(1, min(self.max_keys, round(self.max_keys * fill)))
+            if self.plus:
+                children, separators = self._bulk_leaves_plus(keys, target)
+            else:
+                children, separators = self._bulk_level(keys, [], target)
+            while len(children) > 1:
+                children, separators = self._bulk_level(separators, children, target)
+            self._root = children[0]
+        self._end()
+
+    def _bulk_leaves_plus(self, keys: List, target: int):
+        min_leaf = self.order // 2
+        sizes = self._plan_sizes(len(keys), target, min_leaf, separators=False)
+        leaves: List[int] = []
+        position = 0
+        previous = None
+        for size in sizes:
+            leaf = self._new_node(keys[position:position + size])
+            position += size
+            if previous is not None:
+                previous["next"] = leaf["id"]
+            previous = leaf
+            leaves.append(leaf["id"])
+        separators = [self._nodes[leaf_id]["keys"][0] for leaf_id in leaves[1:]]
+        return leaves, separators
+
+    def _bulk_level(self, keys: List, children: List[int], target: int):
+        """
+        把 keys 切成若干页，页与页之间各留一个键上移。
+        children 非空时（内部层）第 i 页拿走与其键数 + 1 个连续的孩子。
+        """
+        sizes = self._plan_sizes(len(keys), target, (self.order + 1) // 2 - 1, separators=True)
+        pages: List[int] = []
+        promoted: List = []
+        position = 0
+        child_position = 0
+        for index, size in enumerate(sizes):
+            page_children = children[child_position:child_position + size + 1] if children else []
+            child_position += size + 1
+            page = self._new_node(keys[position:position + size], page_children)
+            position += size
+            pages.append(page["id"])
+            if index < len(sizes) - 1:
+                promoted.append(keys[position])
+                position += 1
+        return pages, promoted
+
+    def _plan_sizes(self, total: int, target: int, minimum: int, separators: bool) -> List[int]:
+        """
+        计算每页的键数：按 target 估算页数，再调整到每页键数落在 [minimum, max_keys]。
+        separators 为 True 时页与页之间各消耗一个键。
+        """
+        def usable(pages):
+            return total - (pages - 1) if separators else total
+
+        step = target + 1 if separators else target
+        pages = max(1, -(-(total + (1 if separators else 0)) // step))
+        while pages > 1 and usable(pages) < pages * minimum:
+            pages -= 1
+        while usable(pages) > pages * self.max_keys:
+            pages += 1
+        base, extra = divmod(usable(pages), pages)
+        return [base + 1] * extra + [base] * (pages - extra)
+
+    # ---------- 校验 ----------
+
+    def check_invariants(self):
+        """检查键序、页容量、叶子深度与 B+ 叶子链，出错时抛出 AssertionError。"""
+        if self._root is None:
+            assert self._count == 0
+            return
+        leaf_depths = set()
+        leaves: List[int] = []
+        stack = [(self._root, 0, None, None)]
+        total = 0
+        while stack:
+            node_id, depth, low, high = stack.pop()
+            node = self._nodes[node_id]
+            keys = node["keys"]
+            assert keys == sorted(keys) and len(set(keys)) == len(keys)
+            assert len(keys) <= self.max_keys
+            if node_id != self._root:
+                assert len(keys) >= self.min_keys(node), (node_id, keys)
+            for key in keys:
+                assert low is None or key >= low
+                assert high is None or key < high
+            if not node["children"]:
+                leaf_depths.add(depth)
+                leaves.append(node_id)
+                total += len(keys)
+                continue
+            assert len(node["children"]) == len(keys) + 1
+            if not self.plus:
+                total += len(keys)
+            bounds = [low] + keys + [high]
+            for index in range(len(node["children"]) - 1, -1, -1):
+                stack.append((node["children"][index], depth + 1, bounds[index], bounds[index + 1]))
+        assert len(leaf_depths) == 1
+        assert total == self._count
+        if self.plus:
+            chain = []
+            node_id = leaves[0] if leaves else None
+            while node_id is not None:
+                chain.append(node_id)
+                node_id = self._nodes[node_id]["next"]
+            assert chain == leaves
+
+    # ---------- Internal helpers ----------
+
+    def _new_node(self, keys: List, children: Optional[List[int]] = None) -> Dict[str, Any]:
+        node_id = next(self._id_iter)
+        node = {"id": node_id, "keys": list(keys), "children": list(children or []), "next": None}
+        self._nodes[node_id] = node
+        self._touch(node_id)
+        return node
+
+    def _free(self, node_id: int):
+        self._nodes.pop(node_id, None)
+        self._dirty.discard(node_id)
+
+    def _read(self, node_id: int, path: Optional[List[int]] = None):
+        self._op["reads"] += 1
+        if path is not None:
+            path.append(node_id)
+        return self._nodes[node_id]
+
+    def _touch(self, *node_ids: int):
+        self._dirty.update(node_ids)
+
+    def _begin(self):
+        self._op = dict.fromkeys(STAT_KEYS, 0)
+        self._dirty = set()
+
+    def _end(self):
+        self._op["writes"] = len(self._dirty)
+        self.last_stats = dict(self._op)
+        for key, value in self._op.items():
+            self.stats[key] += value
@@ -0,0 +1,423 @@
+from typing import Dict, List, Optional, Tuple
+
+from PyQt5.QtCore import QEvent, QPointF, QRectF, Qt, pyqtSignal
+from PyQt5.QtGui import QColor, QBrush, QPen, QPainterPath
+from PyQt5.QtWidgets import (
+    QGraphicsItem,
+    QGraphicsObject,
+    QGraphicsPathItem,
+    QMenu,
+)
+
+from core.base_view import BaseStructureView
+from core.tree_layout import packed_layout
+
+
+class BTreeView(BaseStructureView):
+    """
+    B 树 / B+ 树视图：每一页画成一排键格子。
+    每次操作分两段播放：
+    1. 依次闪烁读取过的页（即模拟的页读）；
+    2. 一次性切换到新结构：已有页移动到新位置，新页淡入，被释放的页淡出。
+    """
+
+    clearAllRequested = pyqtSignal()
+
+    READ_COLOR = QColor("#ffb74d")
+    HIT_COLOR = QColor("#66bb6a")
+    MISS_COLOR = QColor("#ff5252")
+
+    def __init__(self, global_ctrl):
+        super().__init__(global_ctrl)
+        self.scene.installEventFilter(self)
+
+        self.page_items: Dict[int, BTreePageItem] = {}
+        self.edge_items: Dict[Tuple[int, int], BTreeEdgeItem] = {}
+        self.link_items: Dict[Tuple[int, int], BTreeLinkItem] = {}
+        self._last_snapshot = {"root": None, "nodes": []}
+
+        self._layout_gap = 28
+        self._layout_level_gap = 110
+        self._layout_top = -40
+
+    # ---------- Public API ----------
+
+    def reset(self):
+        self.stop_all_animations()
+        self.clear_scene()
+        self.page_items.clear()
+        self.edge_items.clear()
+        self.link_items.clear()
+        self._last_snapshot = {"root": None, "nodes": []}
+
+    def animate_build(self, snapshot, speed_scale: float = 1.0):
+        """逐层落下所有页，用于批量装载后的整体展示。"""
+        self.reset()
+        if not snapshot["nodes"]:
+            return
+
+        speed_scale = max(0.1, float(speed_scale))
+
+        def scaled(base_ms: int) -> int:
+            return max(1, int(base_ms / speed_scale))
+
+        positions = self._compute_layout(snapshot)
+        sequential = self.anim.sequential()
+        for level in self._levels(snapshot):
+            drops = []
+            for node_id, keys in level:
+                item = self._create_page_item(node_id, keys)
+                target = positions[node_id]
+                item.setPos(QPointF(target.x(), target.y() - 120))
+                item.setOpacity(0.0)
+                drops.append(self.anim.move_item(item, target, duration=scaled(520)))
+                drops.append(self.anim.fade_item(item, 0.0, 1.0, duration=scaled(520)))
+            sequential.addAnimation(self.anim.parallel(*drops))
+
+        sequential.addAnimation(self.anim.pause(scaled(140)))
+        self._track_animation(
+            sequential,
+            finalizer=lambda: self._finalize_snapshot(snapshot, positions),
+        )
+
+    def animate_operation(self, snapshot, path_ids, found: Optional[bool] = None):
+        """
+        path_ids 为本次操作读取的页（旧结构中的 id）；
+        found 不为 None 时（查找）用绿色 / 红色标出最后一页是否命中。
+        """
+        positions = self._compute_layout(snapshot)
+        nodes = {info["id"]: info for info in snapshot["nodes"]}
+        sequence = self.anim.sequential()
+
+        restore_colors: List[tuple] = []
+        for node_id in path_ids or []:
+            item = self.page_items.get(node_id)
+            if item is None:
+                continue
+            original = QColor(item.fillColor)
+            restore_colors.append((item, original))
+            sequence.addAnimation(
+                self.anim.flash_brush(
+                    setter=item.setFillColor,
+                    start_color=original,
+                    end_color=self.READ_COLOR,
+                    duration=220,
+                    loops=2,
+                )
+            )
+
+        if found is not None and path_ids and path_ids[-1] in self.page_items:
+            item = self.page_items[path_ids[-1]]
+            sequence.addAnimation(
+                self.anim.flash_brush(
+                    setter=item.setFillColor,
+                    start_color=QColor(item.fillColor),
+                    end_color=self.HIT_COLOR if found else self.MISS_COLOR,
+                    duration=360,
+                    loops=2,
+                )
+            )
+
+        if self._structure_changed(snapshot):
+            sequence.addAnimation(self._animate_restructure(snapshot, nodes, positions))
+
+        self._track_animation(
+            sequence,
+            finalizer=lambda: self._finalize_snapshot(snapshot, positions, restore_colors),
+        )
+
+    # ---------- 结构切换 ----------
+
+    def _structure_changed(self, snapshot) -> bool:
+        before = {info["id"]: (info["keys"], info["children"]) for info in self._last_snapshot["nodes"]}
+        after = {info["id"]: (info["keys"], info["children"]) for info in snapshot["nodes"]}
+        return before != after
+
+    def _animate_restructure(self, snapshot, nodes, positions):
+        removed = [node_id for node_id in self.page_items if node_id not in nodes]
+        added = []
+        for node_id, info in nodes.items():
+            if node_id in self.page_items:
+                continue
+            item = self._create_page_item(node_id, info["keys"])
+            item.setPos(positions[node_id])
+            item.setOpacity(0.0)
+            added.append(item)
+
+        def _switch():
+            # 键与连线在同一时刻切换到新结构，随后再移动页
+            for node_id, info in nodes.items():
+                self.page_items[node_id].set_keys(info["keys"])
+            self._rebuild_edges(snapshot)
+
+        switch = self.anim.pause(60)
+        switch.finished.connect(_switch)
+
+        motions = []
+        for node_id, item in self.page_items.items():
+            if node_id in nodes and item.opacity() > 0.0:
+                motions.append(self.anim.move_item(item, positions[node_id], duration=520))
+        for item in added:
+            motions.append(self.anim.fade_item(item, 0.0, 1.0, duration=420))
+        for node_id in removed:
+            motions.append(self.anim.fade_item(self.page_items[node_id], 1.0, 0.0, duration=360))
+
+        sequence = self.anim.sequential(switch)
+        if motions:
+            sequence.addAnimation(self.anim.parallel(*motions))
+        return sequence
+
+    def _finalize_snapshot(self, snapshot, positions, restore_colors=()):
+        for item, color in restore_colors:
+            item.setFillColor(color)
+
+        nodes = {info["id"]: info for info in snapshot["nodes"]}
+        for node_id in [node_id for node_id in self.page_items if node_id not in nodes]:
+            item = self.page_items.pop(node_id)
+            if item.scene():
+                self.scene.removeItem(item)
+        for node_id, info in nodes.items():
+            item = self.page_items.get(node_id)
+            if item is None:
+                item = self._create_page_item(node_id, info["keys"])
+            item.set_keys(info["keys"])
+            item.setOpacity(1.0)
+            item.setPos(positions[node_id])
+
+        self._rebuild_edges(snapshot)
+        self._last_snapshot = snapshot
+        self.auto_fit_view()
+
+    # ---------- 连线 ----------
+
+    def _rebuild_edges(self, snapshot):
+        """按 (父页, 子页) 与 (叶, 后继叶) 对比现有连线，只增删有变化的部分。"""
+        wanted_edges = {}
+        wanted_links = set()
+        for info in snapshot["nodes"]:
+            for slot, child_id in enumerate(info["children"]):
+                wanted_edges[(info["id"], child_id)] = slot
+            if snapshot.get("plus") and info.get("next") is not None:
+                wanted_links.add((info["id"], info["next"]))
+
+        for key in [key for key in self.edge_items if key not in wanted_edges]:
+            self.release_item(self.edge_items.pop(key))
+        for key, slot in wanted_edges.items():
+            parent_item = self.page_items.get(key[0])
+            child_item = self.page_items.get(key[1])
+            if parent_item is None or child_item is None:
+                continue
+            edge = self.edge_items.get(key)
+            if edge is None:
+                edge = BTreeEdgeItem(parent_item, child_item, slot)
+                self.track_item(edge, edge.detach)
+                self.scene.addItem(edge)
+                self.edge_items[key] = edge
+            else:
+                edge.set_slot(slot)
+
+        for key in [key for key in self.link_items if key not in wanted_links]:
+            self.release_item(self.link_items.pop(key))
+        for key in wanted_links:
+            if key in self.link_items:
+                continue
+            left_item = self.page_items.get(key[0])
+            right_item = self.page_items.get(key[1])
+            if left_item is None or right_item is None:
+                continue
+            link = BTreeLinkItem(left_item, right_item)
+            self.track_item(link, link.detach)
+            self.scene.addItem(link)
+            self.link_items[key] = link
+
+    # ---------- 布局 ----------
+
+    def _compute_layout(self, snapshot) -> Dict[int, QPointF]:
+        children = {info["id"]: info["children"] for info in snapshot["nodes"]}
+        widths = {info["id"]: BTreePageItem.width_for(len(info["keys"])) for info in snapshot["nodes"]}
+        layout = packed_layout(children, snapshot.get("root"), widths, gap=self._layout_gap)
+        return {
+            node_id: QPointF(x - widths[node_id] / 2, self._layout_top + depth * self._layout_level_gap)
+            for node_id, (x, depth) in layout.items()
+        }
+
+    @staticmethod
+    def _levels(snapshot):
+        nodes = {info["id"]: info for info in snapshot["nodes"]}
+        level = [snapshot["root"]] if snapshot.get("root") in nodes else []
+        while level:
+            yield [(node_id, nodes[node_id]["keys"]) for node_id in level]
+            level = [child for node_id in level for child in nodes[node_id]["children"]]
+
+    def _create_page_item(self, node_id, keys):
+        item = BTreePageItem(node_id, keys)
+        self.scene.addItem(item)
+        self.page_items[node_id] = item
+        return item
+
+    # ---------- 交互 ----------
+
+    def _show_background_menu(self, screen_pos):
+        if isinstance(screen_pos, QPointF):
+            screen_pos = screen_pos.toPoint()
+        menu = QMenu()
+        clear_action = menu.addAction("Clear Tree")
+        chosen = menu.exec_(screen_pos)
+        if chosen == clear_action:
+            self.stop_all_animations()
+            self.clearAllRequested.emit()
+
+    def eventFilter(self, watched, event):
+        if watched is self.scene and event.type() == QEvent.GraphicsSceneContextMenu:
+            item = self.scene.itemAt(
+                event.scenePos(),
+                self._canvas.transform() if self._canvas else None,
+            )
+            if item is None:
+                self._show_background_menu(event.screenPos())
+                event.accept()
+                return True
+        return super().eventFilter(watched, event)
+
+
+class BTreePageItem(QGraphicsObject):
+    """一页：圆角矩形内按格子排列键，宽度随键数变化。"""
+
+    positionChanged = pyqtSignal()
+
+    cell_width = 44
+    height = 40
+    padding = 6
+
+    def __init__(self, node_id, keys):
+        super().__init__()
+        self.node_id = node_id
+        self._keys = [str(key) for key in keys]
+        self.fillColor = QColor("#e9e9ef")
+        self.strokeColor = QColor("#4a4a52")
+        self.textColor = QColor("#1f1f24")
+        self.setZValue(2)
+        self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
+        self.setAcceptedMouseButtons(Qt.NoButton)
+
+    @classmethod
+    def width_for(cls, key_count: int) -> float:
+        return cls.padding * 2 + max(1, key_count) * cls.cell_width
+
+    @property
+    def width(self) -> float:
+        return self.width_for(len(self._keys))
+
+    def slot_x(self, slot: int) -> float:
+        """第 slot 个孩子指针的横坐标（位于两个键之间的分隔线上）。"""
+        return self.padding + slot * self.cell_width
+
+    def boundingRect(self):
+        return QRectF(0, 0, self.width, self.height)
+
+    def paint(self, painter, option, widget=None):
+        painter.setRenderHint(painter.Antialiasing)
+        painter.setPen(QPen(self.strokeColor, 2))
+        painter.setBrush(QBrush(self.fillColor))
+        painter.drawRoundedRect(self.boundingRect(), 6, 6)
+
+        painter.setPen(QPen(self.strokeColor, 1))
+        for index in range(1, len(self._keys)):
+            x = self.slot_x(index)
+            painter.drawLine(QPointF(x, 4), QPointF(x, self.height - 4))
+
+        painter.setPen(self.textColor)
+        for index, text in enumerate(self._keys):
+            cell = QRectF(self.slot_x(index), 0, self.cell_width, self.height)
+            painter.drawText(cell, Qt.AlignCenter, text)
+
+    def set_keys(self, keys):
+        keys = [str(key) for key in keys]
+        if keys == self._keys:
+            return
+        self.prepareGeometryChange()
+        self._keys = keys
+        self.update()
+        # 宽度变化会移动孩子指针的位置
+        self.positionChanged.emit()
+
+    def setFillColor(self, color: QColor):
+        self.fillColor = QColor(color)
+        self.update()
+
+    def itemChange(self, change, value):
+        if change == QGraphicsItem.ItemPositionHasChanged:
+            self.positionChanged.emit()
+        return super().itemChange(change, value)
+
+
+class _PageConnector(QGraphicsPathItem):
+    """跟随两端页移动的连线基类。"""
+
+    def __init__(self, first: BTreePageItem, second: BTreePageItem, pen: QPen):
+        super().__init__()
+        self.first = first
+        self.second = second
+        self.setPen(pen)
+        self.setZValue(1)
+        self.first.positionChanged.connect(self.update_geometry)
+        self.second.positionChanged.connect(self.update_geometry)
+
+    def detach(self):
+        for item in (self.first, self.second):
+            try:
+                item.positionChanged.disconnect(self.update_geometry)
+            except (RuntimeError, TypeError):
+                # 页图元已被销毁或信号未连接
+                pass
+
+    def update_geometry(self):
+        raise NotImplementedError
+
+
+class BTreeEdgeItem(_PageConnector):
+    """父页第 slot 个孩子指针 → 子页顶部中点。"""
+
+    def __init__(self, parent_item: BTreePageItem, child_item: BTreePageItem, slot: int):
+        self.slot = slot
+        pen = QPen(QColor("#9e9e9e"), 2)
+        pen.setCapStyle(Qt.RoundCap)
+        super().__init__(parent_item, child_item, pen)
+        self.update_geometry()
+
+    def set_slot(self, slot: int):
+        if slot != self.slot:
+            self.slot = slot
+            self.update_geometry()
+
+    def update_geometry(self):
+        parent_pos = self.first.scenePos()
+        child_pos = self.second.scenePos()
+        start = QPointF(parent_pos.x() + self.first.slot_x(self.slot), parent_pos.y() + BTreePageItem.height)
+        end = QPointF(child_pos.x() + self.second.width / 2, child_pos.y())
+        path = QPainterPath(start)
+        path.lineTo(end)
+        self.setPath(path)
+
+
+class BTreeLinkItem(_PageConnector):
+    """B+ 树叶子之间的 next 指针（虚线箭头）。"""
+
+    def __init__(self, left_item: BTreePageItem, right_item: BTreePageItem):
+        pen = QPen(QColor("#64b5f6"), 1.5, Qt.DashLine)
+        super().__init__(left_item, right_item, pen)
+        self.update_geometry()
+
+    def update_geometry(self):
+        left_pos = self.first.scenePos()
+        right_pos = self.second.scenePos()
+        mid = BTreePageItem.height / 2
+        start = QPointF(left_pos.x() + self.first.width, left_pos.y() + mid)
+        end = QPointF(right_pos.x(), right_pos.y() + mid)
+        path = QPainterPath(start)
+        path.lineTo(end)
+        path.moveTo(end)
+        path.lineTo(end + QPointF(-6, -4))
+        path.moveTo(end)
+        path.lineTo(end + QPointF(-6, 4))
+        self.setPath(path)
@@ -1,12 +1,16 @@
+from bisect import bisect_right
+import math
+
 from PyQt5.QtCore import (
     QEasingCurve,
     QParallelAnimationGroup,
+    QPointF,
     QPropertyAnimation,
     QSequentialAnimationGroup,
     QVariantAnimation,
     Qt,
 )
-from PyQt5.QtGui import QColor
+from PyQt5.QtGui import QColor, QPainterPath
 
 
 class AnimationToolkit:
@@ -72,6 +76,41 @@ class AnimationToolkit:
             seq.addAnimation(_make_segment(end_color, start_color))
         return seq
 
+    def path_item(self, item, path, duration=800, easing=QEasingCurve.InOutCubic, setter=None):
+        """
+        沿路径匀速（按弧长）移动 item。
+        path 为 QPainterPath（曲线会先展平成折线）或依次经过的点列表（含起点）；
+        构造时预先算好累计弧长表，每帧用二分查找定位所在线段。
+        setter 默认为 item.setPos，也可以传入其他接收 QPointF 的回调（此时 item 可为 None）。
+        """
+        xs, ys, cumulative = arc_length_table(_path_points(path))
+        setter = setter or item.setPos
+        total = cumulative[-1]
+        last = len(xs) - 1
+
+        anim = QVariantAnimation()
+        anim.setDuration(self._duration(duration))
+        anim.setStartValue(0.0)
+        anim.setEndValue(1.0)
+        anim.setEasingCurve(easing)
+
+        def _update(progress):
+            if last == 0 or total <= 0.0:
+                setter(QPointF(xs[last], ys[last]))
+                return
+            traveled = min(max(progress, 0.0), 1.0) * total
+            index = min(bisect_right(cumulative, traveled), last) - 1
+            span = cumulative[index + 1] - cumulative[index]
+            t = (traveled - cumulative[index]) / span if span else 0.0
+            setter(QPointF(
+                xs[index] + (xs[index + 1] - xs[index]) * t,
+                ys[index] + (ys[index + 1] - ys[index]) * t,
+            ))
+
+        anim.valueChanged.connect(_update)
+        anim.finished.connect(lambda: setter(QPointF(xs[last], ys[last])))
+        return anim
+
     def pause(self, duration=150):
         pause = QVariantAnimation()
         pause.setDuration(self._duration(duration))
@@ -93,4 +132,33 @@ class AnimationToolkit:
         for anim in animations:
             if anim:
                 group.addAnimation(anim)
-        return group
\ No newline at end of file
+        return group
+
+
+def _path_points(path):
+    if isinstance(path, QPainterPath):
+        points = []
+        for polygon in path.toSubpathPolygons():
+            points.extend((point.x(), point.y()) for point in polygon)
+        return points
+    return [(point.x(), point.y()) for point in path]
+
+
+def arc_length_table(points):
+    """
+    points 为 (x, y) 序列，返回 (xs, ys, 累计弧长)；相邻重复点会被去掉，
+    保证每段长度大于 0。至少需要一个点。
+    """
+    if not points:
+        raise ValueError("path needs at least one point")
+    xs = [float(points[0][0])]
+    ys = [float(points[0][1])]
+    cumulative = [0.0]
+    for x, y in points[1:]:
+        length = math.hypot(x - xs[-1], y - ys[-1])
+        if length <= 1e-9:
+            continue
+        xs.append(float(x))
+        ys.append(float(y))
+        cumulative.append(cumulative[-1] + length)
+    return xs, ys, cumulative
@@ -3,6 +3,7 @@ import math
 from PyQt5.QtWidgets import QGraphicsScene
 
 from core.animation import AnimationToolkit
+from core.item_registry import ItemRegistry
 
 
 class BaseStructureView(QObject):
@@ -27,12 +28,15 @@ class BaseStructureView(QObject):
         self._base_scene_rect = QRectF(self.scene.sceneRect())
         self._view_anim = None
         self._max_view_scale = 1  # 防止节点过少时放得太大
+        # 持有信号连接的图元，以及等待动画结束后释放的批次
+        self._items = ItemRegistry(self._remove_from_scene)
 
     def stop_all_animations(self):
         """Force-stop every tracked animation before tearing down the scene."""
         self._cancel_view_anim()
 
         if not self._running:
+            self._flush_pending_release()
             return
 
         running = list(self._running)
@@ -45,8 +49,44 @@ class BaseStructureView(QObject):
             except RuntimeError:
                 pass
 
+        # stop() 不会发出 finished，约定在动画结束时释放的图元在这里立即释放
+        self._flush_pending_release()
         self.unlock_interactions()
 
+    # ---------- 图元所有权 ----------
+
+    def track_item(self, item, release=None):
+        """
+        登记一个持有信号连接的图元，release 负责断开连接（默认为 item.dispose）。
+        登记后由视图负责释放：release_item / clear_scene 会先断开连接再移出场景，
+        不依赖 __del__ 或垃圾回收的时机。
+        """
+        return self._items.track(item, release)
+
+    def release_item(self, item):
+        """断开登记图元的连接并移出场景；未登记的图元只移出场景。"""
+        self._items.release(item)
+
+    def release_when_finished(self, animation, items):
+        """animation 正常结束时释放 items；若动画被 stop_all_animations 中止则在中止时释放。"""
+        animation.finished.connect(self._items.defer(items))
+
+    def _flush_pending_release(self):
+        self._items.flush()
+
+    def _remove_from_scene(self, item):
+        try:
+            if item.scene() is self.scene:
+                self.scene.removeItem(item)
+        except RuntimeError:
+            # 底层 C++ 对象已被删除
+            pass
+
+    def clear_scene(self):
+        """释放全部登记图元后清空场景，reset() 统一走这里而不是直接 scene.clear()。"""
+        self._items.release_all()
+        self.scene.clear()
+
     def bind_canvas(self, view):
         self._cancel_view_anim()
         self._canvas = view
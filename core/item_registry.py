@@ -0,0 +1,59 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class ItemRegistry:
+    """
+    视图图元的所有权登记表，BaseStructureView 通过它确定性地释放图元。
+    本身不依赖 Qt：移出场景的动作由视图以 remove(item) 的形式传入。
+
+    owned：{id(item): (item, release)}，release 负责断开图元持有的信号连接；
+    pending：等待动画结束后释放的批次，{key: [item, ...]}。
+    """
+
+    def __init__(self, remove: Callable[[Any], None]):
+        self._remove = remove
+        self.owned: Dict[int, Tuple[Any, Callable[[], None]]] = {}
+        self.pending: Dict[int, List[Any]] = {}
+
+    def track(self, item, release: Optional[Callable[[], None]] = None):
+        self.owned[id(item)] = (item, release or item.dispose)
+        return item
+
+    def release(self, item):
+        """断开登记图元的连接并移出场景；未登记的图元只移出场景。"""
+        entry = self.owned.pop(id(item), None)
+        if entry is not None:
+            entry[1]()
+        self._remove(item)
+
+    def defer(self, items: Iterable) -> Callable[[], None]:
+        """登记一批稍后释放的图元，返回执行释放的回调；回调与 flush 只有先到的一次生效。"""
+        batch = list(items)
+        key = id(batch)
+        self.pending[key] = batch
+
+        def _release():
+            if self.pending.pop(key, None) is not None:
+                for item in batch:
+                    self.release(item)
+
+        return _release
+
+    def flush(self):
+        """立即释放全部待释放批次（动画被中止、不会再发出 finished 时使用）。"""
+        pending = list(self.pending.values())
+        self.pending.clear()
+        for batch in pending:
+            for item in batch:
+                self.release(item)
+
+    def release_all(self):
+        """断开全部登记图元的连接并清空登记表，不逐个移出场景（随后由 scene.clear() 统一删除）。"""
+        self.pending.clear()
+        owned = list(self.owned.values())
+        self.owned.clear()
+        for _item, release in owned:
+            release()
+
+    def __len__(self):
+        return len(self.owned) + sum(len(batch) for batch in self.pending.values())
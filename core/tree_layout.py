@@ -0,0 +1,711 @@
+"""
+Iterative layout engines for binary trees stored in the id/left/right
+snapshot format produced by BSTModel and HuffmanModel.
+
+All passes use explicit stacks (no recursion), so degenerate trees with a
+depth of millions lay out fine. Results are returned as flat arrays in
+``TreeLayout``; views convert them to scene coordinates themselves.
+"""
+
+from array import array
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+NIL = -1
+
+
+class IndexedTree:
+    """
+    Compact index-based view of a snapshot: node ``i`` has id ``ids[i]`` and
+    children ``left[i]`` / ``right[i]`` (``NIL`` when absent).
+    """
+
+    __slots__ = ("ids", "left", "right", "roots", "index")
+
+    def __init__(self, nodes: Iterable[Mapping], roots: Sequence[Optional[int]]):
+        node_list = list(nodes)
+        self.ids: List[int] = [info["id"] for info in node_list]
+        self.index: Dict[int, int] = {node_id: idx for idx, node_id in enumerate(self.ids)}
+        index = self.index
+        self.left = array("l", (index.get(info.get("left"), NIL) for info in node_list))
+        self.right = array("l", (index.get(info.get("right"), NIL) for info in node_list))
+        self.roots: List[int] = [index[root] for root in roots if root in index]
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Mapping):
+        return cls(snapshot.get("nodes", []), [snapshot.get("root")])
+
+    def __len__(self):
+        return len(self.ids)
+
+    def preorder(self, root: int) -> array:
+        """Indices of the subtree under ``root`` in pre-order."""
+        order = array("l")
+        if root == NIL:
+            return order
+        left = self.left
+        right = self.right
+        stack = [root]
+        while stack:
+            idx = stack.pop()
+            order.append(idx)
+            if right[idx] != NIL:
+                stack.append(right[idx])
+            if left[idx] != NIL:
+                stack.append(left[idx])
+        return order
+
+
+class TreeLayout:
+    """
+    Flat layout result: ``xs[i]`` is the horizontal centre and ``depths[i]``
+    the level of node ``ids[i]``.
+    """
+
+    __slots__ = ("ids", "xs", "depths", "_index")
+
+    def __init__(self, ids: List[int], xs: array, depths: array, index: Optional[Dict[int, int]] = None):
+        self.ids = ids
+        self.xs = xs
+        self.depths = depths
+        self._index = index
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, node_id):
+        return node_id in self.index
+
+    @property
+    def index(self) -> Dict[int, int]:
+        if self._index is None:
+            self._index = {node_id: idx for idx, node_id in enumerate(self.ids)}
+        return self._index
+
+    def position(self, node_id: int) -> Tuple[float, int]:
+        idx = self.index[node_id]
+        return self.xs[idx], self.depths[idx]
+
+    def items(self) -> Iterator[Tuple[int, float, int]]:
+        return zip(self.ids, self.xs, self.depths)
+
+
+# ---------- Reingold–Tilford tidy layout ----------
+
+
+class TidyState:
+    """
+    Per-node bookkeeping of the Reingold–Tilford pass.
+
+    Fields are indexable containers keyed by node key (list/array indices for
+    a one-shot layout, dicts keyed by node id for incremental use):
+
+    - ``off``: horizontal offset of a node relative to its parent
+    - ``lthr``/``rthr`` + ``lthr_off``/``rthr_off``: contour threads
+    - ``height``: height of the subtree
+    - ``lext``/``rext`` + ``lext_x``/``rext_x``: deepest node of the left/right
+      contour and its offset relative to the subtree root
+    - ``owner``: thread installed by this node's merge (``key * 2 + side``)
+    """
+
+    __slots__ = (
+        "left", "right", "off",
+        "lthr", "rthr", "lthr_off", "rthr_off",
+        "height", "lext", "rext", "lext_x", "rext_x", "owner",
+        "sibling_sep", "single_offset", "_keyed",
+    )
+
+    def __init__(self, left, right, sibling_sep: float, single_offset: float):
+        self.left = left
+        self.right = right
+        self.sibling_sep = float(sibling_sep)
+        self.single_offset = float(single_offset)
+
+    def allocate_arrays(self, size: int):
+        self.off = array("d", bytes(8 * size))
+        self.lthr = array("l", [NIL]) * size
+        self.rthr = array("l", [NIL]) * size
+        self.lthr_off = array("d", bytes(8 * size))
+        self.rthr_off = array("d", bytes(8 * size))
+        self.height = array("l", bytes(array("l").itemsize * size))
+        self.lext = array("l", [NIL]) * size
+        self.rext = array("l", [NIL]) * size
+        self.lext_x = array("d", bytes(8 * size))
+        self.rext_x = array("d", bytes(8 * size))
+        self.owner = array("l", [NIL]) * size
+        self._keyed = False
+
+    def allocate_dicts(self):
+        self.off = {}
+        self.lthr = {}
+        self.rthr = {}
+        self.lthr_off = {}
+        self.rthr_off = {}
+        self.height = {}
+        self.lext = {}
+        self.rext = {}
+        self.lext_x = {}
+        self.rext_x = {}
+        self.owner = {}
+        self._keyed = True
+
+    def init_key(self, key):
+        """Reset the per-node fields of ``key`` (dict mode)."""
+        self.off[key] = 0.0
+        self.lthr[key] = NIL
+        self.rthr[key] = NIL
+        self.lthr_off[key] = 0.0
+        self.rthr_off[key] = 0.0
+        self.height[key] = 0
+        self.lext[key] = key
+        self.rext[key] = key
+        self.lext_x[key] = 0.0
+        self.rext_x[key] = 0.0
+        self.owner[key] = NIL
+
+    def clear_thread(self, v):
+        """Remove the contour thread installed by the last merge at ``v``."""
+        owner = self.owner[v]
+        if owner == NIL:
+            return
+        holder, side = divmod(owner, 2)
+        # 字典模式下穿线节点可能已被删除
+        if not self._keyed or holder in self.height:
+            if side == 0:
+                self.lthr[holder] = NIL
+            else:
+                self.rthr[holder] = NIL
+        self.owner[v] = NIL
+
+    def place(self, v):
+        """
+        Position the children of ``v`` relative to ``v``. Both child subtrees
+        must already be placed. Runs in O(min(height(L), height(R))).
+        """
+        left = self.left
+        right = self.right
+        off = self.off
+        lthr = self.lthr
+        rthr = self.rthr
+        lthr_off = self.lthr_off
+        rthr_off = self.rthr_off
+
+        self.clear_thread(v)
+
+        l = left[v]
+        r = right[v]
+        if l == NIL and r == NIL:
+            self.height[v] = 0
+            self.lext[v] = v
+            self.rext[v] = v
+            self.lext_x[v] = 0.0
+            self.rext_x[v] = 0.0
+            return
+
+        if l == NIL or r == NIL:
+            child = l if r == NIL else r
+            shift = -self.single_offset if r == NIL else self.single_offset
+            off[child] = shift
+            self.height[v] = self.height[child] + 1
+            self.lext[v] = self.lext[child]
+            self.rext[v] = self.rext[child]
+            self.lext_x[v] = self.lext_x[child] + shift
+            self.rext_x[v] = self.rext_x[child] + shift
+            return
+
+        sep = self.sibling_sep
+        # 同时沿左子树右轮廓 (a) 与右子树左轮廓 (b) 下行，求两根之间的最小间距
+        a = l
+        b = r
+        ax = 0.0
+        bx = 0.0
+        need = sep
+        na = nb = NIL
+        step_a = step_b = 0.0
+        while True:
+            gap = ax - bx + sep
+            if gap > need:
+                need = gap
+            if right[a] != NIL:
+                na = right[a]
+                step_a = off[na]
+            elif left[a] != NIL:
+                na = left[a]
+                step_a = off[na]
+            else:
+                na = rthr[a]
+                step_a = rthr_off[a]
+            if left[b] != NIL:
+                nb = left[b]
+                step_b = off[nb]
+            elif right[b] != NIL:
+                nb = right[b]
+                step_b = off[nb]
+            else:
+                nb = lthr[b]
+                step_b = lthr_off[b]
+            if na == NIL or nb == NIL:
+                break
+            a = na
+            b = nb
+            ax += step_a
+            bx += step_b
+
+        half = need / 2.0
+        off[l] = -half
+        off[r] = half
+
+        hl = self.height[l]
+        hr = self.height[r]
+        if hl < hr:
+            # 左子树较浅：其左轮廓末端穿线到右子树左轮廓的下一层
+            holder = self.lext[l]
+            lthr[holder] = nb
+            lthr_off[holder] = (bx + step_b + half) - (self.lext_x[l] - half)
+            self.owner[v] = holder * 2
+            self.lext[v] = self.lext[r]
+            self.lext_x[v] = self.lext_x[r] + half
+            self.rext[v] = self.rext[r]
+            self.rext_x[v] = self.rext_x[r] + half
+        elif hl > hr:
+            holder = self.rext[r]
+            rthr[holder] = na
+            rthr_off[holder] = (ax + step_a - half) - (self.rext_x[r] + half)
+            self.owner[v] = holder * 2 + 1
+            self.lext[v] = self.lext[l]
+            self.lext_x[v] = self.lext_x[l] - half
+            self.rext[v] = self.rext[l]
+            self.rext_x[v] = self.rext_x[l] - half
+        else:
+            self.lext[v] = self.lext[l]
+            self.lext_x[v] = self.lext_x[l] - half
+            self.rext[v] = self.rext[r]
+            self.rext_x[v] = self.rext_x[r] + half
+        self.height[v] = max(hl, hr) + 1
+
+
+def tidy_layout(
+    snapshot: Mapping,
+    sibling_sep: float = 160.0,
+    single_offset: float = 60.0,
+) -> TreeLayout:
+    """
+    O(n) Reingold–Tilford layout of ``snapshot`` (``{"root", "nodes"}``).
+
+    ``sibling_sep`` is the minimum distance between horizontally adjacent
+    nodes of sibling subtrees, ``single_offset`` the horizontal shift of an
+    only child. The root is centred at x = 0.
+    """
+    tree = IndexedTree.from_snapshot(snapshot)
+    size = len(tree)
+    xs = array("d", bytes(8 * size))
+    depths = array("l", bytes(array("l").itemsize * size))
+    if not tree.roots:
+        return TreeLayout(tree.ids, xs, depths, tree.index)
+
+    state = TidyState(tree.left, tree.right, sibling_sep, single_offset)
+    state.allocate_arrays(size)
+    order = tree.preorder(tree.roots[0])
+    place = state.place
+    for idx in reversed(order):
+        place(idx)
+
+    _accumulate(order, tree.left, tree.right, state.off, xs, depths)
+    return TreeLayout(tree.ids, xs, depths, tree.index)
+
+
+def _accumulate(order, left, right, off, xs, depths):
+    """Pre-order pass turning parent-relative offsets into absolute positions."""
+    for idx in order:
+        x = xs[idx]
+        depth = depths[idx] + 1
+        child = left[idx]
+        if child != NIL:
+            xs[child] = x + off[child]
+            depths[child] = depth
+        child = right[idx]
+        if child != NIL:
+            xs[child] = x + off[child]
+            depths[child] = depth
+
+
+LinkSource = Callable[[int], Optional[Tuple[Optional[int], Optional[int]]]]
+
+
+def mapping_links(nodes_by_id: Mapping[int, Mapping]) -> LinkSource:
+    """Link source over ``{id: {"left", "right", ...}}`` snapshot entries."""
+
+    def links(node_id):
+        info = nodes_by_id.get(node_id)
+        return None if info is None else (info.get("left"), info.get("right"))
+
+    return links
+
+
+class IncrementalTidyLayout:
+    """
+    Reingold–Tilford layout that keeps its per-node state between operations.
+
+    After a structural change only the ancestors of the touched nodes are
+    re-placed, and only nodes whose absolute position actually moved are
+    reported, so per-operation cost scales with the affected nodes rather
+    than the tree size.
+    """
+
+    def __init__(self, sibling_sep: float = 160.0, single_offset: float = 60.0):
+        self._sibling_sep = sibling_sep
+        self._single_offset = single_offset
+        self.reset()
+
+    def reset(self):
+        self._root = NIL
+        self._left: Dict[int, int] = {}
+        self._right: Dict[int, int] = {}
+        self._parent: Dict[int, int] = {}
+        self._xs: Dict[int, float] = {}
+        self._depths: Dict[int, int] = {}
+        self._state = TidyState(self._left, self._right, self._sibling_sep, self._single_offset)
+        self._state.allocate_dicts()
+
+    def __len__(self):
+        return len(self._xs)
+
+    def __contains__(self, node_id):
+        return node_id in self._xs
+
+    def position(self, node_id: int) -> Optional[Tuple[float, int]]:
+        if node_id not in self._xs:
+            return None
+        return self._xs[node_id], self._depths[node_id]
+
+    def rebuild(self, snapshot: Mapping) -> Dict[int, Tuple[float, int]]:
+        """Full O(n) layout of ``snapshot``; returns the position of every node."""
+        nodes_by_id = {info["id"]: info for info in snapshot.get("nodes", [])}
+        return self.rebuild_from(mapping_links(nodes_by_id), snapshot.get("root"))
+
+    def rebuild_from(self, links: LinkSource, root: Optional[int]) -> Dict[int, Tuple[float, int]]:
+        """
+        Full O(n) layout of the tree reachable from ``root``, reading children
+        through ``links``; returns the position of every node.
+        """
+        self.reset()
+        if root is None or links(root) is None:
+            return {}
+
+        self._root = root
+        order: List[int] = []
+        stack = [root]
+        while stack:
+            node_id = stack.pop()
+            order.append(node_id)
+            self._sync_links(node_id, links(node_id), links)
+            for child in (self._right[node_id], self._left[node_id]):
+                if child != NIL:
+                    stack.append(child)
+
+        place = self._state.place
+        for node_id in reversed(order):
+            place(node_id)
+
+        off = self._state.off
+        xs = self._xs
+        depths = self._depths
+        xs[root] = 0.0
+        depths[root] = 0
+        for node_id in order:
+            x = xs[node_id]
+            depth = depths[node_id] + 1
+            for child in (self._left[node_id], self._right[node_id]):
+                if child != NIL:
+                    xs[child] = x + off[child]
+                    depths[child] = depth
+        return {node_id: (xs[node_id], depths[node_id]) for node_id in order}
+
+    def update(
+        self,
+        links: LinkSource,
+        root: Optional[int],
+        touched_ids: Iterable[int],
+        size: int,
+    ) -> Dict[int, Tuple[float, int]]:
+        """
+        Apply a local change and return ``{id: (x, depth)}`` for new nodes and
+        nodes whose position changed.
+
+        ``links(node_id)`` returns the current ``(left, right)`` children of a
+        node (``None`` for a missing child) or ``None`` when the node no longer
+        exists; it is only called for the touched nodes and their children, so
+        callers can read straight from the model. ``size`` is the current node
+        count. ``touched_ids`` must contain every node that was added, removed,
+        or had a child link rewired (the search path returned by the model is
+        a safe superset). Falls back to a full rebuild when the cached state
+        cannot be reconciled with ``links``.
+        """
+        if not self._xs:
+            return self.rebuild_from(links, root)
+
+        state = self._state
+        touched: List[int] = []
+        for node_id in touched_ids:
+            entry = links(node_id)
+            if entry is not None:
+                self._sync_links(node_id, entry, links)
+                touched.append(node_id)
+            elif node_id in self._xs:
+                self._drop(node_id)
+
+        new_root = root if root is not None and links(root) is not None else NIL
+        if new_root != NIL:
+            self._parent[new_root] = NIL
+        self._root = new_root
+        if len(self._left) != size:
+            return self.rebuild_from(links, root)
+        if new_root == NIL:
+            return {}
+
+        # 收集受影响节点的全部祖先，并按深度从深到浅重新定位
+        dirty_depth: Dict[int, int] = {}
+        parent = self._parent
+        for node_id in touched:
+            chain = []
+            current = node_id
+            while current != NIL and current not in dirty_depth:
+                chain.append(current)
+                current = parent.get(current, NIL)
+            depth = dirty_depth[current] if current != NIL else -1
+            if current == NIL and chain and chain[-1] != new_root:
+                # 游离节点：缓存与模型不一致
+                return self.rebuild_from(links, root)
+            for ancestor in reversed(chain):
+                depth += 1
+                dirty_depth[ancestor] = depth
+
+        # 先统一拆除旧穿线，避免后续合并刚装好的穿线被祖先的旧记录清掉
+        for node_id in dirty_depth:
+            state.clear_thread(node_id)
+        place = state.place
+        for node_id in sorted(dirty_depth, key=dirty_depth.__getitem__, reverse=True):
+            place(node_id)
+
+        # 自顶向下传播：仅在位置或偏移可能变化的分支上继续下行
+        off = state.off
+        xs = self._xs
+        depths = self._depths
+        changed: Dict[int, Tuple[float, int]] = {}
+        stack = [(new_root, 0.0, 0)]
+        while stack:
+            node_id, x, depth = stack.pop()
+            moved = xs.get(node_id) != x or depths.get(node_id) != depth
+            if moved:
+                xs[node_id] = x
+                depths[node_id] = depth
+                changed[node_id] = (x, depth)
+            if not moved and node_id not in dirty_depth:
+                continue
+            for child in (self._left[node_id], self._right[node_id]):
+                if child != NIL:
+                    stack.append((child, x + off[child], depth + 1))
+        return changed
+
+    # ---------- Internal helpers ----------
+
+    def _sync_links(self, node_id, entry, links):
+        if node_id not in self._left:
+            self._state.init_key(node_id)
+            self._parent.setdefault(node_id, NIL)
+        for child, table in zip(entry, (self._left, self._right)):
+            child = child if child is not None and links(child) is not None else NIL
+            table[node_id] = child
+            if child != NIL:
+                self._parent[child] = node_id
+
+    def _drop(self, node_id):
+        state = self._state
+        state.clear_thread(node_id)
+        for table in (
+            self._left, self._right, self._parent, self._xs, self._depths,
+            state.off, state.lthr, state.rthr, state.lthr_off, state.rthr_off,
+            state.height, state.lext, state.rext, state.lext_x, state.rext_x, state.owner,
+        ):
+            table.pop(node_id, None)
+
+
+# ---------- In-order (rank) layout ----------
+
+
+def inorder_layout(
+    nodes: Iterable[Mapping],
+    roots: Sequence[Optional[int]],
+    spacing: float = 1.0,
+) -> TreeLayout:
+    """
+    Places every node at ``spacing * in-order rank`` over the whole forest
+    (trees in ``roots`` order, left to right). Iterative, O(n).
+    """
+    tree = IndexedTree(nodes, roots)
+    size = len(tree)
+    xs = array("d", bytes(8 * size))
+    depths = array("l", bytes(array("l").itemsize * size))
+    left = tree.left
+    right = tree.right
+
+    rank = 0
+    for root in tree.roots:
+        stack: List[int] = []
+        current = root
+        depth = 0
+        while stack or current != NIL:
+            while current != NIL:
+                depths[current] = depth
+                stack.append(current)
+                current = left[current]
+                depth += 1
+            current = stack.pop()
+            xs[current] = rank * spacing
+            rank += 1
+            depth = depths[current] + 1
+            current = right[current]
+
+    return TreeLayout(tree.ids, xs, depths, tree.index)
+
+
+class IncrementalForestLayout:
+    """
+    In-order (rank) layout of a forest that only grows by merging two trees
+    under a new parent, as in a Huffman build. Trees keep their creation
+    order, so the merged tree is appended at the right end.
+
+    Each tree stores its members with ranks and depths relative to its own
+    root. A merge touches only the merged subtree (ranks of the right part
+    shift by ``size(left) + 1``, every depth grows by one) plus the base
+    offset of the trees that sat to the right of a removed tree.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._roots: List[int] = []
+        self._base: Dict[int, int] = {}
+        self._members: Dict[int, List[int]] = {}
+        self._local: Dict[int, int] = {}
+        self._depth: Dict[int, int] = {}
+        self._root: Dict[int, int] = {}
+
+    def __len__(self):
+        return len(self._local)
+
+    def __contains__(self, node_id):
+        return node_id in self._local
+
+    @property
+    def roots(self) -> List[int]:
+        return list(self._roots)
+
+    def position(self, node_id: int) -> Optional[Tuple[int, int]]:
+        """Global in-order rank and depth of ``node_id``."""
+        if node_id not in self._local:
+            return None
+        return self._base[self._root[node_id]] + self._local[node_id], self._depth[node_id]
+
+    def merge(self, parent: int, left: int, right: int) -> Dict[int, Tuple[int, int]]:
+        """
+        Hang ``left`` and ``right`` under the new ``parent`` (either may be a
+        node not yet in the forest, which then enters as a single-node tree).
+        Returns ``{id: (rank, depth)}`` for every node whose position changed.
+        """
+        first_shifted = len(self._roots)
+        for child in (left, right):
+            if child in self._members:
+                index = self._roots.index(child)
+                first_shifted = min(first_shifted, index)
+                del self._roots[index]
+                del self._base[child]
+
+        left_members = self._take(left)
+        right_members = self._take(right)
+        offset = len(left_members) + 1
+        local = self._local
+        depth = self._depth
+        root_of = self._root
+        for node_id in left_members:
+            depth[node_id] += 1
+            root_of[node_id] = parent
+        for node_id in right_members:
+            local[node_id] += offset
+            depth[node_id] += 1
+            root_of[node_id] = parent
+        local[parent] = len(left_members)
+        depth[parent] = 0
+        root_of[parent] = parent
+        left_members.append(parent)
+        left_members.extend(right_members)
+        self._members[parent] = left_members
+        self._roots.append(parent)
+
+        changed: Dict[int, Tuple[int, int]] = {}
+        base = 0
+        if first_shifted:
+            previous = self._roots[first_shifted - 1]
+            base = self._base[previous] + len(self._members[previous])
+        for root in self._roots[first_shifted:]:
+            self._base[root] = base
+            for node_id in self._members[root]:
+                changed[node_id] = (base + local[node_id], depth[node_id])
+            base += len(self._members[root])
+        return changed
+
+    def _take(self, node_id: int) -> List[int]:
+        members = self._members.pop(node_id, None)
+        if members is None:
+            self._local[node_id] = 0
+            self._depth[node_id] = 0
+            members = [node_id]
+        return members
+
+
+# ---------- Packed layout for n-ary trees ----------
+
+
+def packed_layout(
+    children: Mapping[int, Sequence[int]],
+    root: Optional[int],
+    widths: Mapping[int, float],
+    gap: float = 40.0,
+) -> Dict[int, Tuple[float, int]]:
+    """
+    Layout for n-ary trees with variable node widths (B-tree pages).
+    Each subtree is as wide as the larger of its own node and its children
+    packed side by side with ``gap`` between them; parents are centred over
+    their children. Iterative, O(n); returns ``{id: (centre_x, depth)}``.
+    """
+    if root is None:
+        return {}
+
+    order: List[int] = []
+    depth: Dict[int, int] = {root: 0}
+    stack = [root]
+    while stack:
+        node_id = stack.pop()
+        order.append(node_id)
+        for child in children.get(node_id, ()):
+            depth[child] = depth[node_id] + 1
+            stack.append(child)
+
+    span: Dict[int, float] = {}
+    for node_id in reversed(order):
+        kids = children.get(node_id, ())
+        packed = sum(span[child] for child in kids) + gap * (len(kids) - 1) if kids else 0.0
+        span[node_id] = max(widths.get(node_id, 0.0), packed)
+
+    positions: Dict[int, Tuple[float, int]] = {root: (span[root] / 2, 0)}
+    for node_id in order:
+        kids = children.get(node_id, ())
+        if not kids:
+            continue
+        centre = positions[node_id][0]
+        packed = sum(span[child] for child in kids) + gap * (len(kids) - 1)
+        cursor = centre - packed / 2
+        for child in kids:
+            positions[child] = (cursor + span[child] / 2, depth[child])
+            cursor += span[child] + gap
+    return positions
@@ -0,0 +1,302 @@
+"""
+自适应（动态）哈夫曼编码，FGK 算法。
+
+不需要预先知道权重：编码器与解码器都从只有一个 NYT（not yet transmitted）节点的树开始，
+每处理一个符号就按兄弟性质（sibling property）调整树：
+节点按编号排列时权重单调不减；更新时沿叶子到根逐个节点，先与同权重块中编号最大的节点
+（块首）交换位置，再把权重加一。
+
+快照与 HuffmanModel 相同（id / value / left / right），另带 ``symbol`` 字段供视图标注。
+encode_stream / decode_stream 按块处理数据流，内存只与字母表大小有关。
+"""
+
+import itertools
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+
+class AdaptiveHuffmanModel:
+    """
+    symbol_bits：首次出现的符号在 NYT 码之后以定长原码发送的位数（字节流为 8）。
+    编号从根的 0 开始向下递减，NYT 始终是编号最小的节点，因此字母表无需预先给定大小。
+    """
+
+    def __init__(self, symbol_bits: int = 8):
+        self.symbol_bits = symbol_bits
+        self._id_iter = itertools.count()
+        self._nodes: Dict[int, Dict[str, Any]] = {}
+        self._leaves: Dict[Hashable, int] = {}
+        self._by_number: Dict[int, int] = {}
+        # 各权重块中编号最大的节点编号
+        self._block_top: Dict[int, int] = {}
+        self.swaps = 0
+        self.updates = 0
+
+        root = self._new_node(number=0)
+        self._root = root["id"]
+        self._nyt = root["id"]
+        self._block_top[0] = 0
+
+    # ---------- 基本属性 ----------
+
+    @property
+    def root(self) -> int:
+        return self._root
+
+    @property
+    def nyt(self) -> int:
+        return self._nyt
+
+    def __contains__(self, symbol) -> bool:
+        return symbol in self._leaves
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "root": self._root,
+            "nodes": [
+                {
+                    "id": node["id"],
+                    "value": node["value"],
+                    "left": node["left"],
+                    "right": node["right"],
+                    "symbol": "NYT" if node["id"] == self._nyt else node["symbol"],
+                }
+                for node in self._nodes.values()
+            ],
+        }
+
+    # ---------- 码字 ----------
+
+    def path_bits(self, node_id: int) -> List[int]:
+        """根到 node_id 的路径位（左 0 右 1）。"""
+        bits: List[int] = []
+        nodes = self._nodes
+        node = nodes[node_id]
+        while node["parent"] is not None:
+            parent = nodes[node["parent"]]
+            bits.append(1 if parent["right"] == node["id"] else 0)
+            node = parent
+        bits.reverse()
+        return bits
+
+    def code_value(self, symbol) -> Tuple[int, int]:
+        """
+        当前状态下 symbol 的输出位，返回 (位值, 位数)：
+        已出现过的符号为叶子路径，否则为 NYT 路径后接 symbol_bits 位原码。
+        """
+        leaf_id = self._leaves.get(symbol)
+        node_id = self._nyt if leaf_id is None else leaf_id
+        value = 0
+        length = 0
+        nodes = self._nodes
+        node = nodes[node_id]
+        while node["parent"] is not None:
+            parent = nodes[node["parent"]]
+            if parent["right"] == node["id"]:
+                value |= 1 << length
+            length += 1
+            node = parent
+        if leaf_id is None:
+            value = (value << self.symbol_bits) | symbol
+            length += self.symbol_bits
+        return value, length
+
+    # ---------- 更新 ----------
+
+    def update(self, symbol) -> Dict[str, Any]:
+        """
+        处理一个符号并返回本步记录：
+        {"symbol", "new": 是否首次出现, "leaf": 叶子 id, "swaps": [(a, b), ...], "incremented": [...]}
+        """
+        nodes = self._nodes
+        swaps: List[Tuple[int, int]] = []
+        incremented: List[int] = []
+        is_new = symbol not in self._leaves
+        if is_new:
+            # 新叶子与旧 NYT 直接加一，不会破坏兄弟性质，从旧 NYT 的父节点继续
+            leaf_id, old_nyt = self._split_nyt(symbol)
+            incremented.extend((leaf_id, old_nyt))
+            node_id: Optional[int] = nodes[old_nyt]["parent"]
+        else:
+            leaf_id = self._leaves[symbol]
+            node_id = leaf_id
+
+        while node_id is not None:
+            node = nodes[node_id]
+            leader_id = self._by_number[self._block_top[node["value"]]]
+            if leader_id != node_id and leader_id != node["parent"]:
+                self._swap(node_id, leader_id)
+                swaps.append((node_id, leader_id))
+            self._increment(node_id)
+            incremented.append(node_id)
+            node_id = node["parent"]
+
+        self.updates += 1
+        self.swaps += len(swaps)
+        return {"symbol": symbol, "new": is_new, "leaf": leaf_id, "swaps": swaps, "incremented": incremented}
+
+    def _new_node(self, number: int, symbol=None, parent: Optional[int] = None) -> Dict[str, Any]:
+        node = {
+            "id": next(self._id_iter),
+            "value": 0,
+            "left": None,
+            "right": None,
+            "parent": parent,
+            "symbol": symbol,
+            "number": number,
+        }
+        self._nodes[node["id"]] = node
+        self._by_number[number] = node["id"]
+        return node
+
+    def _split_nyt(self, symbol) -> Tuple[int, int]:
+        """
+        旧 NYT 变成内部节点，左孩子为新 NYT，右孩子为新符号的叶子；
+        叶子与旧 NYT 的权重都记为 1。返回 (叶子 id, 旧 NYT id)。
+        """
+        old = self._nodes[self._nyt]
+        number = old["number"]
+        leaf = self._new_node(number - 1, symbol=symbol, parent=old["id"])
+        nyt = self._new_node(number - 2, parent=old["id"])
+        old["left"] = nyt["id"]
+        old["right"] = leaf["id"]
+        old["value"] = 1
+        leaf["value"] = 1
+        self._leaves[symbol] = leaf["id"]
+        self._nyt = nyt["id"]
+        # 其余节点的权重都不小于 1，权重 0 只剩新 NYT
+        self._block_top[0] = nyt["number"]
+        self._block_top.setdefault(1, number)
+        return leaf["id"], old["id"]
+
+    def _increment(self, node_id: int):
+        """
+        权重加一并维护两个块的块首。node_id 通常就是块首；
+        唯一的例外是块首为其父节点（兄弟是 NYT），父节点紧接着也会加一。
+        """
+        node = self._nodes[node_id]
+        weight = node["value"]
+        number = node["number"]
+        if self._block_top[weight] == number:
+            below = self._by_number.get(number - 1)
+            if below is not None and self._nodes[below]["value"] == weight:
+                self._block_top[weight] = number - 1
+            else:
+                del self._block_top[weight]
+        node["value"] = weight + 1
+        self._block_top[weight + 1] = max(self._block_top.get(weight + 1, number), number)
+
+    def _swap(self, a_id: int, b_id: int):
+        """交换两棵子树在树中的位置及编号（两者互不为祖先）。"""
+        nodes = self._nodes
+        a = nodes[a_id]
+        b = nodes[b_id]
+        a_parent = nodes[a["parent"]]
+        b_parent = nodes[b["parent"]]
+        a_side = "left" if a_parent["left"] == a_id else "right"
+        b_side = "left" if b_parent["left"] == b_id else "right"
+        a_parent[a_side] = b_id
+        b_parent[b_side] = a_id
+        a["parent"], b["parent"] = b["parent"], a["parent"]
+        a["number"], b["number"] = b["number"], a["number"]
+        self._by_number[a["number"]] = a_id
+        self._by_number[b["number"]] = b_id
+
+    def check_invariants(self):
+        """校验兄弟性质：按编号从小到大权重单调不减，内部节点权重等于两孩子之和。"""
+        numbers = sorted(self._by_number)
+        weights = [self._nodes[self._by_number[number]]["value"] for number in numbers]
+        assert all(a <= b for a, b in zip(weights, weights[1:])), "sibling property violated"
+        for node in self._nodes.values():
+            if node["left"] is not None:
+                total = self._nodes[node["left"]]["value"] + self._nodes[node["right"]]["value"]
+                assert node["value"] == total, "internal weight mismatch"
+        for weight, top in self._block_top.items():
+            assert self._nodes[self._by_number[top]]["value"] == weight
+            above = self._by_number.get(top + 1)
+            assert above is None or self._nodes[above]["value"] > weight
+
+
+# ---------- 流式编解码（无界面） ----------
+
+def encode_stream(chunks: Iterable[bytes], model: Optional[AdaptiveHuffmanModel] = None) -> Iterator[bytes]:
+    """
+    逐块编码字节流，每块产出已凑满的整字节；结束时补齐最后不足 8 位的部分（低位补 0）。
+    只保存一棵至多 513 个节点的树和至多 64 位加一个码字的余位，内存与输入长度及分块方式无关。
+    """
+    model = model or AdaptiveHuffmanModel(symbol_bits=8)
+    acc = 0
+    nbits = 0
+    for chunk in chunks:
+        out = bytearray()
+        for byte in chunk:
+            value, length = model.code_value(byte)
+            acc = (acc << length) | value
+            nbits += length
+            model.update(byte)
+            # 每攒够 64 位就转成字节，acc 只保留余位，移位代价与块大小无关
+            if nbits >= 64:
+                whole = nbits - nbits % 8
+                nbits -= whole
+                out += (acc >> nbits).to_bytes(whole // 8, "big")
+                acc &= (1 << nbits) - 1
+        whole = nbits - nbits % 8
+        if whole:
+            nbits -= whole
+            out += (acc >> nbits).to_bytes(whole // 8, "big")
+            acc &= (1 << nbits) - 1
+        if out:
+            yield bytes(out)
+    if nbits:
+        yield bytes([acc << (8 - nbits)])
+
+
+def decode_stream(
+    chunks: Iterable[bytes],
+    count: int,
+    model: Optional[AdaptiveHuffmanModel] = None,
+) -> Iterator[bytes]:
+    """逐块解码 encode_stream 的输出，共解出 count 个字节；每输入一块产出该块能解出的字节。"""
+    model = model or AdaptiveHuffmanModel(symbol_bits=8)
+    nodes = model._nodes
+    pending: List[int] = []
+    produced = 0
+
+    for chunk in chunks:
+        for byte in chunk:
+            for shift in range(7, -1, -1):
+                pending.append((byte >> shift) & 1)
+        out = bytearray()
+        cursor = 0
+        available = len(pending)
+        # 只在位数足以解出一个完整符号时才消费，未完成的前缀留到下一块
+        while produced < count:
+            position = cursor
+            node = nodes[model.root]
+            while node["left"] is not None and position < available:
+                node = nodes[node["right"] if pending[position] else node["left"]]
+                position += 1
+            if node["left"] is not None:
+                break
+            if node["id"] == model.nyt:
+                if position + model.symbol_bits > available:
+                    break
+                symbol = 0
+                for bit in pending[position:position + model.symbol_bits]:
+                    symbol = (symbol << 1) | bit
+                position += model.symbol_bits
+            else:
+                symbol = node["symbol"]
+            cursor = position
+            model.update(symbol)
+            out.append(symbol)
+            produced += 1
+        del pending[:cursor]
+        yield bytes(out)
+
+
+def encode(data: bytes) -> bytes:
+    return b"".join(encode_stream([data]))
+
+
+def decode(payload: bytes, count: int) -> bytes:
+    return b"".join(decode_stream([payload], count))
@@ -0,0 +1,144 @@
+"""
+码长与规范码：从哈夫曼树读出码长、限制最大码长的 package-merge、
+由码长分配规范（canonical）码字，以及按规范码重建一棵树供视图展示。
+"""
+
+import itertools
+from typing import Any, Dict, Hashable, Iterator, List, Mapping, Optional, Tuple
+
+
+def tree_code_lengths(final_tree: Mapping) -> Dict[int, int]:
+    """返回 {叶子 id: 深度}；只有一个叶子时码长记为 1。"""
+    nodes = {node["id"]: node for node in final_tree.get("nodes", [])}
+    root = final_tree.get("root")
+    if root not in nodes:
+        return {}
+    lengths: Dict[int, int] = {}
+    stack = [(root, 0)]
+    while stack:
+        node_id, depth = stack.pop()
+        node = nodes[node_id]
+        if node["left"] is None and node["right"] is None:
+            lengths[node_id] = max(1, depth)
+            continue
+        for child in (node["left"], node["right"]):
+            if child is not None:
+                stack.append((child, depth + 1))
+    return lengths
+
+
+def canonical_codes(lengths: Mapping[Hashable, int]) -> Dict[Hashable, Tuple[int, int]]:
+    """按 (码长, 符号) 排序依次分配码字，返回 {符号: (码字, 码长)}。"""
+    codes: Dict[Hashable, Tuple[int, int]] = {}
+    code = 0
+    previous = 0
+    for symbol, length in sorted(lengths.items(), key=lambda item: (item[1], item[0])):
+        code <<= length - previous
+        codes[symbol] = (code, length)
+        code += 1
+        previous = length
+    return codes
+
+
+def package_merge_lengths(weights: Mapping[Hashable, float], max_length: int) -> Dict[Hashable, int]:
+    """
+    package-merge：在最大码长不超过 max_length 的前提下求加权总码长最小的码长分配，O(n·L)。
+
+    自最深一层起，把上一层有序列表两两打包，再与原始叶子归并成下一层列表；
+    到第 1 层取前 2n-2 项。被选中的项在每一层都是列表前缀，叶子也总是排在叶子序列的前缀，
+    所以每层只需记录“是否为叶子”，回推时按前缀长度给最轻的若干符号各加 1 即可。
+    """
+    ordered = sorted((weight, symbol) for symbol, weight in weights.items() if weight > 0)
+    count = len(ordered)
+    if count == 0:
+        return {}
+    if count == 1:
+        return {ordered[0][1]: 1}
+    if max_length < 1 or count > 1 << max_length:
+        raise ValueError(f"{count} symbols cannot fit in codes of at most {max_length} bits")
+
+    leaf_weights = [weight for weight, _ in ordered]
+    # is_leaf[level] 为该层归并列表中每一项是否为原始叶子
+    is_leaf: List[Optional[bytearray]] = [None] * (max_length + 1)
+    current = leaf_weights
+    is_leaf[max_length] = bytearray(b"\x01") * count
+    for level in range(max_length - 1, 0, -1):
+        packages = [current[i] + current[i + 1] for i in range(0, len(current) - 1, 2)]
+        merged: List[float] = []
+        flags = bytearray()
+        i = j = 0
+        while i < count or j < len(packages):
+            if j >= len(packages) or (i < count and leaf_weights[i] <= packages[j]):
+                merged.append(leaf_weights[i])
+                flags.append(1)
+                i += 1
+            else:
+                merged.append(packages[j])
+                flags.append(0)
+                j += 1
+        is_leaf[level] = flags
+        current = merged
+
+    lengths = [0] * count
+    take = 2 * count - 2
+    for level in range(1, max_length + 1):
+        leaves = sum(is_leaf[level][:take])
+        for index in range(leaves):
+            lengths[index] += 1
+        take = 2 * (take - leaves)
+        if take == 0:
+            break
+    return {symbol: length for (_, symbol), length in zip(ordered, lengths)}
+
+
+def canonical_tree(
+    codes: Mapping[int, Tuple[int, int]],
+    leaf_values: Mapping[int, float],
+    id_iter: Optional[Iterator[int]] = None,
+) -> Dict[str, Any]:
+    """
+    按规范码把叶子挂到一棵新树上（0 走左、1 走右），内部节点取新 id、值为子树权重之和。
+    返回与 HuffmanModel 相同格式的快照。
+    """
+    id_iter = id_iter or itertools.count(max(codes, default=-1) + 1)
+    if not codes:
+        return {"root": None, "nodes": []}
+    nodes: Dict[int, Dict[str, Any]] = {}
+    if len(codes) == 1:
+        leaf_id = next(iter(codes))
+        nodes[leaf_id] = {"id": leaf_id, "value": leaf_values[leaf_id], "left": None, "right": None}
+        return {"root": leaf_id, "nodes": list(nodes.values())}
+
+    root_id = next(id_iter)
+    nodes[root_id] = {"id": root_id, "value": 0, "left": None, "right": None}
+    for leaf_id, (code, length) in codes.items():
+        parent_id = root_id
+        for shift in range(length - 1, -1, -1):
+            side = "right" if (code >> shift) & 1 else "left"
+            child_id = nodes[parent_id][side]
+            if shift == 0:
+                child_id = leaf_id
+                nodes[leaf_id] = {"id": leaf_id, "value": leaf_values[leaf_id], "left": None, "right": None}
+            elif child_id is None:
+                child_id = next(id_iter)
+                nodes[child_id] = {"id": child_id, "value": 0, "left": None, "right": None}
+            nodes[parent_id][side] = child_id
+            parent_id = child_id
+
+    # 后序累加内部节点的权重
+    order: List[int] = []
+    stack = [root_id]
+    while stack:
+        node_id = stack.pop()
+        order.append(node_id)
+        for child in (nodes[node_id]["left"], nodes[node_id]["right"]):
+            if child is not None and child not in leaf_values:
+                stack.append(child)
+    for node_id in reversed(order):
+        node = nodes[node_id]
+        node["value"] = sum(nodes[child]["value"] for child in (node["left"], node["right"]) if child is not None)
+    return {"root": root_id, "nodes": list(nodes.values())}
+
+
+def format_code(code: int, length: int) -> str:
+    return format(code, f"0{length}b")
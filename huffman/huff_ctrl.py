@@ -1,17 +1,26 @@
 import re
 from typing import List
 
+from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (
+    QApplication,
+    QComboBox,
+    QFileDialog,
     QFormLayout,
     QGroupBox,
+    QLabel,
     QLineEdit,
+    QProgressDialog,
     QPushButton,
+    QSpinBox,
     QVBoxLayout,
     QWidget,
     QMessageBox,
 )
 
 from core.global_ctrl import GlobalController
+from huffman.huff_adaptive import AdaptiveHuffmanModel
+from huffman.huff_freq import count_file_parallel, describe_symbol, weights_from_counts
 from huffman.huff_model import HuffmanModel
 from huffman.huff_view import HuffmanView
 
@@ -19,8 +28,15 @@ from huffman.huff_view import HuffmanView
 class HuffmanController(QWidget):
     """
     单一操作：“构建哈夫曼树”，输入一组正数，按顺序播放排序 + 构建动画。
+    也可以从本地文件统计字节 / 字符频率作为权重，或输入一段文本逐字节演示自适应哈夫曼。
     """
 
+    FILE_MODES = (("字节", "bytes"), ("字符 (UTF-8)", "chars"))
+    # 符号过多时动画会非常长，超过该数量先确认
+    FILE_SYMBOL_WARNING = 256
+    # 自适应演示每个字节一步，限制输入长度
+    ADAPTIVE_MAX_BYTES = 64
+
     def __init__(self, global_ctrl: GlobalController):
         super().__init__()
         self.model = HuffmanModel()
@@ -34,6 +50,43 @@ class HuffmanController(QWidget):
         self.build_btn = QPushButton("构建哈夫曼树")
         self.build_btn.clicked.connect(self._on_build)
 
+        self.strategy_combo = QComboBox()
+        self.strategy_combo.addItem("双队列 O(n)", "two_queue")
+        self.strategy_combo.addItem("小根堆 O(n log n)", "heap")
+        self.strategy_combo.currentIndexChanged.connect(self._on_strategy_changed)
+
+        # 0 表示不限制码长
+        self.max_length_spin = QSpinBox()
+        self.max_length_spin.setRange(0, 32)
+        self.max_length_spin.setSpecialValueText("不限")
+        self.max_length_spin.setValue(0)
+
+        self.stats_label = QLabel()
+        self.stats_label.setStyleSheet("color: white;")
+        self.stats_label.setWordWrap(True)
+
+        self.file_mode_combo = QComboBox()
+        for label, mode in self.FILE_MODES:
+            self.file_mode_combo.addItem(label, mode)
+
+        self.file_btn = QPushButton("从文件构建…")
+        self.file_btn.clicked.connect(self._on_build_from_file)
+
+        self.file_label = QLabel()
+        self.file_label.setStyleSheet("color: white;")
+        self.file_label.setWordWrap(True)
+
+        self.adaptive_edit = QLineEdit()
+        self.adaptive_edit.setPlaceholderText("例如：abracadabra")
+        self.adaptive_edit.returnPressed.connect(self._on_adaptive)
+
+        self.adaptive_btn = QPushButton("逐字节更新")
+        self.adaptive_btn.clicked.connect(self._on_adaptive)
+
+        self.adaptive_label = QLabel()
+        self.adaptive_label.setStyleSheet("color: white;")
+        self.adaptive_label.setWordWrap(True)
+
         self.panel = self._create_panel()
         self.view.interactionLocked.connect(self._handle_lock)
 
@@ -44,12 +97,37 @@ class HuffmanController(QWidget):
         form.setContentsMargins(12, 10, 12, 12)
         form.setSpacing(8)
         form.addRow("权重列表:", self.input_edit)
+        form.addRow("建树方式:", self.strategy_combo)
+        form.addRow("最大码长:", self.max_length_spin)
         form.addRow(self.build_btn)
+        form.addRow(self.stats_label)
+
+        file_group = QGroupBox("From File")
+        file_group.setStyleSheet("QGroupBox { color: white; }")
+        file_form = QFormLayout()
+        file_form.setContentsMargins(12, 10, 12, 12)
+        file_form.setSpacing(8)
+        file_form.addRow("统计单位:", self.file_mode_combo)
+        file_form.addRow(self.file_btn)
+        file_form.addRow(self.file_label)
+        file_group.setLayout(file_form)
+
+        adaptive_group = QGroupBox("Adaptive (FGK)")
+        adaptive_group.setStyleSheet("QGroupBox { color: white; }")
+        adaptive_form = QFormLayout()
+        adaptive_form.setContentsMargins(12, 10, 12, 12)
+        adaptive_form.setSpacing(8)
+        adaptive_form.addRow("文本:", self.adaptive_edit)
+        adaptive_form.addRow(self.adaptive_btn)
+        adaptive_form.addRow(self.adaptive_label)
+        adaptive_group.setLayout(adaptive_form)
 
         container = QWidget()
         layout = QVBoxLayout(container)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.addWidget(group)
+        layout.addWidget(file_group)
+        layout.addWidget(adaptive_group)
         layout.addStretch(1)
         group.setLayout(form)
         return container
@@ -72,12 +150,115 @@ class HuffmanController(QWidget):
         values = self._parse_values(self.input_edit.text())
         if values is None:
             return
-        process = self.model.build_process(values)
-        if not process["sorting"] and not process["building"]:
+        process = self._build(values)
+        if process is None:
+            return
+        if not process["initial"]:
             QMessageBox.information(self, "提示", "请输入至少一个正数。")
             return
+        self._show_build_stats(process)
+        self.view.play_process(process)
+
+    def _on_strategy_changed(self):
+        self.model.build_strategy = self.strategy_combo.currentData()
+
+    def _build(self, values):
+        max_length = self.max_length_spin.value() or None
+        try:
+            return self.model.build_process(values, max_code_length=max_length)
+        except ValueError as exc:
+            QMessageBox.warning(self, "码长过短", str(exc))
+            return None
+
+    def _show_build_stats(self, process):
+        stats = self.model.build_stats
+        lines = []
+        if stats:
+            lines.append(
+                f"{stats['strategy']}：合并 {stats['merges']} 次，比较 {stats['comparisons']} 次，"
+                f"耗时 {stats['seconds'] * 1000:.2f} ms"
+            )
+        codes = process["codes"]
+        if codes:
+            weights = {leaf["id"]: leaf["value"] for leaf in process["initial"]}
+            total = sum(weights.values())
+            average = sum(weights[leaf_id] * length for leaf_id, (_code, length) in codes.items()) / total
+            longest = max(length for _code, length in codes.values())
+            limited = "（已按上限重新分配）" if process["limited_tree"] else ""
+            lines.append(f"最长码长 {longest}，加权平均码长 {average:.3f}{limited}")
+        self.stats_label.setText("\n".join(lines))
+
+    def _on_build_from_file(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Count Symbols", "", "All Files (*)")
+        if not path:
+            return
+
+        progress = QProgressDialog("正在统计频率…", "取消", 0, 1000, self)
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(300)
+
+        class _Cancelled(Exception):
+            pass
+
+        def _report(done, total):
+            progress.setValue(int(done * 1000 / total) if total else 1000)
+            QApplication.processEvents()
+            if progress.wasCanceled():
+                raise _Cancelled()
+
+        try:
+            counts = count_file_parallel(path, mode=self.file_mode_combo.currentData(), progress=_report)
+        except _Cancelled:
+            return
+        except OSError as exc:
+            QMessageBox.critical(self, "Open Failed", f"无法读取文件：\n{exc}")
+            return
+        finally:
+            progress.close()
+
+        symbols, weights = weights_from_counts(counts)
+        if not symbols:
+            QMessageBox.information(self, "提示", "文件为空。")
+            return
+        if len(symbols) > self.FILE_SYMBOL_WARNING:
+            answer = QMessageBox.question(
+                self,
+                "符号较多",
+                f"文件中共有 {len(symbols)} 种符号，动画会很长，是否继续？",
+            )
+            if answer != QMessageBox.Yes:
+                return
+
+        top = sorted(zip(weights, symbols), reverse=True)[:8]
+        preview = ", ".join(f"{describe_symbol(symbol)}:{weight}" for weight, symbol in top)
+        self.file_label.setText(f"{len(symbols)} 种符号，共 {sum(weights)} 个；最常见：{preview}")
+        process = self._build(weights)
+        if process is None:
+            return
+        self._show_build_stats(process)
         self.view.play_process(process)
 
+    def _on_adaptive(self):
+        data = self.adaptive_edit.text().encode("utf-8")
+        if not data:
+            QMessageBox.warning(self, "提示", "请输入一段文本。")
+            return
+        if len(data) > self.ADAPTIVE_MAX_BYTES:
+            QMessageBox.warning(self, "提示", f"文本过长，最多 {self.ADAPTIVE_MAX_BYTES} 个字节（UTF-8）。")
+            return
+
+        model = AdaptiveHuffmanModel(symbol_bits=8)
+        frames = []
+        bits = 0
+        for byte in data:
+            bits += model.code_value(byte)[1]
+            record = model.update(byte)
+            frames.append({"record": record, "snapshot": model.snapshot()})
+        self.adaptive_label.setText(
+            f"{len(data)} 字节 → {bits} 位（原始 {len(data) * 8} 位），交换 {model.swaps} 次"
+        )
+        self.view.play_adaptive(frames)
+
     def _parse_values(self, text: str):
         text = text.strip()
         if not text:
@@ -101,4 +282,10 @@ class HuffmanController(QWidget):
     def _handle_lock(self, locked: bool):
         self._panel_locked = locked
         self.build_btn.setDisabled(locked)
-        self.input_edit.setDisabled(locked)
\ No newline at end of file
+        self.input_edit.setDisabled(locked)
+        self.file_btn.setDisabled(locked)
+        self.strategy_combo.setDisabled(locked)
+        self.max_length_spin.setDisabled(locked)
+        self.file_mode_combo.setDisabled(locked)
+        self.adaptive_edit.setDisabled(locked)
+        self.adaptive_btn.setDisabled(locked)
\ No newline at end of file
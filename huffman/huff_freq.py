@@ -0,0 +1,194 @@
+"""
+从本地文件统计符号频率，作为哈夫曼树的权重输入。
+
+文件通过 mmap 按固定大小的块读取，每块以 memoryview 切片交给 Counter 累加，
+不会把整个文件读入内存，任意大小的文件内存占用都只与块大小有关。
+count_file_parallel 把文件按字节范围分给多个进程，各进程自行映射文件。
+"""
+
+import codecs
+import mmap
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+COUNT_MODES = ("bytes", "chars")
+DEFAULT_CHUNK_SIZE = 1 << 22
+
+ProgressCallback = Callable[[int, int], None]
+
+
+def iter_file_chunks(
+    path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> Iterator[memoryview]:
+    """
+    依次产出文件映射上 [start, end) 范围内的只读切片；调用方拿到下一块之前，上一块就会被释放。
+    空文件不产出任何块（mmap 不能映射长度为 0 的文件）。
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    with open(path, "rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        end = size if end is None else min(end, size)
+        if size == 0 or start >= end:
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                for offset in range(start, end, chunk_size):
+                    chunk = view[offset:min(offset + chunk_size, end)]
+                    try:
+                        yield chunk
+                    finally:
+                        chunk.release()
+            finally:
+                # 关闭映射前必须释放全部导出的缓冲区
+                view.release()
+
+
+def count_file(
+    path,
+    mode: str = "bytes",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress: Optional[ProgressCallback] = None,
+    encoding: str = "utf-8",
+) -> Dict:
+    """
+    统计文件中每个字节（mode="bytes"）或字符（mode="chars"）出现的次数。
+    progress(已处理字节数, 文件总字节数) 在每块处理完后调用一次。
+    字符模式使用增量解码，跨块的多字节字符不会被截断，非法字节按 U+FFFD 计数。
+    """
+    if mode not in COUNT_MODES:
+        raise ValueError(f"unknown count mode: {mode}")
+    total = os.path.getsize(path)
+
+    def _on_chunk(done):
+        if progress is not None:
+            progress(done, total)
+
+    return dict(_count_range(path, 0, total, mode, encoding, chunk_size, _on_chunk))
+
+
+def _count_range(path, start, end, mode, encoding, chunk_size, on_chunk=None) -> Counter:
+    """统计 [start, end) 字节范围；on_chunk(本范围内已处理字节数) 在每块之后调用。"""
+    counts: Counter = Counter()
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace") if mode == "chars" else None
+    done = 0
+    for chunk in iter_file_chunks(path, chunk_size, start, end):
+        if decoder is None:
+            counts.update(chunk)
+        else:
+            counts.update(decoder.decode(chunk))
+        done += len(chunk)
+        if on_chunk is not None:
+            on_chunk(done)
+    if decoder is not None:
+        counts.update(decoder.decode(b"", final=True))
+    return counts
+
+
+# ---------- 多进程 ----------
+
+def split_ranges(path, parts: int, mode: str = "bytes", encoding: str = "utf-8") -> List[Tuple[int, int]]:
+    """
+    把文件切成约 parts 段连续字节范围。字符模式下边界向后挪到 UTF-8 字符的起始字节，
+    保证每个字符只落在一段里；其他编码无法安全切分，只返回一段。
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    if mode == "chars" and codecs.lookup(encoding).name != "utf-8":
+        return [(0, size)]
+    parts = max(1, min(parts, size))
+    bounds = [size * index // parts for index in range(parts + 1)]
+    if mode == "chars":
+        with open(path, "rb") as fh:
+            for index in range(1, parts):
+                fh.seek(bounds[index])
+                # 续字节形如 10xxxxxx，一个字符最多 3 个续字节
+                head = fh.read(4)
+                shift = 0
+                while shift < len(head) and head[shift] & 0xC0 == 0x80:
+                    shift += 1
+                bounds[index] = min(size, bounds[index] + shift)
+    return [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if lo < hi]
+
+
+def _count_range_worker(args) -> Tuple[Dict, int]:
+    # 子进程自行映射文件，只有范围参数和结果直方图需要跨进程传递
+    path, start, end, mode, encoding, chunk_size = args
+    return dict(_count_range(path, start, end, mode, encoding, chunk_size)), end - start
+
+
+def count_file_parallel(
+    path,
+    mode: str = "bytes",
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress: Optional[ProgressCallback] = None,
+    encoding: str = "utf-8",
+    ranges_per_worker: int = 4,
+) -> Dict:
+    """
+    用 ProcessPoolExecutor 按字节范围并行统计，父进程合并各段直方图，结果与 count_file 相同。
+    每个进程分到多段以平衡负载，progress 在每段完成时调用。
+    文件不足以切成两块或只有一个进程时直接走单进程路径。
+    """
+    if mode not in COUNT_MODES:
+        raise ValueError(f"unknown count mode: {mode}")
+    workers = workers or os.cpu_count() or 1
+    total = os.path.getsize(path)
+    if workers == 1 or total <= chunk_size:
+        return count_file(path, mode, chunk_size, progress, encoding)
+
+    ranges = split_ranges(path, workers * ranges_per_worker, mode, encoding)
+    if len(ranges) == 1:
+        return count_file(path, mode, chunk_size, progress, encoding)
+
+    counts: Counter = Counter()
+    done = 0
+    jobs = [(os.fspath(path), lo, hi, mode, encoding, chunk_size) for lo, hi in ranges]
+    executor = ProcessPoolExecutor(max_workers=min(workers, len(jobs)))
+    try:
+        futures = [executor.submit(_count_range_worker, job) for job in jobs]
+        for future in as_completed(futures):
+            partial, length = future.result()
+            counts.update(partial)
+            done += length
+            if progress is not None:
+                progress(done, total)
+    except BaseException:
+        # 回调中途取消或某段失败时不再等待剩余的段
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+    return dict(counts)
+
+
+def benchmark_scaling(path, worker_counts=(1, 2, 4, 8), mode: str = "bytes") -> Dict[int, float]:
+    """返回 {进程数: 吞吐 MB/s}，用于观察多核扩展情况。"""
+    size_mb = os.path.getsize(path) / 1e6
+    result = {}
+    for workers in worker_counts:
+        start = time.perf_counter()
+        count_file_parallel(path, mode, workers=workers)
+        result[workers] = size_mb / (time.perf_counter() - start)
+    return result
+
+
+def weights_from_counts(counts: Dict) -> Tuple[List, List[int]]:
+    """按符号排序，返回 (符号列表, 对应权重列表)，可直接交给 HuffmanModel.build_process。"""
+    symbols = sorted(symbol for symbol, count in counts.items() if count > 0)
+    return symbols, [counts[symbol] for symbol in symbols]
+
+
+def describe_symbol(symbol) -> str:
+    """面板上显示用：可打印字符原样显示，其余显示为十六进制。"""
+    if isinstance(symbol, int):
+        return chr(symbol) if 0x21 <= symbol < 0x7F else f"0x{symbol:02X}"
+    return symbol if symbol.isprintable() and not symbol.isspace() else f"U+{ord(symbol):04X}"
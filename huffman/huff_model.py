@@ -1,17 +1,46 @@
 import heapq
 import itertools
-from typing import Any, Dict, List, Tuple
+import time
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional
+
+from huffman.huff_codes import canonical_codes, canonical_tree, package_merge_lengths, tree_code_lengths
+
+
+class _CountedKey:
+    """堆元素：按 (权重, id) 比较，每次比较都累加到共享的 counter[0]。"""
+
+    __slots__ = ("key", "node", "counter")
+
+    def __init__(self, node: Dict[str, Any], counter: List[int]):
+        self.key = (node["value"], node["id"])
+        self.node = node
+        self.counter = counter
+
+    def __lt__(self, other: "_CountedKey") -> bool:
+        self.counter[0] += 1
+        return self.key < other.key
 
 
 class HuffmanModel:
     """
     生成哈夫曼树构建全过程所需的初始序列、排序步骤、合并步骤及最终树结构。
+    同时给出每个叶子的规范码；指定 max_code_length 且哈夫曼树超过该深度时，
+    用 package-merge 重新分配码长，并附带按规范码重建的 ``limited_tree``。
     """
 
-    def __init__(self):
+    # heap：通用小根堆；two_queue：利用叶子已排好序的双队列线性建树，两者合并步骤相同
+    BUILD_STRATEGIES = ("heap", "two_queue")
+
+    def __init__(self, build_strategy: str = "two_queue"):
+        if build_strategy not in self.BUILD_STRATEGIES:
+            raise ValueError(f"unknown build strategy: {build_strategy}")
         self._id_iter = itertools.count()
+        self.build_strategy = build_strategy
+        # 最近一次建树的合并次数、比较次数与耗时
+        self.build_stats: Dict[str, Any] = {}
 
-    def build_process(self, raw_values: List[float]) -> Dict[str, Any]:
+    def build_process(self, raw_values: List[float], max_code_length: Optional[int] = None) -> Dict[str, Any]:
         cleaned: List[float] = []
         for value in raw_values:
             val = float(value)
@@ -21,9 +50,11 @@ class HuffmanModel:
         if not cleaned:
             return {
                 "initial": [],
-                "sorting": [],
+                "sorting": iter(()),
                 "building": [],
                 "final_tree": {"root": None, "nodes": []},
+                "codes": {},
+                "limited_tree": None,
             }
 
         leaf_nodes = [
@@ -32,45 +63,53 @@ class HuffmanModel:
         ]
 
         initial_state = [node.copy() for node in leaf_nodes]
-        sorting_steps, sorted_nodes = self._insertion_sort_steps([node.copy() for node in leaf_nodes])
+        # 插入排序是稳定的，最终次序与按权重稳定排序一致；排序步骤惰性生成，不消费就不计算
+        sorted_nodes = sorted((node.copy() for node in leaf_nodes), key=lambda node: node["value"])
         build_steps, final_snapshot = self._build_steps(sorted_nodes)
+        codes, limited_tree = self._assign_codes(leaf_nodes, final_snapshot, max_code_length)
 
         return {
             "initial": initial_state,
-            "sorting": sorting_steps,
+            "sorting": self.iter_insertion_sort_steps(leaf_nodes),
             "building": build_steps,
             "final_tree": final_snapshot,
+            "codes": codes,
+            "limited_tree": limited_tree,
         }
 
-    # ---------- 排序阶段 ----------
+    # ---------- 码字 ----------
 
-    def _insertion_sort_steps(self, nodes: List[Dict[str, Any]]):
-        steps: List[Dict[str, Any]] = []
-        if not nodes:
-            return steps, []
+    def _assign_codes(self, leaf_nodes, final_snapshot, max_code_length: Optional[int]):
+        """返回 ({叶子 id: (码字, 码长)}, 限长后重建的树或 None)。"""
+        lengths = tree_code_lengths(final_snapshot)
+        if max_code_length is None or max(lengths.values()) <= max_code_length:
+            return canonical_codes(lengths), None
+        weights = {node["id"]: node["value"] for node in leaf_nodes}
+        codes = canonical_codes(package_merge_lengths(weights, max_code_length))
+        return codes, canonical_tree(codes, weights, self._id_iter)
 
-        arr: List[Dict[str, Any]] = list(nodes)
-        for i in range(1, len(arr)):
-            key = arr[i]
+    # ---------- 排序阶段 ----------
+
+    @staticmethod
+    def iter_insertion_sort_steps(nodes: List[Dict[str, Any]]) -> Iterator[Dict[str, int]]:
+        """
+        逐步产出插入排序中每次真正发生的移动：{"key_id", "from_index", "insert_index"}。
+        不携带整列快照，消费方按 pop(from_index) / insert(insert_index) 自行维护当前次序。
+        """
+        ids = [node["id"] for node in nodes]
+        values = [node["value"] for node in nodes]
+        for i in range(1, len(ids)):
+            value = values[i]
             j = i - 1
-            while j >= 0 and arr[j]["value"] > key["value"]:
+            while j >= 0 and values[j] > value:
                 j -= 1
             insert_index = j + 1
             if insert_index == i:
                 continue
-            steps.append(
-                {
-                    "array_before": [node["id"] for node in arr],
-                    "key_id": key["id"],
-                    "from_index": i,
-                    "insert_index": insert_index,
-                }
-            )
-            arr.pop(i)
-            arr.insert(insert_index, key)
-
-        sorted_nodes = [node.copy() for node in arr]
-        return steps, sorted_nodes
+            key_id = ids.pop(i)
+            ids.insert(insert_index, key_id)
+            values.insert(insert_index, values.pop(i))
+            yield {"key_id": key_id, "from_index": i, "insert_index": insert_index}
 
     # ---------- 构建阶段 ----------
 
@@ -78,8 +117,8 @@ class HuffmanModel:
         if not nodes:
             return [], {"root": None, "nodes": []}
 
-        heap: List[Tuple[float, int, Dict[str, Any]]] = []
         node_map: Dict[int, Dict[str, Any]] = {}
+        leaves: List[Dict[str, Any]] = []
         for node in nodes:
             data = {
                 "id": node["id"],
@@ -88,37 +127,91 @@ class HuffmanModel:
                 "right": node.get("right"),
             }
             node_map[data["id"]] = data
-            heapq.heappush(heap, (data["value"], data["id"], data))
-
-        if len(heap) == 1:
-            root_id = heap[0][1]
-            return [], self._build_snapshot(root_id, node_map)
+            leaves.append(data)
+
+        if len(leaves) == 1:
+            self.build_stats = {"strategy": self.build_strategy, "merges": 0, "comparisons": 0, "seconds": 0.0}
+            return [], self._build_snapshot(leaves[0]["id"], node_map)
+
+        started = time.perf_counter()
+        if self.build_strategy == "two_queue":
+            steps, root_id, comparisons = self._merge_two_queue(leaves, node_map)
+        else:
+            steps, root_id, comparisons = self._merge_heap(leaves, node_map)
+        self.build_stats = {
+            "strategy": self.build_strategy,
+            "merges": len(steps),
+            "comparisons": comparisons,
+            "seconds": time.perf_counter() - started,
+        }
+        return steps, self._build_snapshot(root_id, node_map)
 
+    def _make_parent(self, left_node, right_node, node_map, steps) -> Dict[str, Any]:
+        parent_id = next(self._id_iter)
+        parent_node = {
+            "id": parent_id,
+            "value": left_node["value"] + right_node["value"],
+            "left": left_node["id"],
+            "right": right_node["id"],
+        }
+        node_map[parent_id] = parent_node
+        steps.append(
+            {
+                "left_id": left_node["id"],
+                "right_id": right_node["id"],
+                "parent": parent_node.copy(),
+            }
+        )
+        return parent_node
+
+    def _merge_heap(self, leaves, node_map):
+        """
+        小根堆按 (权重, id) 出堆，O(n log n)。
+        堆元素包在 _CountedKey 里，heapq 每调用一次 __lt__ 计一次比较，与双队列的计数口径一致。
+        """
+        counter = [0]
+        heap: List[_CountedKey] = [_CountedKey(data, counter) for data in leaves]
+        heapq.heapify(heap)
         steps: List[Dict[str, Any]] = []
         while len(heap) >= 2:
-            left_val, _, left_node = heapq.heappop(heap)
-            right_val, _, right_node = heapq.heappop(heap)
-
-            parent_id = next(self._id_iter)
-            parent_node = {
-                "id": parent_id,
-                "value": left_val + right_val,
-                "left": left_node["id"],
-                "right": right_node["id"],
-            }
-            node_map[parent_id] = parent_node
-            heapq.heappush(heap, (parent_node["value"], parent_id, parent_node))
-
-            steps.append(
-                {
-                    "left_id": left_node["id"],
-                    "right_id": right_node["id"],
-                    "parent": parent_node.copy(),
-                }
-            )
-
-        root_id = heap[0][1]
-        return steps, self._build_snapshot(root_id, node_map)
+            left_node = heapq.heappop(heap).node
+            right_node = heapq.heappop(heap).node
+            parent_node = self._make_parent(left_node, right_node, node_map, steps)
+            heapq.heappush(heap, _CountedKey(parent_node, counter))
+        return steps, heap[0].node["id"], counter[0]
+
+    def _merge_two_queue(self, leaves, node_map):
+        """
+        双队列建树，要求叶子已按 (权重, id) 有序，O(n)。
+        新生成的父节点权重单调不减、id 单调递增，因此内部节点队列天然有序；
+        每次比较两队首的 (权重, id)，与堆的出队次序完全一致，合并步骤也相同。
+        """
+        internal: deque = deque()
+        steps: List[Dict[str, Any]] = []
+        comparisons = 0
+        index = 0
+        total = len(leaves)
+
+        def pop_min():
+            nonlocal index, comparisons
+            if index < total and internal:
+                comparisons += 1
+                leaf = leaves[index]
+                head = internal[0]
+                if (leaf["value"], leaf["id"]) <= (head["value"], head["id"]):
+                    index += 1
+                    return leaf
+                return internal.popleft()
+            if index < total:
+                index += 1
+                return leaves[index - 1]
+            return internal.popleft()
+
+        for _ in range(total - 1):
+            left_node = pop_min()
+            right_node = pop_min()
+            internal.append(self._make_parent(left_node, right_node, node_map, steps))
+        return steps, internal[0]["id"], comparisons
 
     @staticmethod
     def _build_snapshot(root_id: int, node_map: Dict[int, Dict[str, Any]]):
@@ -1,5 +1,5 @@
 import math
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from PyQt5.QtCore import QEvent, QPointF, QRectF, Qt, pyqtSignal
 from PyQt5.QtGui import QColor, QBrush, QPen, QPainterPath
@@ -11,6 +11,9 @@ from PyQt5.QtWidgets import (
 )
 
 from core.base_view import BaseStructureView
+from core.tree_layout import IncrementalForestLayout, inorder_layout
+from huffman.huff_codes import format_code
+from huffman.huff_freq import describe_symbol
 
 
 class HuffmanView(BaseStructureView):
@@ -19,6 +22,7 @@ class HuffmanView(BaseStructureView):
     1. 数列依次飞入至底部；
     2. 通过插入排序展示重排过程；
     3. 按哈夫曼构建步骤反复选取最小节点，在中央合并并生成父节点，最后落位成树。
+    play_adaptive 另行播放自适应哈夫曼（FGK）逐符号更新的过程。
     """
 
     def __init__(self, global_ctrl):
@@ -38,16 +42,19 @@ class HuffmanView(BaseStructureView):
         self._level_gap = 120
         self._first_merge_centered = False
 
+        # 合并过程中的森林布局：增量维护中序序号，横向偏移按最终节点数固定，
+        # 这样每次合并只有被合并的子树和其右侧的树需要移动
+        self._forest_h_gap = 120
+        self._forest_v_gap = 110
+        self._forest_layout = IncrementalForestLayout()
+        self._forest_offset = 0.0
+
     # ---------- 生命周期 ----------
 
     def reset(self):
         self.stop_all_animations()
-        # 逐条边断开 signal-slot，防止场景清空后访问悬空对象
-        for edge in list(self.edge_items.values()):
-            edge.dispose()
-            if edge.scene():
-                self.scene.removeItem(edge)
-        self.scene.clear()
+        # 连线都已登记，clear_scene 会先断开 signal-slot 再清空场景
+        self.clear_scene()
         self.node_items.clear()
         self.edge_items.clear()
         self.tree_structure.clear()
@@ -56,6 +63,7 @@ class HuffmanView(BaseStructureView):
         self.queue_order.clear()
         self.in_queue_ids.clear()
         self._first_merge_centered = False
+        self._forest_layout.reset()
 
     def play_process(self, timeline):
         self.reset()
@@ -64,16 +72,20 @@ class HuffmanView(BaseStructureView):
         sorting = timeline.get("sorting") or []
         building = timeline.get("building") or []
         final_tree = timeline.get("final_tree")
+        limited_tree = timeline.get("limited_tree")
+        codes = timeline.get("codes") or {}
 
         sequence = self.anim.sequential()
         if initial:
             sequence.addAnimation(self._animate_initial_fly_in(initial))
-        if sorting:
-            sequence.addAnimation(self._animate_insertion_sort(sorting))
+        sequence.addAnimation(self._animate_insertion_sort(sorting))
         if building:
             sequence.addAnimation(self._animate_build_phase(building, final_tree))
         elif final_tree:
             sequence.addAnimation(self._animate_final_layout(final_tree))
+        if limited_tree:
+            sequence.addAnimation(self._animate_limited_tree(limited_tree))
+        self._apply_code_tooltips(codes)
 
         if sequence.animationCount() == 0:
             return
@@ -117,33 +129,31 @@ class HuffmanView(BaseStructureView):
 
     # ---------- 插入排序动画 ----------
 
-    def _animate_insertion_sort(self, steps: List[Dict]):
-        if not steps:
-            return self.anim.pause(0)
-
+    def _animate_insertion_sort(self, steps: Iterable[Dict]):
+        # steps 可以是生成器；每步只含移动信息，queue_order 在这里增量维护
         sequence = self.anim.sequential()
+        positions = self._queue_positions(len(self.queue_order))
         for step in steps:
-            sequence.addAnimation(self._animate_insert_step(step))
+            sequence.addAnimation(self._animate_insert_step(step, positions))
+        if sequence.animationCount() == 0:
+            return self.anim.pause(0)
         return sequence
 
-    def _animate_insert_step(self, step: Dict):
-        order_before = list(step["array_before"])
+    def _animate_insert_step(self, step: Dict, positions: Optional[List[QPointF]] = None):
+        order_before = self.queue_order
         key_id = step["key_id"]
         from_idx = step["from_index"]
         insert_idx = step["insert_index"]
 
-        if order_before != self.queue_order:
-            self.queue_order = order_before[:]
-
         if from_idx == insert_idx:
             return self.anim.pause(0)
 
-        positions = self._queue_positions(len(order_before))
-        idx_pos = {idx: positions[idx] for idx in range(len(positions))}
+        idx_pos = positions or self._queue_positions(len(order_before))
         hover_height = 120
 
         key_item = self.node_items.get(key_id)
         if not key_item:
+            order_before.insert(insert_idx, order_before.pop(from_idx))
             return self.anim.pause(0)
 
         raise_duration = 180        # 原 360 → 加速 2×
@@ -153,10 +163,11 @@ class HuffmanView(BaseStructureView):
 
         sequence = self.anim.sequential()
         raise_target = QPointF(idx_pos[from_idx].x(), idx_pos[from_idx].y() - hover_height)
-        sequence.addAnimation(self.anim.move_item(key_item, raise_target, duration=raise_duration))
-
         hover_target = QPointF(idx_pos[insert_idx].x(), raise_target.y())
-        sequence.addAnimation(self.anim.move_item(key_item, hover_target, duration=hover_duration))
+        # 抬起与平移合成一条弧线，按弧长匀速移动
+        arc = QPainterPath(idx_pos[from_idx])
+        arc.cubicTo(raise_target, raise_target, hover_target)
+        sequence.addAnimation(self.anim.path_item(key_item, arc, duration=raise_duration + hover_duration))
 
         shift_motions = []
         if insert_idx < from_idx:
@@ -184,10 +195,8 @@ class HuffmanView(BaseStructureView):
         drop_target = QPointF(idx_pos[insert_idx].x(), self._queue_y)
         sequence.addAnimation(self.anim.move_item(key_item, drop_target, duration=drop_duration))
 
-        order_after = order_before[:]
-        value = order_after.pop(from_idx)
-        order_after.insert(insert_idx, value)
-        self.queue_order = order_after
+        # 动画已按移动前的次序生成，此时再原地更新队列次序
+        order_before.insert(insert_idx, order_before.pop(from_idx))
 
         return sequence
 
@@ -200,6 +209,10 @@ class HuffmanView(BaseStructureView):
                 sequence.addAnimation(self._animate_final_layout(final_snapshot))
             return sequence
 
+        self._forest_layout.reset()
+        final_count = len(final_snapshot["nodes"]) if final_snapshot else 2 * len(steps) + 1
+        self._forest_offset = ((final_count - 1) * self._forest_h_gap) / 2.0
+
         for step in steps:
             sequence.addAnimation(self._animate_merge_step(step))
 
@@ -239,7 +252,8 @@ class HuffmanView(BaseStructureView):
             sequence.addAnimation(self._compress_queue())
 
         sequence.addAnimation(self._animate_parent_creation(step["parent"], geometry["parent_pos"]))
-        sequence.addAnimation(self._animate_tree_relayout())
+        changed = self._forest_layout.merge(step["parent"]["id"], left_id, right_id)
+        sequence.addAnimation(self._animate_tree_relayout(changed))
         return sequence
 
     def _determine_stage_positions(self, left_id: int, right_id: int):
@@ -399,7 +413,7 @@ class HuffmanView(BaseStructureView):
             child_item = self.node_items.get(child_id)
             if not child_item:
                 continue
-            edge = HuffmanEdgeItem(parent_item, child_item)
+            edge = self.track_item(HuffmanEdgeItem(parent_item, child_item))
             edge.setOpacity(0.0)
             self.scene.addItem(edge)
             self.edge_items[(parent_id, child_id)] = edge
@@ -454,34 +468,170 @@ class HuffmanView(BaseStructureView):
         group = self.anim.parallel(*motions) if motions else self.anim.pause(0)
         return self.anim.sequential(group, self.anim.pause(160))
 
+    # ---------- 限长规范码 ----------
+
+    def _animate_limited_tree(self, snapshot: Dict):
+        """
+        哈夫曼树超出最大码长时，换成按规范码重建的树：
+        先淡出原有内部节点与连线，再淡入新的内部节点与连线，同时把叶子移到新位置。
+        """
+        nodes = {info["id"]: info for info in snapshot.get("nodes", [])}
+        old_internal = [node_id for node_id in self.tree_structure if node_id not in nodes]
+        old_edges = list(self.edge_items.values())
+        stale_items = [self.node_items.pop(node_id) for node_id in old_internal if node_id in self.node_items]
+        self.edge_items = {}
+
+        fade_duration = self._build_duration(360)
+        fade_out = [self.anim.fade_item(item, 1.0, 0.0, duration=fade_duration) for item in stale_items]
+        fade_out += [self.anim.fade_item(edge, 1.0, 0.0, duration=fade_duration) for edge in old_edges]
+        clear_stage = self.anim.parallel(*fade_out) if fade_out else self.anim.pause(0)
+        self.release_when_finished(clear_stage, old_edges + stale_items)
+
+        for node_id in old_internal:
+            self.tree_structure.pop(node_id, None)
+            self.node_depths.pop(node_id, None)
+            self.leaf_counts.pop(node_id, None)
+
+        positions = self._compute_layout(snapshot)
+        motions = []
+        for node_id, info in nodes.items():
+            self.tree_structure[node_id] = {"value": info["value"], "left": info["left"], "right": info["right"]}
+            target = positions.get(node_id)
+            item = self.node_items.get(node_id)
+            if item is None:
+                item = self._create_node_item(node_id, info["value"])
+                item.setOpacity(0.0)
+                if target is not None:
+                    item.setPos(target)
+                motions.append(self.anim.fade_item(item, 0.0, 1.0, duration=fade_duration))
+            elif target is not None:
+                motions.append(self.anim.move_item(item, target, duration=self._build_duration(520)))
+
+        for node_id, info in nodes.items():
+            for child_id in (info["left"], info["right"]):
+                if child_id is None:
+                    continue
+                edge = self.track_item(HuffmanEdgeItem(self.node_items[node_id], self.node_items[child_id]))
+                edge.setOpacity(0.0)
+                self.scene.addItem(edge)
+                self.edge_items[(node_id, child_id)] = edge
+                motions.append(self.anim.fade_item(edge, 0.0, 1.0, duration=fade_duration))
+
+        rebuild_stage = self.anim.parallel(*motions) if motions else self.anim.pause(0)
+        return self.anim.sequential(clear_stage, rebuild_stage, self.anim.pause(160))
+
+    def _apply_code_tooltips(self, codes: Dict[int, tuple]):
+        for node_id, (code, length) in codes.items():
+            item = self.node_items.get(node_id)
+            if item:
+                item.setToolTip(f"code: {format_code(code, length)}")
+
     def _compute_layout(self, snapshot: Dict):
         root_id = snapshot.get("root")
         if root_id is None:
             return {}
+        return self._inorder_positions(snapshot.get("nodes", []), [root_id])
+
+    def _inorder_positions(self, nodes, roots):
+        """按整片森林的中序序号横向排布（迭代实现，见 core.tree_layout）。"""
+        h_gap = self._forest_h_gap
+        v_gap = self._forest_v_gap
+        layout = inorder_layout(nodes, roots, spacing=h_gap)
+        if not len(layout):
+            return {}
+        offset = ((len(layout) - 1) * h_gap) / 2.0
+        return {
+            node_id: QPointF(x - offset, depth * v_gap - 200)
+            for node_id, x, depth in layout.items()
+        }
 
-        nodes = {node["id"]: node for node in snapshot.get("nodes", [])}
-        positions: Dict[int, QPointF] = {}
-        index = [0]
-        h_gap = 120
-        v_gap = 110
+    # ---------- 自适应哈夫曼 ----------
 
-        def inorder(node_id, depth):
-            if node_id is None or node_id not in nodes:
-                return
-            inorder(nodes[node_id]["left"], depth + 1)
-            x = index[0] * h_gap
-            y = depth * v_gap - 200
-            positions[node_id] = QPointF(x, y)
-            index[0] += 1
-            inorder(nodes[node_id]["right"], depth + 1)
+    def play_adaptive(self, frames: Iterable[Dict]):
+        """
+        frames 为逐符号的 {"record": AdaptiveHuffmanModel.update 的返回值, "snapshot": 更新后的快照}。
+        每一步：淡入新节点 → 高亮本次符号的叶子与交换的节点对 → 更新标签与连线 → 移到新布局。
+        """
+        self.reset()
+        sequence = self.anim.sequential()
+        for frame in frames:
+            sequence.addAnimation(self._animate_adaptive_step(frame["record"], frame["snapshot"]))
+        if sequence.animationCount() == 0:
+            return
+        self._track_animation(sequence, finalizer=self._auto_scale_view)
 
-        inorder(root_id, 0)
+    def _animate_adaptive_step(self, record: Dict, snapshot: Dict):
+        nodes = {info["id"]: info for info in snapshot.get("nodes", [])}
+        positions = self._compute_layout(snapshot)
+        duration = self._build_duration(360)
+
+        appear = []
+        for node_id, info in nodes.items():
+            if node_id in self.node_items:
+                continue
+            item = self._create_node_item(node_id, info["value"])
+            item.set_label(self._adaptive_label(info))
+            item.setOpacity(0.0)
+            if node_id in positions:
+                item.setPos(positions[node_id])
+            appear.append(self.anim.fade_item(item, 0.0, 1.0, duration=duration))
+
+        highlight = self.anim.sequential(self._flash_node(record["leaf"], QColor("#ffd166")))
+        for a_id, b_id in record["swaps"]:
+            highlight.addAnimation(
+                self.anim.parallel(
+                    self._flash_node(a_id, QColor("#ef476f")),
+                    self._flash_node(b_id, QColor("#ef476f")),
+                )
+            )
 
-        total = max(1, index[0])
-        offset = ((total - 1) * h_gap) / 2.0
-        for node_id, point in positions.items():
-            positions[node_id] = QPointF(point.x() - offset, point.y())
-        return positions
+        # 标签与连线必须在播放到这一步时才切换，构造时间轴时场景仍停留在上一步
+        apply_stage = self.anim.pause(0)
+        apply_stage.finished.connect(lambda nodes=nodes: self._apply_adaptive_snapshot(nodes))
+
+        motions = [
+            self.anim.move_item(self.node_items[node_id], target, duration=self._build_duration(420))
+            for node_id, target in positions.items()
+            if node_id in self.node_items
+        ]
+        relayout = self.anim.parallel(*motions) if motions else self.anim.pause(0)
+        relayout.finished.connect(self._auto_scale_view)
+
+        return self.anim.sequential(
+            self.anim.parallel(*appear) if appear else self.anim.pause(0),
+            highlight,
+            apply_stage,
+            relayout,
+        )
+
+    def _apply_adaptive_snapshot(self, nodes: Dict[int, Dict]):
+        wanted = set()
+        for node_id, info in nodes.items():
+            self.tree_structure[node_id] = {"value": info["value"], "left": info["left"], "right": info["right"]}
+            item = self.node_items.get(node_id)
+            if item:
+                item.set_label(self._adaptive_label(info))
+            for child_id in (info["left"], info["right"]):
+                if child_id is not None:
+                    wanted.add((node_id, child_id))
+
+        for key in [key for key in self.edge_items if key not in wanted]:
+            self.release_item(self.edge_items.pop(key))
+        for parent_id, child_id in wanted:
+            if (parent_id, child_id) in self.edge_items:
+                continue
+            edge = self.track_item(HuffmanEdgeItem(self.node_items[parent_id], self.node_items[child_id]))
+            self.scene.addItem(edge)
+            self.edge_items[(parent_id, child_id)] = edge
+
+    @staticmethod
+    def _adaptive_label(info: Dict) -> str:
+        symbol = info.get("symbol")
+        if symbol == "NYT":
+            return "NYT"
+        if symbol is None:
+            return f"{info['value']:g}"
+        return f"{describe_symbol(symbol)}\n{info['value']:g}"
 
     # ---------- 辅助 ----------
 
@@ -507,74 +657,24 @@ class HuffmanView(BaseStructureView):
         )
         return self.anim.sequential(highlight, recover)
 
-    def _animate_tree_relayout(self):
-        positions = self._compute_current_layout()
-        if not positions:
-            group = self.anim.pause(0)
-            group.finished.connect(self._auto_scale_view)
-            return group
-
+    def _animate_tree_relayout(self, changed: Dict[int, Tuple[int, int]]):
+        """changed 为本次合并后位置有变化的节点 {id: (中序序号, 深度)}。"""
         motions = []
         duration = self._build_duration(520)
-        for node_id, target in positions.items():
+        for node_id, (rank, depth) in changed.items():
             item = self.node_items.get(node_id)
             if not item:
                 continue
-            if (item.pos() - target).manhattanLength() < 1e-2:
-                continue
+            target = QPointF(
+                rank * self._forest_h_gap - self._forest_offset,
+                depth * self._forest_v_gap - 200,
+            )
             motions.append(self.anim.move_item(item, target, duration=duration))
 
         group = self.anim.parallel(*motions) if motions else self.anim.pause(0)
         group.finished.connect(self._auto_scale_view)
         return group
 
-    def _compute_current_layout(self):
-        nodes = {
-            node_id: data
-            for node_id, data in self.tree_structure.items()
-            if node_id not in self.in_queue_ids
-        }
-        if not nodes:
-            return {}
-
-        roots = self._find_current_roots(nodes)
-        if not roots:
-            return {}
-
-        positions: Dict[int, QPointF] = {}
-        index = [0]
-        h_gap = 120
-        v_gap = 110
-
-        def inorder(node_id, depth):
-            if node_id is None or node_id not in nodes:
-                return
-            inorder(nodes[node_id]["left"], depth + 1)
-            x = index[0] * h_gap
-            y = depth * v_gap - 200
-            positions[node_id] = QPointF(x, y)
-            index[0] += 1
-            inorder(nodes[node_id]["right"], depth + 1)
-
-        for root in roots:
-            inorder(root, 0)
-
-        total = max(1, index[0])
-        offset = ((total - 1) * h_gap) / 2.0
-        for node_id, point in positions.items():
-            positions[node_id] = QPointF(point.x() - offset, point.y())
-        return positions
-
-    def _find_current_roots(self, nodes: Dict[int, Dict[str, Optional[int]]]):
-        children: Set[int] = set()
-        for data in nodes.values():
-            for child in (data.get("left"), data.get("right")):
-                if child is not None and child in nodes:
-                    children.add(child)
-        roots = [node_id for node_id in nodes if node_id not in children]
-        roots.sort()
-        return roots
-
     def _create_node_item(self, node_id: int, value):
         existing = self.node_items.get(node_id)
         if existing:
@@ -647,6 +747,10 @@ class HuffmanNodeItem(QGraphicsObject):
         self._value = f"{value:g}"
         self.update()
 
+    def set_label(self, text: str):
+        self._value = text
+        self.update()
+
     def setFillColor(self, color: QColor):
         self.fillColor = QColor(color)
         self.update()
@@ -698,9 +802,6 @@ class HuffmanEdgeItem(QGraphicsObject):
         except (TypeError, RuntimeError):
             pass
 
-    def __del__(self):
-        self.dispose()
-
     def update_geometry(self):
         start = self._center(self.parent_item)
         end = self._center(self.child_item)
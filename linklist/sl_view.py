@@ -1,5 +1,6 @@
 import math, random
 from PyQt5.QtCore import (
+    QEasingCurve,
     QPointF,
     Qt,
     pyqtSignal,
@@ -44,7 +45,7 @@ class LinkedListView(BaseStructureView):
             QTimer.singleShot(0, self._auto_scale_view)
 
     def reset(self):
-        self.scene.clear()
+        self.clear_scene()
         self.node_items.clear()
         self.order.clear()
         self.arrow_items.clear()
@@ -52,6 +53,27 @@ class LinkedListView(BaseStructureView):
         self._head_label = self._create_head_label()
         self.scene.addItem(self._head_label)
 
+    def _connect_node(self, node_item):
+        """连接节点图元到视图的信号，并登记在 reset / 删除时断开。"""
+        connections = (
+            (node_item.positionChanged, self._update_arrows),
+            (node_item.positionChanged, self._update_head_label),
+            (node_item.contextDelete, self._emit_delete),
+            (node_item.contextEdit, self._emit_edit),
+            (node_item.dragStateChanged, self._on_drag_state_changed),
+        )
+        for signal, slot in connections:
+            signal.connect(slot)
+
+        def _release():
+            for signal, slot in connections:
+                try:
+                    signal.disconnect(slot)
+                except (RuntimeError, TypeError):
+                    pass
+
+        self.track_item(node_item, _release)
+
     def animate_build(self, nodes, speed_scale: float = 1.0):
         """
         nodes: ordered list of dicts {id, value}
@@ -74,11 +96,7 @@ class LinkedListView(BaseStructureView):
             node_item.setOpacity(0.0)
             start_pos = QPointF(target_position.x(), target_position.y() - 120)
             node_item.setPos(start_pos)
-            node_item.positionChanged.connect(self._update_arrows)
-            node_item.positionChanged.connect(self._update_head_label)
-            node_item.contextDelete.connect(self._emit_delete)
-            node_item.contextEdit.connect(self._emit_edit)
-            node_item.dragStateChanged.connect(self._on_drag_state_changed)
+            self._connect_node(node_item)
 
             self.scene.addItem(node_item)
             self.node_items[info["id"]] = node_item
@@ -99,12 +117,8 @@ class LinkedListView(BaseStructureView):
         new_node = LinkedListNodeItem(new_info["id"], new_info["value"])
         new_node.setOpacity(0.0)
         new_node.setPos(QPointF(target_position.x(), target_position.y() - 120))    # 目标位置的上方120位置
-        # 2. 注册事件监听
-        new_node.positionChanged.connect(self._update_arrows)
-        new_node.positionChanged.connect(self._update_head_label)                   # 拖动时更新箭头
-        new_node.contextDelete.connect(self._emit_delete)                           # 右键删除
-        new_node.contextEdit.connect(self._emit_edit)
-        new_node.dragStateChanged.connect(self._on_drag_state_changed)
+        # 2. 注册事件监听（拖动时更新箭头、右键删除 / 编辑）
+        self._connect_node(new_node)
         self.scene.addItem(new_node)
         self.node_items[new_node.node_id] = new_node
         self._auto_scale_view()
@@ -268,7 +282,7 @@ class LinkedListView(BaseStructureView):
     def _finalize_delete(self, nodes, removed_id):
         node = self.node_items.pop(removed_id, None)
         if node:
-            self.scene.removeItem(node)
+            self.release_item(node)
         self.order = [node["id"] for node in nodes]
         self._refresh_connectivity()
 
@@ -494,20 +508,11 @@ class LinkedListView(BaseStructureView):
             duration=360,
         )
 
-        extension = QVariantAnimation()
-        extension.setDuration(self.anim.global_ctrl.scale_duration(duration))
-        extension.setStartValue(0.0)
-        extension.setEndValue(1.0)
-
-        def _update(progress):
+        def _update(point):
             arrow_obj = arrow_ref()
             if arrow_obj is None:
                 return
-            interp = QPointF(
-                hover_target.x() + (end_center.x() - hover_target.x()) * progress,
-                hover_target.y() + (end_center.y() - hover_target.y()) * progress,
-            )
-            arrow_obj.set_override_target(interp)
+            arrow_obj.set_override_target(point)
 
         def _finish():
             arrow_obj = arrow_ref()
@@ -516,7 +521,13 @@ class LinkedListView(BaseStructureView):
             arrow_obj.set_override_target(None)
             arrow_obj.update_path()
 
-        extension.valueChanged.connect(_update)
+        extension = self.anim.path_item(
+            None,
+            [hover_target, end_center],
+            duration=duration,
+            easing=QEasingCurve.Linear,
+            setter=_update,
+        )
         extension.finished.connect(_finish)
 
         seq = self.anim.sequential(
@@ -567,26 +578,23 @@ class LinkedListView(BaseStructureView):
         arrow.setOpacity(1.0)
         self.arrow_items[(start_node.node_id, successor_id)] = arrow
 
-        anim = QVariantAnimation()
-        anim.setDuration(self.anim.global_ctrl.scale_duration(duration))
-        anim.setStartValue(0.0)
-        anim.setEndValue(1.0)
-
-        def _update(progress):
+        def _update(point):
             if arrow.scene() is None:
                 return
-            interp = QPointF(
-                hover_target.x() + (end_center.x() - hover_target.x()) * progress,
-                hover_target.y() + (end_center.y() - hover_target.y()) * progress,
-            )
-            arrow.set_override_target(interp)
+            arrow.set_override_target(point)
 
         def _finish():
             if arrow.scene() is None:
                 return
             arrow.set_override_target(None)
 
-        anim.valueChanged.connect(_update)
+        anim = self.anim.path_item(
+            None,
+            [hover_target, end_center],
+            duration=duration,
+            easing=QEasingCurve.Linear,
+            setter=_update,
+        )
         anim.finished.connect(_finish)
         return anim
 
@@ -624,19 +632,10 @@ class LinkedListView(BaseStructureView):
         )
         arrow.set_orientation(orientation)
 
-        anim = QVariantAnimation()
-        anim.setDuration(self.anim.global_ctrl.scale_duration(duration))
-        anim.setStartValue(0.0)
-        anim.setEndValue(1.0)
-
-        def _update(progress):
+        def _update(point):
             if arrow.scene() is None:
                 return
-            interp = QPointF(
-                start_point.x() + (end_point.x() - start_point.x()) * progress,
-                start_point.y() + (end_point.y() - start_point.y()) * progress,
-            )
-            arrow.set_override_target(interp)
+            arrow.set_override_target(point)
 
         def _finish():
             if arrow.scene() is None:
@@ -647,7 +646,13 @@ class LinkedListView(BaseStructureView):
             )
             holder["arrow"] = new_arrow
 
-        anim.valueChanged.connect(_update)
+        anim = self.anim.path_item(
+            None,
+            [start_point, end_point],
+            duration=duration,
+            easing=QEasingCurve.Linear,
+            setter=_update,
+        )
         anim.finished.connect(_finish)
         return anim
 
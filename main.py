@@ -22,7 +22,10 @@ from arrayviz.arr_ctrl import ArrayController
 from linklist.sl_ctrl import LinkedListController
 from stack.st_ctrl import StackController
 from bst.bst_ctrl import BSTController
+from bst.balanced_ctrl import AVLController, RedBlackController, SplayController, TreapController
+from btree.bt_ctrl import BTreeController
 from huffman.huff_ctrl import HuffmanController
+from queueviz.qu_ctrl import QueueController
 
 
 class MainWindow(QMainWindow):
@@ -118,14 +121,26 @@ class MainWindow(QMainWindow):
     def _register_controllers(self):
         linked_list = LinkedListController(self.global_ctrl)
         stack = StackController(self.global_ctrl)
+        queue = QueueController(self.global_ctrl)
         array = ArrayController(self.global_ctrl)
         bst = BSTController(self.global_ctrl)
+        avl = AVLController(self.global_ctrl)
+        rb_tree = RedBlackController(self.global_ctrl)
+        splay = SplayController(self.global_ctrl)
+        treap = TreapController(self.global_ctrl)
+        btree = BTreeController(self.global_ctrl)
         huffman = HuffmanController(self.global_ctrl)
 
         self._add_controller("Linked List", linked_list)
         self._add_controller("Stack", stack)
+        self._add_controller("Queue / Deque", queue)
         self._add_controller("Array", array)
         self._add_controller("BST", bst)
+        self._add_controller("AVL Tree", avl)
+        self._add_controller("Red-Black Tree", rb_tree)
+        self._add_controller("Splay Tree", splay)
+        self._add_controller("Treap", treap)
+        self._add_controller("B-Tree", btree)
         self._add_controller("Huffman", huffman)
 
     def _add_controller(self, name, controller):
@@ -0,0 +1,245 @@
+from typing import Optional
+
+from PyQt5.QtWidgets import (
+    QCheckBox,
+    QFormLayout,
+    QGridLayout,
+    QGroupBox,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QMessageBox,
+    QPushButton,
+    QSpinBox,
+    QVBoxLayout,
+    QWidget,
+)
+
+from core.global_ctrl import GlobalController
+from queueviz.qu_model import RingDequeModel
+from queueviz.qu_view import QueueView
+
+
+class QueueController(QWidget):
+    """
+    队列 / 双端队列操作面板：两端入队与出队，
+    以及环形缓冲区的初始容量与是否允许扩容。
+    """
+
+    display_name = "Queue / Deque"
+
+    def __init__(self, global_ctrl: GlobalController):
+        super().__init__()
+        self.model = RingDequeModel(capacity=8, growable=True)
+        self.view = QueueView(global_ctrl)
+        self._panel_locked = False
+
+        self._build_inputs()
+        self.panel = self._create_panel()
+
+        self.view.interactionLocked.connect(self._on_lock_state)
+        self.view.clearAllRequested.connect(self._on_clear_all_requested)
+
+        self.view.show_snapshot(self.model.snapshot())
+        self._refresh_inputs()
+
+    # ---------- UI 构建 ----------
+
+    def _build_inputs(self):
+        self.capacity_spin = QSpinBox()
+        self.capacity_spin.setRange(1, 64)
+        self.capacity_spin.setValue(self.model.capacity)
+
+        self.growable_check = QCheckBox("Grow when full")
+        self.growable_check.setStyleSheet("color: white;")
+        self.growable_check.setChecked(self.model.growable)
+
+        self.value_edit = QLineEdit()
+        self.value_edit.setPlaceholderText("Value")
+        self.value_edit.returnPressed.connect(self._on_append)
+
+    def _create_panel(self):
+        container = QWidget()
+        layout = QGridLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setHorizontalSpacing(12)
+        layout.setVerticalSpacing(12)
+        layout.setColumnStretch(0, 1)
+        layout.setColumnStretch(1, 1)
+
+        # Buffer settings
+        buffer_group = self._form_group("Buffer")
+        apply_btn = QPushButton("Apply")
+        apply_btn.clicked.connect(self._on_apply_settings)
+        buffer_group.layout().addRow("Capacity:", self._inline_row(self.capacity_spin, self.growable_check))
+        buffer_group.layout().addRow(apply_btn)
+        layout.addWidget(buffer_group, 0, 0)
+
+        # Enqueue
+        enqueue_group = self._form_group("Enqueue")
+        append_btn = QPushButton("Append")
+        append_btn.clicked.connect(self._on_append)
+        append_left_btn = QPushButton("Append Left")
+        append_left_btn.clicked.connect(self._on_append_left)
+        enqueue_group.layout().addRow("Value:", self.value_edit)
+        enqueue_group.layout().addRow(self._inline_row(append_left_btn, append_btn))
+        layout.addWidget(enqueue_group, 0, 1)
+
+        # Dequeue
+        dequeue_group = self._form_group("Dequeue")
+        pop_left_btn = QPushButton("Pop Left")
+        pop_left_btn.clicked.connect(self._on_pop_left)
+        pop_btn = QPushButton("Pop")
+        pop_btn.clicked.connect(self._on_pop)
+        dequeue_group.layout().addRow(self._inline_row(pop_left_btn, pop_btn))
+        layout.addWidget(dequeue_group, 1, 0)
+
+        # Buffer state
+        state_group = QGroupBox("State")
+        state_group.setStyleSheet("QGroupBox { color: white; }")
+        state_layout = QVBoxLayout(state_group)
+        state_layout.setContentsMargins(12, 8, 12, 12)
+        self.state_label = QLabel()
+        self.state_label.setStyleSheet("color: white;")
+        self.state_label.setWordWrap(True)
+        state_layout.addWidget(self.state_label)
+        layout.addWidget(state_group, 1, 1)
+
+        layout.setRowStretch(2, 1)
+
+        self.apply_btn = apply_btn
+        self.append_btn = append_btn
+        self.append_left_btn = append_left_btn
+        self.pop_left_btn = pop_left_btn
+        self.pop_btn = pop_btn
+        return container
+
+    @staticmethod
+    def _form_group(title):
+        group = QGroupBox(title)
+        group.setStyleSheet("QGroupBox { color: white; }")
+        form = QFormLayout()
+        form.setContentsMargins(12, 8, 12, 12)
+        form.setSpacing(6)
+        group.setLayout(form)
+        return group
+
+    @staticmethod
+    def _inline_row(*widgets):
+        row = QWidget()
+        hlayout = QHBoxLayout(row)
+        hlayout.setContentsMargins(0, 0, 0, 0)
+        hlayout.setSpacing(6)
+        for widget in widgets:
+            hlayout.addWidget(widget)
+        return row
+
+    def build_panel(self):
+        return self.panel
+
+    # ---------- 生命周期 ----------
+
+    def on_activate(self, graphics_view):
+        self.view.bind_canvas(graphics_view)
+        graphics_view.setScene(self.view.scene)
+
+    def on_deactivate(self):
+        pass
+
+    # ---------- 操作回调 ----------
+
+    def _on_apply_settings(self):
+        capacity = self.capacity_spin.value()
+        growable = self.growable_check.isChecked()
+        if capacity == self.model.initial_capacity and growable == self.model.growable and not self.model.grow_count:
+            return
+        # 新的缓冲区设置从空队列开始
+        self.model = RingDequeModel(capacity=capacity, growable=growable)
+        self.view.show_snapshot(self.model.snapshot())
+        self._refresh_inputs()
+
+    def _on_append(self):
+        self._enqueue("append")
+
+    def _on_append_left(self):
+        self._enqueue("appendleft")
+
+    def _enqueue(self, op: str):
+        value = self._read_value()
+        if value is None:
+            return
+        try:
+            info = getattr(self.model, op)(value)
+        except OverflowError:
+            self.view.flash_full()
+            QMessageBox.warning(self, "Queue Full", f"队列已满（容量 {self.model.capacity}），且未允许扩容。")
+            return
+        self.value_edit.clear()
+        self.view.animate_operation(self.model.snapshot(), op, info)
+        self._refresh_inputs()
+
+    def _on_pop_left(self):
+        self._dequeue("popleft")
+
+    def _on_pop(self):
+        self._dequeue("pop")
+
+    def _dequeue(self, op: str):
+        if not len(self.model):
+            return
+        info = getattr(self.model, op)()
+        self.view.animate_operation(self.model.snapshot(), op, info)
+        self._refresh_inputs()
+
+    def _on_clear_all_requested(self):
+        self.model.clear()
+        self.view.show_snapshot(self.model.snapshot())
+        self._refresh_inputs()
+
+    def _read_value(self) -> Optional[object]:
+        raw = self.value_edit.text().strip()
+        if not raw:
+            QMessageBox.warning(self, "Missing Value", "请先输入要入队的值。")
+            return None
+        return self._coerce_value(raw)
+
+    @staticmethod
+    def _coerce_value(value):
+        try:
+            return int(value)
+        except ValueError:
+            try:
+                return float(value)
+            except ValueError:
+                return value
+
+    # ---------- 状态管理 ----------
+
+    def _state_text(self) -> str:
+        model = self.model
+        rows = [
+            f"size: {len(model)} / {model.capacity}",
+            f"head: {model.head}  tail: {model.tail}",
+            f"grows: {model.grow_count}" + ("" if model.growable else "（定长）"),
+        ]
+        return "\n".join(rows)
+
+    def _refresh_inputs(self):
+        has_items = len(self.model) > 0
+        state = self._panel_locked
+        for widget in (
+            self.apply_btn,
+            self.capacity_spin,
+            self.growable_check,
+            self.value_edit,
+            self.append_btn,
+            self.append_left_btn,
+        ):
+            widget.setDisabled(state)
+        for widget in (self.pop_left_btn, self.pop_btn):
+            widget.setDisabled(state or not has_items)
+        self.state_label.setText(self._state_text())
+
+    def _on_lock_state(self, locked):
+        self._panel_locked = locked
+        self._refresh_inputs()
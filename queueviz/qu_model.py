@@ -0,0 +1,172 @@
+import itertools
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+EMPTY = -1
+
+
+class RingDequeModel:
+    """
+    环形缓冲区上的双端队列。
+
+    head 为队首所在槽位，元素依次占据 head, head+1, …（对 capacity 取模），
+    队尾写入位置 tail = (head + count) % capacity。两端的入队 / 出队都只移动下标，均为 O(1)；
+    写满时按 2 倍扩容，把元素按逻辑顺序展开到新缓冲区的 0..count-1，均摊仍为 O(1)。
+    id 存放在 int64 数组中（空槽为 -1）；值全为整数时同样使用 int64 数组，出现其他类型后退化为对象列表。
+    growable 为 False 时模拟定长队列，写满后入队抛出 OverflowError。
+    """
+
+    def __init__(self, capacity: int = 8, growable: bool = True):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.growable = growable
+        self.initial_capacity = capacity
+        self._id_iter = itertools.count()
+        self._reset_buffers(capacity)
+        self.grow_count = 0
+
+    def _reset_buffers(self, capacity: int):
+        self._ids = array("q", [EMPTY]) * capacity
+        self._values = array("q", bytes(8 * capacity))
+        self._head = 0
+        self._count = 0
+
+    # ---------- 基本属性 ----------
+
+    @property
+    def capacity(self) -> int:
+        return len(self._ids)
+
+    @property
+    def head(self) -> int:
+        return self._head
+
+    @property
+    def tail(self) -> int:
+        return (self._head + self._count) % self.capacity
+
+    def __len__(self):
+        return self._count
+
+    def is_full(self) -> bool:
+        return self._count == self.capacity
+
+    def clear(self):
+        self._reset_buffers(self.initial_capacity)
+        self._id_iter = itertools.count()
+        self.grow_count = 0
+
+    def load(self, values):
+        self.clear()
+        for value in values:
+            self.append(value)
+
+    # ---------- 操作 ----------
+
+    def append(self, value) -> Dict[str, Any]:
+        """队尾入队，返回 {"id", "value", "slot", "grew"}；grew 为 (旧容量, 新容量) 或 None。"""
+        grew = self._make_room()
+        slot = self.tail
+        node_id = next(self._id_iter)
+        self._store(slot, node_id, value)
+        self._count += 1
+        return {"id": node_id, "value": value, "slot": slot, "grew": grew}
+
+    def appendleft(self, value) -> Dict[str, Any]:
+        """队首入队，head 向前移动一格（越过 0 时回绕到末尾）。"""
+        grew = self._make_room()
+        self._head = (self._head - 1) % self.capacity
+        slot = self._head
+        node_id = next(self._id_iter)
+        self._store(slot, node_id, value)
+        self._count += 1
+        return {"id": node_id, "value": value, "slot": slot, "grew": grew}
+
+    def popleft(self) -> Dict[str, Any]:
+        if not self._count:
+            raise IndexError("Queue empty")
+        slot = self._head
+        info = self._take(slot)
+        self._head = (self._head + 1) % self.capacity
+        self._count -= 1
+        return info
+
+    def pop(self) -> Dict[str, Any]:
+        if not self._count:
+            raise IndexError("Queue empty")
+        slot = (self._head + self._count - 1) % self.capacity
+        info = self._take(slot)
+        self._count -= 1
+        return info
+
+    def peekleft(self) -> Dict[str, Any]:
+        if not self._count:
+            raise IndexError("Queue empty")
+        return self._info(self._head)
+
+    def peek(self) -> Dict[str, Any]:
+        if not self._count:
+            raise IndexError("Queue empty")
+        return self._info((self._head + self._count - 1) % self.capacity)
+
+    # ---------- 快照 ----------
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """按队首到队尾的逻辑顺序。"""
+        capacity = self.capacity
+        for offset in range(self._count):
+            yield self._info((self._head + offset) % capacity)
+
+    def slots(self) -> List[Optional[Dict[str, Any]]]:
+        """按物理槽位排列，空槽为 None。"""
+        return [None if node_id == EMPTY else {"id": node_id, "value": self._values[slot]}
+                for slot, node_id in enumerate(self._ids)]
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "head": self._head,
+            "count": self._count,
+            "slots": self.slots(),
+        }
+
+    # ---------- 缓冲区 ----------
+
+    def _info(self, slot: int) -> Dict[str, Any]:
+        return {"id": self._ids[slot], "value": self._values[slot], "slot": slot}
+
+    def _take(self, slot: int) -> Dict[str, Any]:
+        info = self._info(slot)
+        self._ids[slot] = EMPTY
+        if isinstance(self._values, list):
+            # 释放对象引用
+            self._values[slot] = None
+        return info
+
+    def _store(self, slot: int, node_id: int, value):
+        if isinstance(self._values, array) and not self._fits_int64(value):
+            self._values = list(self._values)
+        self._ids[slot] = node_id
+        self._values[slot] = value
+
+    def _make_room(self) -> Optional[Tuple[int, int]]:
+        if not self.is_full():
+            return None
+        if not self.growable:
+            raise OverflowError("Queue full")
+        # 只在写满时扩容：从 head 处切开拼接即为逻辑顺序，后半段补空槽
+        old_capacity = self.capacity
+        head = self._head
+        self._ids = self._ids[head:] + self._ids[:head] + array("q", [EMPTY]) * old_capacity
+        if isinstance(self._values, array):
+            padding = array(self._values.typecode, bytes(8 * old_capacity))
+        else:
+            padding = [None] * old_capacity
+        self._values = self._values[head:] + self._values[:head] + padding
+        self._head = 0
+        self.grow_count += 1
+        return old_capacity, self.capacity
+
+    @staticmethod
+    def _fits_int64(value) -> bool:
+        return type(value) is int and -(1 << 63) <= value < (1 << 63)
@@ -0,0 +1,304 @@
+import math
+from typing import Dict, List, Optional
+
+from PyQt5.QtCore import QEvent, QPointF, QRectF, Qt, pyqtSignal
+from PyQt5.QtGui import QBrush, QColor, QPen, QTransform
+from PyQt5.QtWidgets import QGraphicsObject, QGraphicsSimpleTextItem, QMenu
+
+from arrayviz.arr_view import ArrayCellItem, ArraySlotItem
+from core.base_view import BaseStructureView
+
+
+class QueueView(BaseStructureView):
+    """
+    环形缓冲区视图：槽位按物理下标沿圆周顺时针排列（0 号在正上方），
+    HEAD 标记在圆外、TAIL（下一个写入位置）标记在圆内。
+    下标越过末尾时标记沿圆弧回到 0 号槽位，扩容时换成更大的一圈并把元素展开到新槽位。
+    """
+
+    clearAllRequested = pyqtSignal()
+
+    def __init__(self, global_ctrl):
+        super().__init__(global_ctrl)
+        self.scene.installEventFilter(self)
+
+        self.cells: Dict[int, QueueCellItem] = {}
+        self.slot_items: List[ArraySlotItem] = []
+        self.capacity = 0
+        self.head = 0
+        self.count = 0
+
+        self._min_radius = 150
+        self._slot_gap = 16
+        self._head_offset = 92
+        self._tail_offset = -96
+        self._spawn_offset = 170
+        # 标记沿圆弧移动时每个槽位取的采样点数
+        self._arc_samples = 10
+
+        self.head_marker: Optional[RingMarkerItem] = None
+        self.tail_marker: Optional[RingMarkerItem] = None
+
+    # ---------- Public API ----------
+
+    def reset(self):
+        self.stop_all_animations()
+        self.clear_scene()
+        self.cells.clear()
+        self.slot_items = []
+        self.capacity = 0
+        self.head = 0
+        self.count = 0
+        self.head_marker = None
+        self.tail_marker = None
+
+    def show_snapshot(self, snapshot):
+        """不播放动画，直接按快照重建整个环。"""
+        self.reset()
+        self.capacity = snapshot["capacity"]
+        self.slot_items = self._create_slots(self.capacity)
+        self.head_marker = RingMarkerItem("HEAD", QColor("#26a69a"))
+        self.tail_marker = RingMarkerItem("TAIL", QColor("#ef6c00"))
+        for marker in (self.head_marker, self.tail_marker):
+            self.scene.addItem(marker)
+        for slot, info in enumerate(snapshot["slots"]):
+            if info is not None:
+                cell = self._create_cell_item(info["id"], info["value"])
+                cell.setPos(self._slot_position(slot))
+        self._finalize_snapshot(snapshot)
+
+    def animate_operation(self, snapshot, op: str, info):
+        """
+        op 为 append / appendleft / pop / popleft，info 为模型返回的元素记录。
+        扩容时先切换到新的一圈，再播放入队 / 出队以及 HEAD / TAIL 的移动。
+        """
+        if not self.slot_items:
+            self.show_snapshot(snapshot)
+            return
+
+        sequence = self.anim.sequential()
+        if snapshot["capacity"] != self.capacity:
+            sequence.addAnimation(self._animate_growth(snapshot))
+
+        motions = []
+        if op in ("append", "appendleft"):
+            cell = self._create_cell_item(info["id"], info["value"])
+            cell.setOpacity(0.0)
+            cell.setPos(self._spawn_position(info["slot"]))
+            motions.append(self.anim.move_item(cell, self._slot_position(info["slot"]), duration=460))
+            motions.append(self.anim.fade_item(cell, 0.0, 1.0, duration=460))
+        else:
+            cell = self.cells.pop(info["id"], None)
+            if cell is not None:
+                leave = self.anim.parallel(
+                    self.anim.move_item(cell, self._spawn_position(info["slot"]), duration=460),
+                    self.anim.fade_item(cell, 1.0, 0.0, duration=460),
+                )
+                self.release_when_finished(leave, [cell])
+                motions.append(leave)
+
+        tail = (snapshot["head"] + snapshot["count"]) % snapshot["capacity"]
+        motions.append(self._marker_motion(self.head_marker, self._head_offset, self.head, snapshot["head"]))
+        motions.append(self._marker_motion(self.tail_marker, self._tail_offset, self._tail(), tail))
+        sequence.addAnimation(self.anim.parallel(*[motion for motion in motions if motion is not None]))
+
+        self.head = snapshot["head"]
+        self.count = snapshot["count"]
+        self._track_animation(sequence, finalizer=lambda: self._finalize_snapshot(snapshot))
+
+    def flash_full(self):
+        """定长队列写满时闪烁 TAIL 标记。"""
+        marker = self.tail_marker
+        if marker is None:
+            return
+        original = QColor(marker.fillColor)
+        flash = self.anim.flash_brush(
+            setter=marker.setFillColor,
+            start_color=original,
+            end_color=QColor("#e53935"),
+            duration=180,
+            loops=2,
+        )
+        self._track_animation(flash, finalizer=lambda: marker.setFillColor(original))
+
+    # ---------- 动画片段 ----------
+
+    def _animate_growth(self, snapshot):
+        """旧的一圈淡出、新的一圈淡入，元素同时移到展开后的槽位，标记直线移到新位置。"""
+        old_slots = self.slot_items
+        self.capacity = snapshot["capacity"]
+        self.slot_items = self._create_slots(self.capacity)
+
+        duration = 520
+        motions = [self.anim.fade_item(slot, 1.0, 0.0, duration=duration) for slot in old_slots]
+        motions += [self.anim.fade_item(slot, 0.0, 1.0, duration=duration) for slot in self.slot_items]
+        for slot in self.slot_items:
+            slot.setOpacity(0.0)
+        for slot, info in enumerate(snapshot["slots"]):
+            cell = self.cells.get(info["id"]) if info is not None else None
+            if cell is not None:
+                motions.append(self.anim.move_item(cell, self._slot_position(slot), duration=duration))
+
+        # 扩容前缓冲区已满，head 之后依次排开，tail 紧跟在最后一个元素之后
+        motions.append(self.anim.move_item(self.head_marker, self._marker_position(self._head_offset, 0), duration=duration))
+        motions.append(self.anim.move_item(self.tail_marker, self._marker_position(self._tail_offset, self.count), duration=duration))
+        self.head = 0
+
+        group = self.anim.parallel(*motions)
+        self.release_when_finished(group, old_slots)
+        return group
+
+    def _marker_motion(self, marker, offset: float, old_slot: int, new_slot: int):
+        """沿圆弧移动标记，按较短的方向走（回绕时越过 0 号槽位）。"""
+        capacity = self.capacity
+        delta = (new_slot - old_slot) % capacity
+        if delta == 0:
+            return None
+        steps = delta if delta <= capacity / 2 else delta - capacity
+        start = self._slot_angle(old_slot)
+        sweep = 2 * math.pi * steps / capacity
+        count = max(2, abs(steps) * self._arc_samples)
+        radius = self._radius() + offset
+        points = [
+            self._marker_top_left(marker, start + sweep * index / count, radius)
+            for index in range(count + 1)
+        ]
+        return self.anim.path_item(marker, points, duration=360 + 60 * abs(steps))
+
+    def _finalize_snapshot(self, snapshot):
+        self.head = snapshot["head"]
+        self.count = snapshot["count"]
+        for slot, info in enumerate(snapshot["slots"]):
+            if info is None:
+                continue
+            cell = self.cells.get(info["id"])
+            if cell is not None:
+                cell.set_value(info["value"])
+                cell.setOpacity(1.0)
+                cell.setPos(self._slot_position(slot))
+        self.head_marker.setPos(self._marker_position(self._head_offset, self.head))
+        self.tail_marker.setPos(self._marker_position(self._tail_offset, self._tail()))
+        self.auto_fit_view()
+
+    # ---------- 几何 ----------
+
+    def _tail(self) -> int:
+        return (self.head + self.count) % self.capacity if self.capacity else 0
+
+    def _radius(self, capacity: Optional[int] = None) -> float:
+        capacity = capacity or self.capacity
+        circumference = capacity * (ArrayCellItem.width + self._slot_gap)
+        return max(self._min_radius, circumference / (2 * math.pi))
+
+    def _slot_angle(self, slot: int, capacity: Optional[int] = None) -> float:
+        capacity = capacity or self.capacity
+        return -math.pi / 2 + 2 * math.pi * slot / capacity
+
+    def _ring_point(self, angle: float, radius: float) -> QPointF:
+        return QPointF(radius * math.cos(angle), radius * math.sin(angle))
+
+    def _slot_position(self, slot: int) -> QPointF:
+        center = self._ring_point(self._slot_angle(slot), self._radius())
+        return QPointF(center.x() - ArrayCellItem.width / 2, center.y() - ArrayCellItem.height / 2)
+
+    def _spawn_position(self, slot: int) -> QPointF:
+        center = self._ring_point(self._slot_angle(slot), self._radius() + self._spawn_offset)
+        return QPointF(center.x() - ArrayCellItem.width / 2, center.y() - ArrayCellItem.height / 2)
+
+    def _marker_top_left(self, marker, angle: float, radius: float) -> QPointF:
+        center = self._ring_point(angle, radius)
+        return QPointF(center.x() - marker.width / 2, center.y() - marker.height / 2)
+
+    def _marker_position(self, offset: float, slot: int) -> QPointF:
+        return self._marker_top_left(RingMarkerItem, self._slot_angle(slot), self._radius() + offset)
+
+    # ---------- 图元 ----------
+
+    def _create_slots(self, capacity: int) -> List[ArraySlotItem]:
+        slots = []
+        for index in range(capacity):
+            slot = ArraySlotItem()
+            slot.setZValue(-1)
+            center = self._ring_point(self._slot_angle(index, capacity), self._radius(capacity))
+            slot.setPos(center.x() - ArraySlotItem.width / 2, center.y() - ArraySlotItem.height / 2)
+
+            # 下标标签挂在槽位上，随槽位一起淡入淡出
+            label = QGraphicsSimpleTextItem(str(index), slot)
+            label.setBrush(QColor("#90a4ae"))
+            font = label.font()
+            font.setPointSize(11)
+            label.setFont(font)
+            rect = label.boundingRect()
+            label.setPos(ArraySlotItem.width - rect.width() - 4, 2)
+
+            self.scene.addItem(slot)
+            slots.append(slot)
+        return slots
+
+    def _create_cell_item(self, node_id, value):
+        cell = QueueCellItem(node_id, value)
+        self.scene.addItem(cell)
+        self.cells[node_id] = cell
+        return cell
+
+    def _show_background_menu(self, screen_pos):
+        if isinstance(screen_pos, QPointF):
+            screen_pos = screen_pos.toPoint()
+        menu = QMenu()
+        clear_action = menu.addAction("Clear Queue")
+        chosen = menu.exec_(screen_pos)
+        if chosen == clear_action:
+            self.clearAllRequested.emit()
+
+    def eventFilter(self, watched, event):
+        if watched is self.scene and event.type() == QEvent.GraphicsSceneContextMenu:
+            item = self.scene.itemAt(event.scenePos(), QTransform())
+            if item is None:
+                self._show_background_menu(event.screenPos())
+                event.accept()
+                return True
+        return super().eventFilter(watched, event)
+
+
+class QueueCellItem(ArrayCellItem):
+    """队列元素只能从两端进出，不提供数组单元的编辑 / 删除菜单。"""
+
+    def __init__(self, node_id, value):
+        super().__init__(node_id, value)
+        self.setAcceptedMouseButtons(Qt.NoButton)
+
+    def mouseDoubleClickEvent(self, event):
+        event.ignore()
+
+    def contextMenuEvent(self, event):
+        event.ignore()
+
+
+class RingMarkerItem(QGraphicsObject):
+    width = 64
+    height = 26
+
+    def __init__(self, text, color: QColor):
+        super().__init__()
+        self._text = text
+        self.fillColor = QColor(color)
+        self.setZValue(3)
+
+    def boundingRect(self):
+        return QRectF(0, 0, self.width, self.height)
+
+    def paint(self, painter, option, widget=None):
+        painter.setRenderHint(painter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QBrush(self.fillColor))
+        painter.drawRoundedRect(self.boundingRect(), 8, 8)
+        font = painter.font()
+        font.setPointSize(10)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(QPen(QColor("#ffffff")))
+        painter.drawText(self.boundingRect(), Qt.AlignCenter, self._text)
+
+    def setFillColor(self, color: QColor):
+        self.fillColor = QColor(color)
+        self.update()
@@ -1,10 +1,18 @@
+import time
+
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import (
+    QApplication,
+    QCheckBox,
+    QComboBox,
     QGroupBox,
     QHBoxLayout,
+    QLabel,
     QLineEdit,
     QMessageBox,
     QPushButton,
     QSizePolicy,
+    QSpinBox,
     QVBoxLayout,
     QWidget,
 )
@@ -14,6 +22,7 @@ from pathlib import Path
 from PyQt5.QtWidgets import QFileDialog
 
 from stack.st_model import StackModel
+from stack.st_workload import StackSimulator, generate_steps, iter_file_steps
 from stack.st_view import StackView
 from stack.st_view import StackViewWithPersistence
 
@@ -21,16 +30,39 @@ from stack.st_view import StackViewWithPersistence
 class StackController(QWidget):
     """Controller for the stack visualization."""
 
+    WORKLOADS = (
+        ("中缀转后缀", "infix"),
+        ("后缀求值", "rpn"),
+        ("括号匹配", "brackets"),
+        ("调用轨迹", "calls"),
+    )
+    # turbo 模式每个定时器回调执行的步数，执行完让出事件循环
+    TURBO_BATCH = 5000
+    # normal 模式下无栈操作的步骤（输出、报错）停留的时间
+    NOTE_PAUSE_MS = 300
+
     def __init__(self, global_ctrl):
         super().__init__()
         self.model = StackModel()
         self.view = StackViewWithPersistence(global_ctrl)
         self.panel_index = -1
+        self._simulator = None
+        self._sim_turbo = False
+        self._sim_started = 0.0
+        self._view_locked = False
         self.panel = self._build_panel()
         self.view.interactionLocked.connect(self._toggle_controls)
         self.view.clearAllRequested.connect(self._on_clear_all_requested)
         self.view.saveRequested.connect(self._save_to_file)
         self.view.loadRequested.connect(self._load_from_file)
+        # 弹栈日志默认关闭，由面板上的复选框选择文件后开启；退出时关闭文件
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.view.close_pop_log)
+
+    @staticmethod
+    def _save_dir() -> Path:
+        return Path(__file__).resolve().parents[1] / "save_file" / "stack"
 
     def _save_to_file(self):
         snapshot = self.model.snapshot()
@@ -38,7 +70,7 @@ class StackController(QWidget):
             QMessageBox.information(self, "Stack", "当前栈为空，无需保存。")
             return
 
-        base_dir = Path(__file__).resolve().parents[1] / "save_file" / "stack"
+        base_dir = self._save_dir()
         base_dir.mkdir(parents=True, exist_ok=True)
         suggested = str(base_dir / "stack.json")
 
@@ -57,7 +89,7 @@ class StackController(QWidget):
             "schema": "pyqt_ds_visualizer",
             "version": 1,
             "structure": "stack",
-            "nodes": snapshot,
+            "nodes": list(snapshot),
             "popped_values": self.view.export_popped_values(),
         }
 
@@ -71,7 +103,7 @@ class StackController(QWidget):
         QMessageBox.information(self, "Stack", f"已保存到：\n{path}")
 
     def _load_from_file(self):
-        base_dir = Path(__file__).resolve().parents[1] / "save_file" / "stack"
+        base_dir = self._save_dir()
         base_dir.mkdir(parents=True, exist_ok=True)
 
         path, _ = QFileDialog.getOpenFileName(
@@ -99,8 +131,13 @@ class StackController(QWidget):
 
         nodes = payload.get("nodes", [])
         popped_values = payload.get("popped_values", [])
+        self._stop_simulation()
 
-        self.model.load_snapshot(nodes)
+        try:
+            self.model.load_snapshot(nodes)
+        except OverflowError as exc:
+            QMessageBox.critical(self, "Open Failed", f"栈容量不足：\n{exc}")
+            return
         snapshot = self.model.snapshot()
 
         self.view.reset()
@@ -143,7 +180,17 @@ class StackController(QWidget):
         self.push_btn = QPushButton("Push")
         self.push_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.push_btn.clicked.connect(self._on_push)
-        push_group_layout.addWidget(self.push_btn)
+
+        # 逗号分隔的多个值一次压入
+        self.push_many_btn = QPushButton("Push All")
+        self.push_many_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.push_many_btn.clicked.connect(self._on_push_many)
+
+        push_row = QHBoxLayout()
+        push_row.setSpacing(8)
+        push_row.addWidget(self.push_btn)
+        push_row.addWidget(self.push_many_btn)
+        push_group_layout.addLayout(push_row)
 
         layout.addWidget(push_group)
 
@@ -172,8 +219,87 @@ class StackController(QWidget):
         self.pop_btn.clicked.connect(self._on_pop)
         pop_group_layout.addWidget(self.pop_btn)
 
+        self.pop_count_spin = QSpinBox()
+        self.pop_count_spin.setRange(1, 999)
+        self.pop_count_spin.setValue(2)
+
+        self.pop_many_btn = QPushButton("Pop N")
+        self.pop_many_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.pop_many_btn.clicked.connect(self._on_pop_many)
+
+        pop_row = QHBoxLayout()
+        pop_row.setSpacing(8)
+        pop_row.addWidget(self.pop_count_spin)
+        pop_row.addWidget(self.pop_many_btn)
+        pop_group_layout.addLayout(pop_row)
+
+        self.pop_log_check = QCheckBox("Log pops to file…")
+        self.pop_log_check.setStyleSheet("color: white;")
+        self.pop_log_check.toggled.connect(self._on_pop_log_toggled)
+        pop_group_layout.addWidget(self.pop_log_check)
+
         layout.addWidget(pop_group)
 
+        capacity_group = QGroupBox("Capacity")
+        capacity_group.setStyleSheet(pop_group.styleSheet())
+        capacity_group_layout = QVBoxLayout(capacity_group)
+        capacity_group_layout.setContentsMargins(12, 24, 12, 12)
+        capacity_group_layout.setSpacing(8)
+
+        # 0 表示不限容量
+        self.capacity_spin = QSpinBox()
+        self.capacity_spin.setRange(0, 100000)
+        self.capacity_spin.setSpecialValueText("Unlimited")
+        self.capacity_spin.setValue(0)
+        self.capacity_spin.valueChanged.connect(self._on_capacity_changed)
+        capacity_group_layout.addWidget(self.capacity_spin)
+
+        layout.addWidget(capacity_group)
+
+        workload_group = QGroupBox("Workload")
+        workload_group.setStyleSheet(pop_group.styleSheet())
+        workload_layout = QVBoxLayout(workload_group)
+        workload_layout.setContentsMargins(12, 24, 12, 12)
+        workload_layout.setSpacing(8)
+
+        self.workload_combo = QComboBox()
+        for label, kind in self.WORKLOADS:
+            self.workload_combo.addItem(label, kind)
+        self.workload_speed_combo = QComboBox()
+        self.workload_speed_combo.addItem("Normal", "normal")
+        self.workload_speed_combo.addItem("Turbo", "turbo")
+        workload_row = QHBoxLayout()
+        workload_row.setSpacing(8)
+        workload_row.addWidget(self.workload_combo)
+        workload_row.addWidget(self.workload_speed_combo)
+        workload_layout.addLayout(workload_row)
+
+        self.workload_input = QLineEdit()
+        self.workload_input.setPlaceholderText("例如：3 + 4 * (2 - 1)")
+        self.workload_input.returnPressed.connect(self._on_run_workload)
+        workload_layout.addWidget(self.workload_input)
+
+        self.workload_run_btn = QPushButton("Run")
+        self.workload_run_btn.clicked.connect(self._on_run_workload)
+        self.workload_file_btn = QPushButton("From File…")
+        self.workload_file_btn.clicked.connect(self._on_run_workload_file)
+        self.workload_stop_btn = QPushButton("Stop")
+        self.workload_stop_btn.setDisabled(True)
+        self.workload_stop_btn.clicked.connect(self._on_stop_workload)
+        button_row = QHBoxLayout()
+        button_row.setSpacing(8)
+        button_row.addWidget(self.workload_run_btn)
+        button_row.addWidget(self.workload_file_btn)
+        button_row.addWidget(self.workload_stop_btn)
+        workload_layout.addLayout(button_row)
+
+        self.workload_label = QLabel()
+        self.workload_label.setStyleSheet("color: white;")
+        self.workload_label.setWordWrap(True)
+        workload_layout.addWidget(self.workload_label)
+
+        layout.addWidget(workload_group)
+
         layout.addStretch(1)
         return container
 
@@ -193,10 +319,28 @@ class StackController(QWidget):
         if not value_text:
             value_text = "∅"
         value = self._coerce_value(value_text)
-        info = self.model.push(value)
+        try:
+            info = self.model.push(value)
+        except OverflowError:
+            self._report_overflow(1)
+            return
         self.view.animate_push(self.model.snapshot(), info)
         self.push_input.clear()
 
+    def _on_push_many(self):
+        text = self.push_input.text().replace("，", ",")
+        values = [self._coerce_value(token.strip()) for token in text.split(",") if token.strip()]
+        if not values:
+            QMessageBox.information(self, "Stack", "请输入以逗号分隔的多个值。")
+            return
+        try:
+            infos = self.model.push_many(values)
+        except OverflowError:
+            self._report_overflow(len(values))
+            return
+        self.view.animate_push_many(self.model.snapshot(), infos)
+        self.push_input.clear()
+
     def _on_pop(self):
         if len(self.model) == 0:
             QMessageBox.information(self, "Stack", "Stack is empty.")
@@ -204,9 +348,184 @@ class StackController(QWidget):
         popped = self.model.pop()
         self.view.animate_pop(self.model.snapshot(), popped)
 
+    def _on_pop_many(self):
+        count = min(self.pop_count_spin.value(), len(self.model))
+        if count == 0:
+            QMessageBox.information(self, "Stack", "Stack is empty.")
+            return
+        popped = self.model.pop_many(count)
+        self.view.animate_pop_many(self.model.snapshot(), popped)
+
+    def _on_pop_log_toggled(self, checked):
+        if not checked:
+            self.view.set_pop_log(None)
+            return
+        base_dir = self._save_dir()
+        base_dir.mkdir(parents=True, exist_ok=True)
+        path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Pop Log",
+            str(base_dir / "pop_history.jsonl"),
+            "JSON Lines (*.jsonl);;All Files (*)",
+        )
+        if not path:
+            self.pop_log_check.blockSignals(True)
+            self.pop_log_check.setChecked(False)
+            self.pop_log_check.blockSignals(False)
+            return
+        self.view.set_pop_log(path)
+
+    def _on_capacity_changed(self, value):
+        try:
+            self.model.set_capacity(value or None)
+        except OverflowError:
+            QMessageBox.warning(self, "Stack", f"当前栈中已有 {len(self.model)} 个元素，容量不能小于该数量。")
+            self.capacity_spin.blockSignals(True)
+            self.capacity_spin.setValue(self.model.capacity or 0)
+            self.capacity_spin.blockSignals(False)
+
+    def _report_overflow(self, count):
+        self.view.flash_overflow()
+        free = self.model.capacity - len(self.model)
+        QMessageBox.warning(self, "Stack Overflow", f"容量为 {self.model.capacity}，剩余 {free} 个槽位，无法压入 {count} 个元素。")
+
+    # ---------- 负载模拟 ----------
+
+    def _on_run_workload(self):
+        text = self.workload_input.text().strip()
+        if not text:
+            QMessageBox.information(self, "Stack", "请输入表达式或调用轨迹。")
+            return
+        self._start_simulation(generate_steps(self.workload_combo.currentData(), text))
+
+    def _on_run_workload_file(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Open Workload", "", "Text Files (*.txt);;All Files (*)")
+        if not path:
+            return
+        self._start_simulation(iter_file_steps(path, self.workload_combo.currentData()))
+
+    def _start_simulation(self, steps):
+        self._stop_simulation()
+        self.model = StackModel(capacity=self.model.capacity)
+        self.view.reset()
+        self._simulator = StackSimulator(self.model, steps)
+        self._sim_turbo = self.workload_speed_combo.currentData() == "turbo"
+        self._sim_started = time.perf_counter()
+        self.workload_label.clear()
+        self._refresh_controls()
+        QTimer.singleShot(0, self._advance_simulation)
+
+    def _on_stop_workload(self):
+        if self._simulator is None:
+            return
+        self._show_simulation_stats("已停止")
+        self._sync_turbo_view()
+        self._stop_simulation()
+
+    def _stop_simulation(self):
+        if self._simulator is None:
+            return
+        self._simulator = None
+        self._refresh_controls()
+
+    def _sync_turbo_view(self):
+        """turbo 模式逐批执行时不更新栈图元，结束（包括中途停止或出错）时按模型整体布局一次。"""
+        if self._sim_turbo:
+            self.view.relayout_stack(self.model.snapshot())
+
+    def _advance_simulation(self):
+        simulator = self._simulator
+        if simulator is None or self._view_locked:
+            return
+        try:
+            if self._sim_turbo:
+                self._advance_turbo(simulator)
+            else:
+                self._advance_normal(simulator)
+        except (OSError, ValueError, UnicodeDecodeError) as exc:
+            self._sync_turbo_view()
+            self._finish_simulation(f"输入有误：{exc}")
+
+    def _advance_turbo(self, simulator):
+        records = simulator.run(self.TURBO_BATCH)
+        popped = [record["value"] for record in records if record["op"] == "pop"]
+        if popped:
+            self.view.append_popped_values(popped)
+        if simulator.finished:
+            self._sync_turbo_view()
+            self._finish_simulation(self._describe_record(records[-1]) if records else "")
+            return
+        self._show_simulation_stats(self._describe_record(records[-1]) if records else "")
+        QTimer.singleShot(0, self._advance_simulation)
+
+    def _advance_normal(self, simulator):
+        record = simulator.step()
+        if record is None:
+            self._finish_simulation("")
+            return
+        self._show_simulation_stats(self._describe_record(record))
+        if record["op"] == "push":
+            # 动画结束解锁时由 _toggle_controls 继续下一步
+            self.view.animate_push(self.model.snapshot(), record["info"])
+        elif record["op"] == "pop":
+            self.view.animate_pop(self.model.snapshot(), record["info"])
+        else:
+            if record["op"] == "overflow":
+                self.view.flash_overflow()
+            QTimer.singleShot(self.NOTE_PAUSE_MS, self._advance_simulation)
+
+    def _finish_simulation(self, message):
+        self._show_simulation_stats(message, done=True)
+        self._stop_simulation()
+
+    @staticmethod
+    def _describe_record(record) -> str:
+        op = record["op"]
+        note = f"（{record['note']}）" if record["note"] else ""
+        if op == "output":
+            return f"输出 {record['value']}"
+        if op in ("error", "overflow"):
+            return f"错误：{record['note']}"
+        return f"{op} {record['value']}{note}"
+
+    def _show_simulation_stats(self, message, done=False):
+        simulator = self._simulator
+        if simulator is None:
+            return
+        stats = simulator.stats()
+        wall = time.perf_counter() - self._sim_started
+        lines = [
+            f"步数 {stats['steps']}（push {stats['pushes']} / pop {stats['pops']}），"
+            f"深度 {stats['depth']}，最大深度 {stats['max_depth']}",
+            f"模拟 {stats['ops_per_sec']:.0f} ops/s，含动画 {stats['steps'] / wall if wall > 0 else 0:.1f} ops/s",
+        ]
+        if message:
+            lines.append(message)
+        if done:
+            lines.append("已完成")
+        self.workload_label.setText("\n".join(lines))
+
     def _toggle_controls(self, locked):
+        self._view_locked = locked
+        self._refresh_controls()
+        if not locked and self._simulator is not None and not self._sim_turbo:
+            QTimer.singleShot(0, self._advance_simulation)
+
+    def _refresh_controls(self):
+        # 模拟进行中禁止手动操作，避免与模拟步骤交错
+        locked = self._view_locked or self._simulator is not None
+        self.workload_run_btn.setDisabled(locked)
+        self.workload_file_btn.setDisabled(locked)
+        self.workload_combo.setDisabled(locked)
+        self.workload_speed_combo.setDisabled(locked)
+        self.workload_input.setDisabled(locked)
+        self.workload_stop_btn.setDisabled(self._simulator is None)
         self.push_btn.setDisabled(locked)
+        self.push_many_btn.setDisabled(locked)
         self.pop_btn.setDisabled(locked)
+        self.pop_many_btn.setDisabled(locked)
+        self.pop_count_spin.setDisabled(locked)
+        self.capacity_spin.setDisabled(locked)
         self.push_input.setDisabled(locked)
 
     @staticmethod
@@ -220,5 +539,6 @@ class StackController(QWidget):
                 return value
 
     def _on_clear_all_requested(self):
-        self.model = StackModel()
+        self._stop_simulation()
+        self.model = StackModel(capacity=self.model.capacity)
         self.view.reset()
\ No newline at end of file
@@ -0,0 +1,115 @@
+import json
+import time
+import uuid
+from collections import deque
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+
+class PopHistory:
+    """
+    弹栈记录：内存中只保留最近 capacity 个值（环形缓冲）以及最近 max_lines 行折行后的文本，
+    每次弹栈只把新值拼到最后一行，不重新折行整段历史。
+    设置 log_path 后，全部弹出值以 JSON Lines 追加写入磁盘，完整历史只存在于该文件中；
+    每次打开日志先写一行会话头 {"session", "started"}，close() 结束当前会话，之后的写入开始新会话。
+    """
+
+    def __init__(self, capacity: int = 256, line_limit: int = 26, max_lines: int = 12, log_path=None):
+        self.line_limit = max(10, line_limit)
+        self._recent: deque = deque(maxlen=capacity)
+        self._lines: deque = deque(maxlen=max_lines)
+        self.total = 0
+        # 最早的行已被挤出显示范围
+        self.truncated = False
+        self._log_path: Optional[Path] = None
+        self._log = None
+        # 最近一次打开日志时生成的会话标识，iter_log 默认只读出这个会话
+        self.session: Optional[str] = None
+        self.set_log_path(log_path)
+
+    # ---------- 日志 ----------
+
+    def set_log_path(self, path):
+        self.close()
+        self._log_path = Path(path) if path is not None else None
+        self.session = None
+
+    @property
+    def log_path(self) -> Optional[Path]:
+        return self._log_path
+
+    def close(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def _write_log(self, values: List):
+        if self._log_path is None:
+            return
+        if self._log is None:
+            self._log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._log = open(self._log_path, "a", encoding="utf-8")
+            self.session = uuid.uuid4().hex
+            header = {"session": self.session, "started": time.strftime("%Y-%m-%dT%H:%M:%S")}
+            self._log.write(json.dumps(header) + "\n")
+        self._log.write("".join(json.dumps(value, ensure_ascii=False) + "\n" for value in values))
+        self._log.flush()
+
+    def iter_log(self, session: Optional[str] = None) -> Iterator:
+        """逐条读出日志中某个会话（默认为当前会话）的弹出值，跳过会话头；没有日志文件时为空。"""
+        session = session or self.session
+        if self._log_path is None or session is None or not self._log_path.exists():
+            return
+        current = None
+        with open(self._log_path, "r", encoding="utf-8") as fh:
+            for line in fh:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if isinstance(record, dict) and "session" in record:
+                    current = record["session"]
+                elif current == session:
+                    yield record
+
+    # ---------- 记录 ----------
+
+    def append(self, values: Iterable, log: bool = True):
+        """记录若干弹出值；log=False 用于从存档恢复，不重复写入日志。"""
+        values = list(values)
+        if log:
+            self._write_log(values)
+        for value in values:
+            self._recent.append(value)
+            self._append_token(str(value).strip())
+        self.total += len(values)
+
+    def _append_token(self, token: str):
+        current = self._lines[-1] if self._lines else ""
+        addition = f" {token}" if current else token
+        if current and len(current) + len(addition) > self.line_limit:
+            if len(self._lines) == self._lines.maxlen:
+                self.truncated = True
+            self._lines.append(token)
+        elif self._lines:
+            self._lines[-1] = current + addition
+        else:
+            self._lines.append(token)
+
+    def clear(self):
+        """清空面板上的记录；磁盘日志只追加，不受影响。"""
+        self._recent.clear()
+        self._lines.clear()
+        self.total = 0
+        self.truncated = False
+
+    def recent(self) -> List:
+        return list(self._recent)
+
+    def lines(self) -> List[str]:
+        return list(self._lines)
+
+    def __len__(self):
+        return len(self._recent)
+
+    def __bool__(self):
+        return bool(self._recent)
@@ -1,32 +1,152 @@
 import itertools
-from typing import Dict, List
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Iterable, List, Optional
+
+
+class StackSnapshot(Sequence):
+    """
+    栈的只读视图（自底向上），O(1) 创建，不复制元素。
+    元素按需生成 {"id", "value"} 字典；栈在快照之后被修改时再访问会抛出 RuntimeError，
+    需要长期保存时用 list(snapshot) 复制一份。
+    """
+
+    __slots__ = ("_model", "_length", "_version")
+
+    def __init__(self, model: "StackModel"):
+        self._model = model
+        self._length = model._length
+        self._version = model._version
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if self._version != self._model._version:
+            raise RuntimeError("stack changed after snapshot")
+        if isinstance(index, slice):
+            return [self._model._info(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("snapshot index out of range")
+        return self._model._info(index)
 
 
 class StackModel:
-    """Simple stack backed by Python list but with explicit element ids."""
+    """
+    元素带显式 id 的栈，id 与值分别存放在并列的缓冲区中。
+
+    id 使用 int64 数组；值全为整数时同样使用 int64 数组，出现其他类型后退化为对象列表。
+    弹出只移动栈顶下标，槽位留给之后的压栈复用，缓冲区不会反复收缩 / 扩张。
+    capacity 不为 None 时模拟定长栈，超出容量的压栈抛出 OverflowError。
+    """
 
-    def __init__(self):
+    def __init__(self, capacity: Optional[int] = None):
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
         self._id_iter = itertools.count()
-        self._items: List[Dict] = []
+        self._ids = array("q")
+        self._values = array("q")
+        self._length = 0
+        self._version = 0
+
+    def snapshot(self) -> StackSnapshot:
+        return StackSnapshot(self)
+
+    def _info(self, index: int) -> Dict:
+        return {"id": self._ids[index], "value": self._values[index]}
+
+    # ---------- 容量 ----------
+
+    def is_full(self) -> bool:
+        return self.capacity is not None and self._length >= self.capacity
 
-    def snapshot(self):
-        return list(self._items)
+    def set_capacity(self, capacity: Optional[int]):
+        """调整容量；None 表示不限。当前元素已超过新容量时抛出 OverflowError。"""
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be positive")
+        if capacity is not None and self._length > capacity:
+            raise OverflowError(f"stack holds {self._length} items, more than capacity {capacity}")
+        self.capacity = capacity
+
+    def _check_room(self, count: int):
+        if self.capacity is not None and self._length + count > self.capacity:
+            raise OverflowError("Stack overflow")
+
+    # ---------- 基本操作 ----------
 
     def push(self, value):
+        self._check_room(1)
+        return self._push(value)
+
+    def _push(self, value):
         node_id = next(self._id_iter)
-        info = {"id": node_id, "value": value}
-        self._items.append(info)
-        return info
+        self._store(self._length, node_id, value)
+        self._length += 1
+        self._version += 1
+        return {"id": node_id, "value": value}
 
     def pop(self):
-        if not self._items:
+        if not self._length:
             raise IndexError("Stack empty")
-        return self._items.pop()
+        self._length -= 1
+        self._version += 1
+        return self._info(self._length)
+
+    def peek(self):
+        if not self._length:
+            raise IndexError("Stack empty")
+        return self._info(self._length - 1)
+
+    def push_many(self, values: Iterable) -> List[Dict]:
+        """依次压入 values；容量不足时一个也不压入。返回按压入顺序排列的元素。"""
+        values = list(values)
+        self._check_room(len(values))
+        return [self._push(value) for value in values]
+
+    def pop_many(self, count: int) -> List[Dict]:
+        """弹出 count 个元素，返回按弹出顺序（栈顶在前）排列的元素。"""
+        if count < 0:
+            raise ValueError("count must be non-negative")
+        if count > self._length:
+            raise IndexError("Stack empty")
+        popped = [self._info(index) for index in range(self._length - 1, self._length - count - 1, -1)]
+        self._length -= count
+        if count:
+            self._version += 1
+        return popped
 
     def __len__(self):
-        return len(self._items)
+        return self._length
 
     def load_snapshot(self, nodes):
-        self._items = [dict(id=item["id"], value=item["value"]) for item in nodes]
-        max_id = max((item["id"] for item in self._items), default=-1)
-        self._id_iter = itertools.count(max_id + 1)
\ No newline at end of file
+        nodes = list(nodes)
+        if self.capacity is not None and len(nodes) > self.capacity:
+            raise OverflowError(f"{len(nodes)} items exceed stack capacity {self.capacity}")
+        self._ids = array("q")
+        self._values = array("q")
+        self._length = 0
+        for item in nodes:
+            self._store(self._length, item["id"], item["value"])
+            self._length += 1
+        self._version += 1
+        max_id = max((item["id"] for item in nodes), default=-1)
+        self._id_iter = itertools.count(max_id + 1)
+
+    # ---------- 缓冲区 ----------
+
+    def _store(self, index: int, node_id: int, value):
+        if isinstance(self._values, array) and not self._fits_int64(value):
+            self._values = list(self._values)
+        if index < len(self._ids):
+            self._ids[index] = node_id
+            self._values[index] = value
+        else:
+            self._ids.append(node_id)
+            self._values.append(value)
+
+    @staticmethod
+    def _fits_int64(value) -> bool:
+        return type(value) is int and -(1 << 63) <= value < (1 << 63)
@@ -1,5 +1,4 @@
-import math
-from PyQt5.QtCore import QPointF, QRectF, Qt, QEvent, pyqtSignal, QEasingCurve, QVariantAnimation
+from PyQt5.QtCore import QPointF, QRectF, Qt, QEvent, pyqtSignal, QEasingCurve
 from PyQt5.QtGui import QColor, QBrush, QPen, QTransform
 from PyQt5.QtWidgets import (
     QGraphicsItem,
@@ -9,6 +8,7 @@ from PyQt5.QtWidgets import (
 )
 
 from core.base_view import BaseStructureView
+from stack.st_history import PopHistory
 
 
 class StackView(BaseStructureView):
@@ -22,10 +22,14 @@ class StackView(BaseStructureView):
 
         self.nodes = {}  # id -> StackNodeItem
         self.order = []  # bottom -> top
-        self.popped_values = []
         self.base_pos = QPointF(-StackNodeItem.width / 2, 140)
         self.spacing = 52
         self.pop_line_limit = 26
+        # 整体重排时只为栈顶这么多个元素创建图元，更深的部分折叠成栈底的深度标签
+        self.visible_limit = 64
+        self.hidden_depth = 0
+        # 最近的弹出值（环形缓冲）与折行后的显示文本；完整历史可选写入磁盘日志
+        self.pop_history = PopHistory(line_limit=self.pop_line_limit)
 
         self.container_padding_x = 8
         self.container_padding_top = 6
@@ -40,6 +44,9 @@ class StackView(BaseStructureView):
         self.output_text = self._create_output_text_item()
         self.scene.addItem(self.output_text)
 
+        self.depth_label = self._create_depth_label_item()
+        self.scene.addItem(self.depth_label)
+
         self._default_scene_rect = QRectF(self.scene.sceneRect())
         self._scaled = False
         self._dragging = False
@@ -48,10 +55,13 @@ class StackView(BaseStructureView):
         self._update_output_text()
 
     def reset(self):
-        self.scene.clear()
+        self.clear_scene()
         self.nodes.clear()
         self.order.clear()
-        self.popped_values.clear()
+        self.hidden_depth = 0
+        self.pop_history.clear()
+        # 清空即结束当前日志会话，之后的弹栈写在新的会话头之后
+        self.pop_history.close()
         self.scene.setSceneRect(self._default_scene_rect)
         self._scaled = False
         if self._canvas:
@@ -63,6 +73,9 @@ class StackView(BaseStructureView):
         self.output_text = self._create_output_text_item()
         self.scene.addItem(self.output_text)
 
+        self.depth_label = self._create_depth_label_item()
+        self.scene.addItem(self.depth_label)
+
         self._update_container_geometry()
         self._update_output_text()
 
@@ -73,7 +86,7 @@ class StackView(BaseStructureView):
         node.setOpacity(0.0)
         self.scene.addItem(node)
 
-        final_index = len(stack_snapshot) - 1
+        final_index = len(stack_snapshot) - 1 - self.hidden_depth
         target_pos = self._slot_position(final_index)
         entry_pos = self._mouth_position_for_target(target_pos)
         spawn_pos = self._spawn_position_for_target(target_pos)
@@ -81,9 +94,9 @@ class StackView(BaseStructureView):
         node.setPos(spawn_pos)
 
         path_duration = 540
-        path_anim = self._move_node_through(
+        path_anim = self.anim.path_item(
             node,
-            [entry_pos, target_pos],
+            [spawn_pos, entry_pos, target_pos],
             duration=path_duration,
             easing=QEasingCurve.InOutSine,
         )
@@ -95,7 +108,7 @@ class StackView(BaseStructureView):
         self.order.append(node_id)
 
         group = self.anim.sequential(fly_in)
-        self._track_animation(group, finalizer=lambda: self._after_push(stack_snapshot))
+        self._track_animation(group, finalizer=lambda: self._after_push(stack_snapshot, [node]))
 
     def animate_pop(self, stack_snapshot, popped_info):
         node_id = popped_info["id"]
@@ -107,9 +120,9 @@ class StackView(BaseStructureView):
         exit_pos = self._exit_position_above_for_node(node)
         drift_target = self._pop_queue_target()
 
-        path_to_exit = self._move_node_through(
+        path_to_exit = self.anim.path_item(
             node,
-            [mouth_pos, exit_pos],
+            [node.pos(), mouth_pos, exit_pos],
             duration=420,
             easing=QEasingCurve.InOutSine,
         )
@@ -121,7 +134,9 @@ class StackView(BaseStructureView):
             self.anim.parallel(drift, fade),
         )
 
-        if node_id in self.order:
+        if self.order and self.order[-1] == node_id:
+            self.order.pop()
+        elif node_id in self.order:
             self.order.remove(node_id)
 
         def _finalizer():
@@ -131,9 +146,97 @@ class StackView(BaseStructureView):
 
         self._track_animation(seq, finalizer=_finalizer)
 
+    def animate_push_many(self, stack_snapshot, pushed_infos):
+        """批量压栈：所有新元素以固定间隔错开，作为一个整体动画飞入各自的槽位。"""
+        if not pushed_infos:
+            return
+        first_index = len(stack_snapshot) - len(pushed_infos) - self.hidden_depth
+        stagger = 70
+        path_duration = 540
+        motions = []
+        for offset, info in enumerate(pushed_infos):
+            node = StackNodeItem(info["id"], info["value"])
+            node.setOpacity(0.0)
+            self.scene.addItem(node)
+
+            target_pos = self._slot_position(first_index + offset)
+            entry_pos = self._mouth_position_for_target(target_pos)
+            node.setPos(self._spawn_position_for_target(target_pos))
+
+            fly_in = self.anim.parallel(
+                self.anim.path_item(
+                    node,
+                    [node.pos(), entry_pos, target_pos],
+                    duration=path_duration,
+                    easing=QEasingCurve.InOutSine,
+                ),
+                self.anim.fade_item(node, 0.0, 1.0, duration=path_duration),
+            )
+            motions.append(self.anim.sequential(self.anim.pause(offset * stagger), fly_in) if offset else fly_in)
+
+            self.nodes[info["id"]] = node
+            self.order.append(info["id"])
+
+        group = self.anim.parallel(*motions)
+        new_nodes = [self.nodes[info["id"]] for info in pushed_infos]
+        self._track_animation(group, finalizer=lambda: self._after_push(stack_snapshot, new_nodes))
+
+    def animate_pop_many(self, stack_snapshot, popped_infos):
+        """批量弹栈：栈顶的若干元素一起移出栈口，再一起漂向 POP 区淡出。popped_infos 栈顶在前。"""
+        nodes = [self.nodes.get(info["id"]) for info in popped_infos]
+        nodes = [node for node in nodes if node]
+        if not nodes:
+            return
+
+        # 整组保持相对位置向上平移，最下面的元素恰好离开栈口
+        lowest = max(nodes, key=lambda node: node.y())
+        lift = self._exit_position_above_for_node(lowest).y() - lowest.y()
+        drift_target = self._pop_queue_target()
+
+        exits = []
+        drifts = []
+        for node in nodes:
+            exit_pos = QPointF(node.x(), node.y() + lift)
+            exits.append(self.anim.move_item(node, exit_pos, duration=420, easing=QEasingCurve.InOutSine))
+            drifts.append(self.anim.move_item(node, drift_target, duration=360))
+            drifts.append(self.anim.fade_item(node, 1.0, 0.0, duration=360))
+
+        seq = self.anim.sequential(self.anim.parallel(*exits), self.anim.parallel(*drifts))
+
+        removed = {info["id"] for info in popped_infos}
+        while self.order and self.order[-1] in removed:
+            self.order.pop()
+
+        def _finalizer():
+            for node in nodes:
+                self.scene.removeItem(node)
+                self.nodes.pop(node.node_id, None)
+            self._after_pop_many(stack_snapshot, [info["value"] for info in popped_infos])
+
+        self._track_animation(seq, finalizer=_finalizer)
+
+    def flash_overflow(self):
+        """容量已满时闪烁栈容器的边框。"""
+        container = self.container_item
+        original = QColor(container.stroke_color)
+        flash = self.anim.flash_brush(
+            setter=container.setStrokeColor,
+            start_color=original,
+            end_color=QColor("#e53935"),
+            duration=180,
+            loops=2,
+        )
+        self._track_animation(flash, finalizer=lambda: container.setStrokeColor(original))
+
     def relayout_stack(self, stack_snapshot):
+        """
+        整体重排（载入文件、turbo 模拟结束时使用），逐个 push / pop 只更新栈顶，见 _after_push / _after_pop。
+        只有栈顶 visible_limit 个元素有图元，槽位下标从可见部分的底部算起，图元数与栈深无关。
+        """
+        self.hidden_depth = max(0, len(stack_snapshot) - self.visible_limit)
         animations = []
-        for idx, info in enumerate(stack_snapshot):
+        self.order = []
+        for idx, info in enumerate(stack_snapshot[self.hidden_depth:]):
             node_id = info["id"]
             node = self.nodes.get(node_id)
             if not node:
@@ -143,24 +246,36 @@ class StackView(BaseStructureView):
             target = self._slot_position(idx)
             animations.append(self.anim.move_item(node, target, duration=500))
             node.set_value(info["value"])
-        for redundant_id in list(self.nodes):
-            if all(item["id"] != redundant_id for item in stack_snapshot):
-                node = self.nodes.pop(redundant_id)
-                self.scene.removeItem(node)
+            self.order.append(node_id)
+        keep = set(self.order)
+        for redundant_id in [node_id for node_id in self.nodes if node_id not in keep]:
+            node = self.nodes.pop(redundant_id)
+            self.scene.removeItem(node)
+        self._update_depth_label()
         if animations:
             group = self.anim.parallel(*animations)
             self._track_animation(group, finalizer=lambda: self._refresh_layout(stack_snapshot))
         else:
             self._refresh_layout(snapshot=stack_snapshot)
 
-    def _after_push(self, snapshot):
-        self._refresh_layout(snapshot)
+    def _after_push(self, snapshot, new_nodes=()):
+        # 只有新压入的元素需要调整层级，容器按元素个数增量伸长
+        for node in new_nodes:
+            node.setZValue(1)
+        self._update_container_geometry()
         self._update_output_text_position()
+        self._fit_view_if_needed()
 
     def _after_pop(self, snapshot, popped_value):
-        self.popped_values.append(popped_value)
+        self._after_pop_many(snapshot, [popped_value])
+
+    def _after_pop_many(self, snapshot, popped_values):
+        self.pop_history.append(popped_values)
+        if self.hidden_depth and not self.order:
+            # 可见部分已弹空，从快照里展开下一段
+            self.relayout_stack(snapshot)
+        self._update_container_geometry()
         self._update_output_text()
-        self._refresh_layout(snapshot)
 
     def _refresh_layout(self, snapshot):
         for node in self.nodes.values():
@@ -168,6 +283,18 @@ class StackView(BaseStructureView):
         self._update_container_geometry()
         self._auto_scale_view()
 
+    def _fit_view_if_needed(self):
+        """
+        栈增长到当前场景范围之外，或缩到不足一半高度时才重新适配视图，
+        其余 push / pop 不触碰视图变换。
+        """
+        if not self._canvas or self._dragging:
+            return
+        content = self._stack_bounds().united(self.output_text.mapRectToScene(self.output_text.boundingRect()))
+        scene_rect = self.scene.sceneRect()
+        if not scene_rect.contains(content) or (self._scaled and content.height() * 2 < scene_rect.height()):
+            self._auto_scale_view()
+
     def _auto_scale_view(self, padding=80):
         if not self._canvas or self._dragging:
             return
@@ -217,20 +344,15 @@ class StackView(BaseStructureView):
             self._scaled = False
 
     def _stack_bounds(self) -> QRectF:
-        """仅返回栈节点（不含 POP 文本）的包围盒。"""
-        if not self.nodes:
-            return QRectF(
-                self.base_pos.x(),
-                self.base_pos.y() - StackNodeItem.height,
-                StackNodeItem.width,
-                StackNodeItem.height,
-            )
-
-        bounds = None
-        for node in self.nodes.values():
-            node_rect = node.mapRectToScene(node.boundingRect())
-            bounds = node_rect if bounds is None else bounds.united(node_rect)
-        return bounds
+        """仅返回栈节点（不含 POP 文本）的包围盒；元素都落在槽位上，直接由元素个数算出。"""
+        count = max(1, len(self.order))
+        top = self._slot_position(count - 1).y()
+        return QRectF(
+            self.base_pos.x(),
+            top,
+            StackNodeItem.width,
+            self.base_pos.y() - top,
+        )
 
     def on_canvas_ready(self):
         """在画布绑定完成后立即居中一次，避免初始状态偏移。"""
@@ -238,14 +360,17 @@ class StackView(BaseStructureView):
         self._auto_scale_view()
 
     def _update_output_text(self):
-        lines = self._wrap_popped_values()
+        # 只拼接有限的几行，代价与历史长度无关
+        lines = self.pop_history.lines()
         if not lines:
             text = "POP: —"
         else:
+            if self.pop_history.truncated:
+                lines[0] = "… " + lines[0]
             text = "POP:" + "\n".join(lines)
         self.output_text.setText(text)
         self._update_output_text_position()
-        self._auto_scale_view()
+        self._fit_view_if_needed()
 
     def _update_output_text_position(self):
         stack_top = self._stack_top_y()
@@ -256,28 +381,22 @@ class StackView(BaseStructureView):
         rect = self.output_text.boundingRect()
         self.output_text.setPos(anchor.x(), anchor.y() - rect.height())
 
-    def _wrap_popped_values(self):
-        if not self.popped_values:
-            return []
-        limit = max(10, self.pop_line_limit)
-        lines = []
-        current = ""
-        for token in map(str, self.popped_values):
-            token = token.strip()
-            addition = token if not current else f" {token}"
-            if len(current) + len(addition) > limit and current:
-                lines.append(current)
-                current = token
-            else:
-                current = current + addition if current else token
-        if current:
-            lines.append(current)
-        return lines
+    def append_popped_values(self, values):
+        """不播放动画，直接把一批弹出值记入 POP 区（模拟器 turbo 模式使用）。"""
+        self.pop_history.append(values)
+        self._update_output_text()
+
+    def set_pop_log(self, path):
+        """把全部弹出值追加写入 path（JSON Lines）；None 关闭日志。"""
+        self.pop_history.set_log_path(path)
+
+    def close_pop_log(self):
+        self.pop_history.close()
 
     def _clear_pop_history(self):
-        if not self.popped_values:
+        if not self.pop_history:
             return
-        self.popped_values.clear()
+        self.pop_history.clear()
         self._update_output_text()
 
     def _cancel_pending_animations(self):
@@ -323,6 +442,27 @@ class StackView(BaseStructureView):
         item.setZValue(5)
         return item
 
+    def _create_depth_label_item(self):
+        item = QGraphicsSimpleTextItem()
+        item.setBrush(QColor("#90a4ae"))
+        font = item.font()
+        font.setPointSize(12)
+        item.setFont(font)
+        item.setZValue(5)
+        item.setVisible(False)
+        return item
+
+    def _update_depth_label(self):
+        self.depth_label.setVisible(self.hidden_depth > 0)
+        if not self.hidden_depth:
+            return
+        self.depth_label.setText(f"… 下方还有 {self.hidden_depth:,} 个元素")
+        rect = self.depth_label.boundingRect()
+        self.depth_label.setPos(
+            self.base_pos.x() + (StackNodeItem.width - rect.width()) / 2,
+            self.base_pos.y() + self.container_padding_bottom + self.container_extra_bottom + 4,
+        )
+
     def _create_container_item(self):
         item = StackContainerItem()
         item.setZValue(0)
@@ -348,9 +488,7 @@ class StackView(BaseStructureView):
         self.container_item.setPos(left_x, top_y)
 
     def _stack_top_y(self):
-        if not self.nodes:
-            return self.base_pos.y() - StackNodeItem.height
-        return min(node.y() for node in self.nodes.values())
+        return self._slot_position(max(0, len(self.order) - 1)).y()
 
     def _slot_position(self, index_from_bottom: int) -> QPointF:
         return QPointF(
@@ -387,55 +525,6 @@ class StackView(BaseStructureView):
             self.base_pos.y() - StackNodeItem.height - 40,
         )
 
-    def _move_node_through(
-        self,
-        node: QGraphicsObject,
-        waypoints: list[QPointF],
-        duration: int,
-        easing: QEasingCurve = QEasingCurve.InOutCubic,
-    ):
-        if not waypoints:
-            return self.anim.move_item(node, node.pos(), duration=duration)
-
-        points = [node.pos()] + waypoints
-        seg_lengths = [
-            self._distance_between(points[i], points[i + 1])
-            for i in range(len(points) - 1)
-        ]
-        total_length = sum(seg_lengths) or 1.0
-
-        animation = QVariantAnimation(self)
-        animation.setDuration(duration)
-        animation.setStartValue(0.0)
-        animation.setEndValue(1.0)
-        animation.setEasingCurve(easing)
-
-        def _update(value: float):
-            traveled = value * total_length
-            accumulated = 0.0
-            for idx, seg_len in enumerate(seg_lengths):
-                next_accum = accumulated + seg_len
-                if traveled <= next_accum or idx == len(seg_lengths) - 1:
-                    span = seg_len or 1.0
-                    local_t = (traveled - accumulated) / span if span else 0.0
-                    pos = self._lerp_point(points[idx], points[idx + 1], local_t)
-                    node.setPos(pos)
-                    break
-                accumulated = next_accum
-
-        animation.valueChanged.connect(_update)
-        animation.finished.connect(lambda: node.setPos(points[-1]))
-        return animation
-
-    def _lerp_point(self, a: QPointF, b: QPointF, t: float) -> QPointF:
-        return QPointF(
-            a.x() + (b.x() - a.x()) * t,
-            a.y() + (b.y() - a.y()) * t,
-        )
-
-    def _distance_between(self, a: QPointF, b: QPointF) -> float:
-        return math.hypot(b.x() - a.x(), b.y() - a.y())
-
 
 class StackNodeItem(QGraphicsObject):
     width = 120
@@ -491,6 +580,10 @@ class StackContainerItem(QGraphicsObject):
     def boundingRect(self):
         return self._rect
 
+    def setStrokeColor(self, color: QColor):
+        self.stroke_color = QColor(color)
+        self.update()
+
     def set_geometry(self, width, height):
         new_rect = QRectF(0, 0, width, height)
         if new_rect == self._rect:
@@ -551,8 +644,10 @@ class StackViewWithPersistence(StackView):
             self.clearAllRequested.emit()
 
     def export_popped_values(self):
-        return list(self.popped_values)
+        """只导出环形缓冲中最近的弹出值，完整历史见 pop_history.log_path。"""
+        return self.pop_history.recent()
 
     def load_popped_values(self, values):
-        self.popped_values = list(values or [])
+        self.pop_history.clear()
+        self.pop_history.append(values or [], log=False)
         self._update_output_text()
\ No newline at end of file
@@ -0,0 +1,284 @@
+"""
+栈负载模拟：把真实任务拆成栈操作步骤，驱动 StackModel 并统计最大深度与吞吐。
+
+- infix_steps：中缀表达式转后缀（调度场算法），运算符栈；
+- rpn_steps：后缀表达式求值，操作数栈；
+- bracket_steps：括号匹配；
+- call_trace_steps：函数调用轨迹（每行 ``call 名称`` / ``return``）。
+
+每一步是 {"op": "push" | "pop" | "output" | "error", "value", "note"}，
+所有生成器都是惰性的；iter_file_steps 逐行读取文件，任意长度的输入都不会整体载入内存。
+"""
+
+import operator
+import re
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+WORKLOAD_KINDS = ("infix", "rpn", "brackets", "calls")
+
+_TOKEN_RE = re.compile(r"\s*(?:(\d+\.\d*|\.\d+|\d+)|([A-Za-z_]\w*)|(\*\*|[-+*/%^()]))")
+# 运算符: (优先级, 是否右结合)
+_PRECEDENCE = {"+": (1, False), "-": (1, False), "*": (2, False), "/": (2, False), "%": (2, False), "^": (3, True)}
+_BINARY: Dict[str, Callable] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "%": operator.mod,
+    "^": operator.pow,
+}
+_BRACKETS = {")": "(", "]": "[", "}": "{"}
+
+
+def _step(op: str, value=None, note: str = "") -> Dict:
+    return {"op": op, "value": value, "note": note}
+
+
+def tokenize(expression: str) -> List[str]:
+    """拆分数字、标识符、运算符与括号；``**`` 视为 ``^``。"""
+    tokens = []
+    position = 0
+    text = expression.rstrip()
+    while position < len(text):
+        match = _TOKEN_RE.match(text, position)
+        if not match:
+            raise ValueError(f"unexpected character {text[position]!r} at {position}")
+        number, name, symbol = match.groups()
+        tokens.append("^" if symbol == "**" else (number or name or symbol))
+        position = match.end()
+    return tokens
+
+
+def _parse_number(token: str):
+    return float(token) if "." in token else int(token)
+
+
+# ---------- 工作负载 ----------
+
+def infix_steps(expression: str) -> Iterator[Dict]:
+    """调度场算法：运算符与左括号入栈，操作数直接输出，遇到右括号或低优先级运算符时弹栈输出。"""
+    stack: List[str] = []
+    for token in tokenize(expression):
+        if token == "(":
+            stack.append(token)
+            yield _step("push", token)
+        elif token == ")":
+            while stack and stack[-1] != "(":
+                yield _step("pop", stack.pop(), "output")
+            if not stack:
+                raise ValueError("unbalanced ')' in expression")
+            yield _step("pop", stack.pop(), "discard")
+        elif token in _PRECEDENCE:
+            precedence, right = _PRECEDENCE[token]
+            while stack and stack[-1] != "(":
+                top_precedence = _PRECEDENCE[stack[-1]][0]
+                if top_precedence > precedence or (top_precedence == precedence and not right):
+                    yield _step("pop", stack.pop(), "output")
+                else:
+                    break
+            stack.append(token)
+            yield _step("push", token)
+        else:
+            yield _step("output", token)
+    while stack:
+        if stack[-1] == "(":
+            raise ValueError("unbalanced '(' in expression")
+        yield _step("pop", stack.pop(), "output")
+
+
+def infix_to_postfix(expression: str) -> List[str]:
+    postfix = []
+    for step in infix_steps(expression):
+        if step["op"] == "output" or step["note"] == "output":
+            postfix.append(step["value"])
+    return postfix
+
+
+def rpn_steps(tokens) -> Iterator[Dict]:
+    """后缀表达式求值：操作数入栈，运算符弹出两个操作数并压入结果，最后弹出结果。"""
+    if isinstance(tokens, str):
+        tokens = tokenize(tokens)
+    stack: List = []
+    for token in tokens:
+        if token in _BINARY:
+            if len(stack) < 2:
+                raise ValueError(f"operator {token} needs two operands")
+            right = stack.pop()
+            yield _step("pop", right)
+            left = stack.pop()
+            yield _step("pop", left)
+            try:
+                result = _BINARY[token](left, right)
+            except ZeroDivisionError:
+                raise ValueError(f"division by zero in {left} {token} {right}") from None
+            stack.append(result)
+            yield _step("push", result, f"{left} {token} {right}")
+        else:
+            value = _parse_number(token)
+            stack.append(value)
+            yield _step("push", value)
+    if len(stack) != 1:
+        raise ValueError("expression leaves {} values on the stack".format(len(stack)))
+    yield _step("pop", stack.pop(), "result")
+
+
+def bracket_steps(text: str) -> Iterator[Dict]:
+    """
+    括号匹配：左括号入栈，右括号与栈顶配对后弹栈。
+    不匹配时产出一条 error，再把剩余元素依次弹出，保证每段输入结束时栈为空。
+    """
+    stack: List[str] = []
+    error = None
+    for index, char in enumerate(text):
+        if char in "([{":
+            stack.append(char)
+            yield _step("push", char)
+        elif char in _BRACKETS:
+            if not stack or stack[-1] != _BRACKETS[char]:
+                error = f"unmatched {char!r} at {index}"
+                break
+            yield _step("pop", stack.pop(), "matched")
+    if error is None and stack:
+        error = f"{len(stack)} unclosed bracket(s)"
+    if error is not None:
+        yield _step("error", None, error)
+        while stack:
+            yield _step("pop", stack.pop(), "discard")
+
+
+def call_trace_steps(lines: Iterable[str]) -> Iterator[Dict]:
+    """
+    调用轨迹：``call f 3`` 或 ``-> f 3`` 压入一帧，``return`` / ``ret`` / ``<-`` 弹出栈顶帧；
+    空行与 # 开头的行忽略。
+    """
+    depth = 0
+    for number, raw in enumerate(lines, start=1):
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        head, _, rest = line.partition(" ")
+        if head in ("call", "->"):
+            frame = rest.strip()
+            if not frame:
+                raise ValueError(f"line {number}: call without a frame name")
+            depth += 1
+            yield _step("push", frame)
+        elif head in ("return", "ret", "<-"):
+            if depth == 0:
+                raise ValueError(f"line {number}: return with an empty call stack")
+            depth -= 1
+            yield _step("pop", None, rest.strip())
+        else:
+            raise ValueError(f"line {number}: unknown trace entry {line!r}")
+
+
+def generate_steps(kind: str, text: str) -> Iterator[Dict]:
+    """单段输入；calls 以换行或分号分隔各条记录。"""
+    if kind == "infix":
+        return infix_steps(text)
+    if kind == "rpn":
+        return rpn_steps(text)
+    if kind == "brackets":
+        return bracket_steps(text)
+    if kind == "calls":
+        return call_trace_steps(re.split(r"[;\n]", text))
+    raise ValueError(f"unknown workload kind: {kind}")
+
+
+def iter_file_steps(path, kind: str, encoding: str = "utf-8") -> Iterator[Dict]:
+    """
+    逐行读取文件：calls 把整个文件当作一条轨迹，其余类型每个非空、非 # 开头的行是一段独立输入。
+    """
+    if kind not in WORKLOAD_KINDS:
+        raise ValueError(f"unknown workload kind: {kind}")
+    with open(path, "r", encoding=encoding) as fh:
+        if kind == "calls":
+            yield from call_trace_steps(fh)
+            return
+        for line in fh:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield from generate_steps(kind, line)
+
+
+# ---------- 模拟器 ----------
+
+class StackSimulator:
+    """
+    把步骤逐条作用到 StackModel 上并计数。
+    push 超出模型容量时记录一条 overflow 并结束，之后不再消费步骤。
+    """
+
+    def __init__(self, model, steps: Iterable[Dict]):
+        self.model = model
+        self._steps = iter(steps)
+        self.finished = False
+        self.steps = 0
+        self.pushes = 0
+        self.pops = 0
+        self.errors = 0
+        self.max_depth = len(model)
+        self.elapsed = 0.0
+
+    def step(self) -> Optional[Dict]:
+        """执行一步，返回 {"op", "value", "note", "info"}；没有更多步骤时返回 None。"""
+        if self.finished:
+            return None
+        start = time.perf_counter()
+        try:
+            step = next(self._steps, None)
+            if step is None:
+                self.finished = True
+                return None
+            record = self._apply(step)
+        finally:
+            self.elapsed += time.perf_counter() - start
+        self.steps += 1
+        return record
+
+    def _apply(self, step: Dict) -> Dict:
+        op = step["op"]
+        record = dict(step, info=None)
+        if op == "push":
+            try:
+                record["info"] = self.model.push(step["value"])
+            except OverflowError:
+                self.finished = True
+                self.errors += 1
+                return dict(step, op="overflow", info=None, note=f"overflow at depth {len(self.model)}")
+            self.pushes += 1
+            if len(self.model) > self.max_depth:
+                self.max_depth = len(self.model)
+        elif op == "pop":
+            record["info"] = self.model.pop()
+            record["value"] = record["info"]["value"]
+            self.pops += 1
+        elif op == "error":
+            self.errors += 1
+        return record
+
+    def run(self, limit: Optional[int] = None) -> List[Dict]:
+        """连续执行至多 limit 步（None 表示直到结束），返回这些步骤的记录。"""
+        records = []
+        while limit is None or len(records) < limit:
+            record = self.step()
+            if record is None:
+                break
+            records.append(record)
+        return records
+
+    @property
+    def ops_per_sec(self) -> float:
+        return self.steps / self.elapsed if self.elapsed > 0 else 0.0
+
+    def stats(self) -> Dict:
+        return {
+            "steps": self.steps,
+            "pushes": self.pushes,
+            "pops": self.pops,
+            "errors": self.errors,
+            "max_depth": self.max_depth,
+            "depth": len(self.model),
+            "ops_per_sec": self.ops_per_sec,
+        }
@@ -0,0 +1,166 @@
+import gc
+import os
+import tracemalloc
+
+import pytest
+
+from core.item_registry import ItemRegistry
+
+CYCLES = 10_000
+
+
+class FakeSignal:
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+    def disconnect(self, slot):
+        self.slots.remove(slot)
+
+
+class FakeNode:
+    def __init__(self):
+        self.positionChanged = FakeSignal()
+
+
+class FakeEdge:
+    """与 HuffmanEdgeItem 一样在构造时连接两个节点的信号，dispose 时断开。"""
+
+    def __init__(self, parent, child):
+        self.parent = parent
+        self.child = child
+        parent.positionChanged.connect(self.update_geometry)
+        child.positionChanged.connect(self.update_geometry)
+
+    def update_geometry(self):
+        pass
+
+    def dispose(self):
+        self.parent.positionChanged.disconnect(self.update_geometry)
+        self.child.positionChanged.disconnect(self.update_geometry)
+
+
+class FakeScene:
+    def __init__(self):
+        self.items = set()
+
+    def add(self, item):
+        self.items.add(id(item))
+        return item
+
+    def remove(self, item):
+        self.items.discard(id(item))
+
+    def clear(self):
+        self.items.clear()
+
+
+def _build(registry, scene, root, size=4):
+    nodes = [scene.add(FakeNode()) for _ in range(size)]
+    edges = [registry.track(scene.add(FakeEdge(root, node))) for node in nodes]
+    return nodes, edges
+
+
+def test_release_disconnects_and_removes():
+    scene = FakeScene()
+    registry = ItemRegistry(scene.remove)
+    root = FakeNode()
+    _nodes, edges = _build(registry, scene, root)
+
+    registry.release(edges[0])
+    assert len(root.positionChanged.slots) == 3
+    assert id(edges[0]) not in scene.items
+    assert len(registry.owned) == 3
+
+    # 未登记或已释放的图元只移出场景
+    registry.release(edges[0])
+    assert len(root.positionChanged.slots) == 3
+
+
+def test_deferred_batch_released_once():
+    scene = FakeScene()
+    registry = ItemRegistry(scene.remove)
+    root = FakeNode()
+    _nodes, edges = _build(registry, scene, root)
+
+    finished = registry.defer(edges[:2])
+    registry.flush()
+    assert not registry.pending
+    assert len(root.positionChanged.slots) == 2
+    # 中止后动画不会再结束，即使回调被调用也不重复释放
+    finished()
+    assert len(root.positionChanged.slots) == 2
+
+
+def test_build_reset_cycles_leave_registry_empty():
+    scene = FakeScene()
+    registry = ItemRegistry(scene.remove)
+    root = FakeNode()
+
+    def cycle(index):
+        _nodes, edges = _build(registry, scene, root)
+        finished = registry.defer(edges[:1])
+        if index % 2:
+            finished()
+        elif index % 3 == 0:
+            registry.flush()
+        registry.release_all()
+        scene.clear()
+
+    for index in range(1_000):
+        cycle(index)
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for index in range(CYCLES):
+        cycle(index)
+    gc.collect()
+    grown = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    assert not registry.owned
+    assert not registry.pending
+    assert len(registry) == 0
+    assert root.positionChanged.slots == []
+    assert grown < 64 * 1024
+
+
+def test_huffman_view_reset_cycles():
+    pytest.importorskip("PyQt5")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+
+    from core.global_ctrl import GlobalController
+    from huffman.huff_view import HuffmanEdgeItem, HuffmanNodeItem, HuffmanView
+
+    app = QApplication.instance() or QApplication([])
+    view = HuffmanView(GlobalController())
+
+    def cycle():
+        parent = HuffmanNodeItem(0, "ab")
+        view.scene.addItem(parent)
+        for node_id in (1, 2):
+            child = HuffmanNodeItem(node_id, "a")
+            view.scene.addItem(child)
+            edge = HuffmanEdgeItem(parent, child)
+            view.scene.addItem(edge)
+            view.track_item(edge)
+        view.reset()
+
+    for _ in range(1_000):
+        cycle()
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for _ in range(CYCLES):
+        cycle()
+    app.processEvents()
+    gc.collect()
+    grown = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    assert len(view._items) == 0
+    assert not view.scene.items()
+    assert grown < 256 * 1024